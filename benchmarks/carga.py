@@ -0,0 +1,416 @@
+"""Banco de carga de CodeVerse.
+
+Arranca la app contra un Mongo local (mongomock o un mongod) o sin Mongo
+(la ruta de respaldo con el almacén JSON), con un tikwm simulado y un
+catálogo sintético, y mide cada ruta con varios hilos concurrentes.
+
+    pip install -r benchmarks/requirements.txt
+    python benchmarks/carga.py
+    python benchmarks/carga.py --tutoriales 13,1000,10000 --concurrencia 8
+    python benchmarks/carga.py --backend mongod --mongo-uri mongodb://localhost:27017
+    python benchmarks/carga.py --comparar benchmarks/resultados/base.json
+
+Cada escenario (backend x tamaño del catálogo) corre en un subproceso
+propio para que el catálogo, las cachés y el pico de RSS no se mezclen.
+Los resultados se guardan en benchmarks/resultados/ como JSON; con
+--comparar se enfrentan a una ejecución anterior y el proceso termina con
+código 1 si alguna ruta empeora más de --umbral por ciento.
+
+Las peticiones se hacen con el cliente de pruebas de Flask (WSGI en el
+mismo proceso), así que miden el coste de la aplicación sin red de por
+medio: sirven para comparar versiones, no como cifra absoluta.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTADOS_DIR = os.path.join(RAIZ, 'benchmarks', 'resultados')
+SEMILLA = os.path.join(RAIZ, 'contenido_tutoriales.json')
+RUTAS = (
+    'tutoriales', 'tutorial', 'contenido_get', 'contenido_post',
+    'api_tutoriales', 'buscar', 'sincronizar', 'tiktok_download'
+)
+BYTES_VIDEO_SIMULADO = 256 * 1024
+TIKTOK_ESPERA_MAX = 30
+_MARCA_RESULTADO = 'RESULTADO '
+
+# ==============================
+# 🎭 tikwm simulado
+# ==============================
+
+class _TikwmSimulado(BaseHTTPRequestHandler):
+    """Responde como tikwm (/api?url=...) y sirve videos falsos (/video/<id>.mp4)"""
+
+    def do_GET(self):
+        partes = urlsplit(self.path)
+        if partes.path == '/api':
+            url = parse_qs(partes.query).get('url', [''])[0]
+            video_id = str(zlib.crc32(url.encode()))
+            cuerpo = json.dumps({
+                'code': 0,
+                'msg': 'success',
+                'data': {'id': video_id, 'play': f"http://127.0.0.1:{self.server.server_port}/video/{video_id}.mp4"}
+            }).encode()
+            tipo = 'application/json'
+        elif partes.path.startswith('/video/'):
+            cuerpo = b'\0' * BYTES_VIDEO_SIMULADO
+            tipo = 'video/mp4'
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', tipo)
+        self.send_header('Content-Length', str(len(cuerpo)))
+        self.end_headers()
+        self.wfile.write(cuerpo)
+
+    def log_message(self, *args):
+        pass
+
+def arrancar_tikwm():
+    servidor = ThreadingHTTPServer(('127.0.0.1', 0), _TikwmSimulado)
+    threading.Thread(target=servidor.serve_forever, name='tikwm-simulado', daemon=True).start()
+    return f"http://127.0.0.1:{servidor.server_port}/api"
+
+# ==============================
+# 📚 Catálogo sintético
+# ==============================
+
+def generar_catalogo(total, contenido_max_kb):
+    """total tutoriales a partir de los reales, con ids con forma de ObjectId"""
+    with open(SEMILLA, 'r', encoding='utf-8') as f:
+        semilla = list(json.load(f).values())
+    catalogo = {}
+    for i in range(total):
+        base = semilla[i % len(semilla)]
+        catalogo[f"{i + 1:024x}"] = {
+            'title': base.get('title', '') if i < len(semilla) else f"{base.get('title', '')} #{i}",
+            'language': base.get('language', 'python'),
+            'level': base.get('level', 'principiante'),
+            'duration': base.get('duration', '1h'),
+            'description': base.get('description', ''),
+            'content': (base.get('content') or '')[:contenido_max_kb * 1024],
+            'lastUpdated': datetime(2025, 1, 1).isoformat()
+        }
+    return catalogo
+
+def _rss_actual_mb():
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2 ** 20
+    except (OSError, ValueError):
+        return None
+
+def _rss_pico_mb():
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pico / 2 ** 20 if sys.platform == 'darwin' else pico / 1024
+
+# ==============================
+# 🏃 Un escenario (en su propio proceso)
+# ==============================
+
+def _preparar_app(escenario, trabajo):
+    """Importa la app en un directorio temporal con el catálogo y el backend pedidos"""
+    catalogo = generar_catalogo(escenario['tutoriales'], escenario['contenido_max_kb'])
+    with open(os.path.join(trabajo, 'contenido_tutoriales.json'), 'w', encoding='utf-8') as f:
+        json.dump(catalogo, f, ensure_ascii=False)
+
+    os.chdir(trabajo)
+    os.environ.update({
+        'CONTENIDO_DIR': os.path.join(trabajo, 'contenido_tutoriales'),
+        'TIKWM_API_URL': arrancar_tikwm(),
+        'PRECALENTAR': '',
+        # Se mide el coste de cada ruta, no los 429 de los límites
+        'LIMITES': '0',
+        # Nunca hablar con Atlas desde el banco: el cliente propio de la app
+        # apunta a un puerto cerrado y el backend se inyecta abajo.
+        'MONGO_URI': 'mongodb://127.0.0.1:9/?directConnection=true',
+        'SYNC_AL_ARRANCAR': '0',
+    })
+    sys.path.insert(0, RAIZ)
+    import codeverse
+    from codeverse import config, mongo
+
+    if escenario['backend'] == 'json':
+        return codeverse, catalogo, None
+
+    if escenario['backend'] == 'mongomock':
+        import mongomock
+        cliente = mongomock.MongoClient(tz_aware=False)
+    else:
+        from pymongo import MongoClient
+        cliente = MongoClient(escenario['mongo_uri'], serverSelectionTimeoutMS=5000)
+    from bson.objectid import ObjectId
+    base = cliente[f"codeverse_bench_{os.getpid()}"]
+    coleccion = base[config.COLLECTION_NAME]
+    ahora = mongo.ahora_utc()
+    documentos = [
+        {'_id': ObjectId(tid), **{k: v for k, v in datos.items() if k != 'lastUpdated'},
+         'createdAt': ahora, 'updatedAt': ahora}
+        for tid, datos in catalogo.items()
+    ]
+    for inicio in range(0, len(documentos), 1000):
+        coleccion.insert_many(documentos[inicio:inicio + 1000])
+    mongo.asegurar_indices_mongodb(coleccion)
+    with mongo._mongo_lock:
+        mongo._mongo.update(client=cliente, coleccion=coleccion, breaker='cerrado', indices=True)
+    return codeverse, catalogo, (cliente, base.name)
+
+def _descarga_tiktok_completa(cliente, aleatorio):
+    """Encola una descarga, espera a que el trabajo termine y baja el video
+
+    Medir solo el POST y la redirección dejaría fuera lo que de verdad
+    cuesta (la llamada a tikwm y la descarga del MP4), así que la latencia
+    cubre el trabajo entero hasta tener los bytes.
+    """
+    video = aleatorio.randint(1, 50)
+    respuesta = cliente.post('/api/tiktok/jobs', json={
+        'url': f"https://www.tiktok.com/@banco/video/{video}"
+    })
+    if respuesta.status_code != 202:
+        return respuesta.status_code
+    estado_url = respuesta.get_json()['status_url']
+    limite = time.monotonic() + TIKTOK_ESPERA_MAX
+    while time.monotonic() < limite:
+        trabajo = cliente.get(estado_url)
+        datos = (trabajo.get_json() or {}).get('data') or {}
+        if datos.get('estado') == 'listo':
+            descarga = cliente.get(datos['descarga_url'])
+            descarga.get_data()
+            return descarga.status_code
+        if datos.get('estado') == 'error' or trabajo.status_code >= 400:
+            return 502 if trabajo.status_code < 400 else trabajo.status_code
+        time.sleep(0.005)
+    return 504
+
+def _peticion(cliente, ruta, aleatorio, ids):
+    """Hace una petición de la ruta dada y devuelve su código de estado"""
+    tid = aleatorio.choice(ids)
+    if ruta == 'tutoriales':
+        return cliente.get('/tutoriales', query_string={'page': aleatorio.randint(1, 3)}).status_code
+    if ruta == 'tutorial':
+        return cliente.get(f'/tutorial/{tid}').status_code
+    if ruta == 'contenido_get':
+        return cliente.get(f'/api/tutorial/{tid}/contenido').status_code
+    if ruta == 'contenido_post':
+        return cliente.post(f'/api/tutorial/{tid}/contenido', json={
+            'content': f"<h2>Sección</h2><p>Guardado de prueba {aleatorio.random()}</p>"
+        }).status_code
+    if ruta == 'api_tutoriales':
+        lenguaje = aleatorio.choice(['', 'python', 'javascript', 'css', 'html'])
+        return cliente.get('/api/tutoriales', query_string={'language': lenguaje, 'limit': 50}).status_code
+    if ruta == 'buscar':
+        consulta = aleatorio.choice(['variables', 'funciones', 'flexbox', 'condicionales', 'bucle for'])
+        return cliente.get('/api/tutoriales/buscar', query_string={'q': consulta}).status_code
+    if ruta == 'sincronizar':
+        return cliente.post('/api/sincronizar-json').status_code
+    if ruta == 'tiktok_download':
+        return _descarga_tiktok_completa(cliente, aleatorio)
+    raise ValueError(f"Ruta desconocida: {ruta}")
+
+def _percentil(ordenados, p):
+    if not ordenados:
+        return None
+    return ordenados[min(len(ordenados) - 1, int(round(p / 100 * (len(ordenados) - 1))))]
+
+def medir_ruta(app, ruta, ids, peticiones, concurrencia, semilla):
+    """Lanza peticiones de una ruta con concurrencia hilos y resume las latencias"""
+    latencias, codigos = [], {}
+    lock = threading.Lock()
+    siguiente = iter(range(peticiones))
+
+    def trabajador(n):
+        cliente = app.app.test_client()
+        aleatorio = random.Random(semilla * 1000 + n)
+        propias, estados = [], []
+        while True:
+            with lock:
+                if next(siguiente, None) is None:
+                    break
+            inicio = time.perf_counter()
+            estados.append(_peticion(cliente, ruta, aleatorio, ids))
+            propias.append(time.perf_counter() - inicio)
+        with lock:
+            latencias.extend(propias)
+            for estado in estados:
+                codigos[str(estado)] = codigos.get(str(estado), 0) + 1
+
+    # Calentamiento: plantillas compiladas, índices construidos...
+    cliente = app.app.test_client()
+    aleatorio = random.Random(semilla)
+    for _ in range(min(5, peticiones)):
+        _peticion(cliente, ruta, aleatorio, ids)
+
+    inicio = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrencia) as pool:
+        list(pool.map(trabajador, range(concurrencia)))
+    duracion = time.perf_counter() - inicio
+
+    latencias.sort()
+    errores = sum(n for codigo, n in codigos.items() if codigo.startswith('5'))
+    return {
+        'peticiones': len(latencias),
+        'errores': errores,
+        'codigos': codigos,
+        'rps': round(len(latencias) / duracion, 1) if duracion else None,
+        'p50_ms': round(_percentil(latencias, 50) * 1000, 3),
+        'p99_ms': round(_percentil(latencias, 99) * 1000, 3),
+        'media_ms': round(sum(latencias) / len(latencias) * 1000, 3),
+    }
+
+def ejecutar_escenario(escenario):
+    trabajo = tempfile.mkdtemp(prefix='codeverse-bench-')
+    try:
+        inicio = time.perf_counter()
+        app, catalogo, mongo = _preparar_app(escenario, trabajo)
+        ids = list(catalogo)
+        resultado = {
+            **{k: escenario[k] for k in ('backend', 'tutoriales', 'concurrencia', 'peticiones')},
+            'preparacion_s': round(time.perf_counter() - inicio, 2),
+            'rss_tras_arranque_mb': _rss_actual_mb(),
+            'rutas': {},
+        }
+        for ruta in escenario['rutas']:
+            resultado['rutas'][ruta] = medir_ruta(
+                app, ruta, ids, escenario['peticiones'], escenario['concurrencia'], escenario['semilla']
+            )
+            print(f"  {escenario['backend']:>9} {escenario['tutoriales']:>6} {ruta:<16} "
+                  f"{resultado['rutas'][ruta]['rps']:>8} req/s  p50 {resultado['rutas'][ruta]['p50_ms']:>8} ms  "
+                  f"p99 {resultado['rutas'][ruta]['p99_ms']:>8} ms", file=sys.stderr)
+        app.escrituras.vaciar_escrituras()
+        resultado['rss_pico_mb'] = round(_rss_pico_mb(), 1)
+        if mongo is not None and escenario['backend'] == 'mongod':
+            mongo[0].drop_database(mongo[1])
+        return resultado
+    finally:
+        shutil.rmtree(trabajo, ignore_errors=True)
+
+# ==============================
+# 📊 Ejecución completa y comparación
+# ==============================
+
+def _commit_actual():
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=RAIZ, stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def ejecutar(args):
+    escenarios = []
+    for backend in args.backend.split(','):
+        for tutoriales in (int(n) for n in args.tutoriales.split(',')):
+            escenario = {
+                'backend': backend,
+                'tutoriales': tutoriales,
+                'concurrencia': args.concurrencia,
+                'peticiones': args.peticiones,
+                'rutas': args.rutas.split(','),
+                'contenido_max_kb': args.contenido_max_kb,
+                'mongo_uri': args.mongo_uri,
+                'semilla': args.semilla,
+            }
+            print(f"▶️ {backend} con {tutoriales} tutoriales...", file=sys.stderr)
+            proceso = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), '--escenario', json.dumps(escenario)],
+                stdout=subprocess.PIPE, text=True
+            )
+            if proceso.returncode != 0:
+                raise SystemExit(f"El escenario {backend}/{tutoriales} falló (código {proceso.returncode})")
+            linea = next(l for l in reversed(proceso.stdout.splitlines()) if l.startswith(_MARCA_RESULTADO))
+            escenarios.append(json.loads(linea[len(_MARCA_RESULTADO):]))
+
+    informe = {
+        'fecha': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'commit': _commit_actual(),
+        'python': platform.python_version(),
+        'plataforma': platform.platform(),
+        'cpus': os.cpu_count(),
+        'escenarios': escenarios,
+    }
+    salida = args.salida or os.path.join(
+        RESULTADOS_DIR, f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{informe['commit'] or 'sin-commit'}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(salida)), exist_ok=True)
+    with open(salida, 'w', encoding='utf-8') as f:
+        json.dump(informe, f, indent=2, ensure_ascii=False)
+    print(f"✅ Resultados guardados en {salida}", file=sys.stderr)
+    return informe
+
+def _por_clave(informe):
+    return {
+        (e['backend'], e['tutoriales'], e['concurrencia'], ruta): datos
+        for e in informe['escenarios'] for ruta, datos in e['rutas'].items()
+    }
+
+def comparar(base, actual, umbral):
+    """Imprime la variación por ruta y devuelve cuántas empeoraron más del umbral"""
+    anteriores, nuevas = _por_clave(base), _por_clave(actual)
+    regresiones = 0
+    print(f"{'escenario':<40} {'rps':>18} {'p50 ms':>20} {'p99 ms':>20}")
+    for clave in sorted(set(anteriores) & set(nuevas)):
+        a, n = anteriores[clave], nuevas[clave]
+        cambios = {
+            'rps': (n['rps'] - a['rps']) / a['rps'] * 100 if a['rps'] else 0,
+            'p50_ms': (n['p50_ms'] - a['p50_ms']) / a['p50_ms'] * 100 if a['p50_ms'] else 0,
+            'p99_ms': (n['p99_ms'] - a['p99_ms']) / a['p99_ms'] * 100 if a['p99_ms'] else 0,
+        }
+        peor = cambios['rps'] < -umbral or cambios['p50_ms'] > umbral or cambios['p99_ms'] > umbral
+        regresiones += peor
+        print(f"{'/'.join(map(str, clave)):<40} "
+              f"{a['rps']:>8}→{n['rps']:<8}{cambios['rps']:+.0f}% "
+              f"{a['p50_ms']:>8}→{n['p50_ms']:<8}{cambios['p50_ms']:+.0f}% "
+              f"{a['p99_ms']:>8}→{n['p99_ms']:<8}{cambios['p99_ms']:+.0f}%"
+              f"{'  ⚠️ regresión' if peor else ''}")
+    return regresiones
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--backend', default='mongomock,json',
+                        help="mongomock, mongod y/o json (ruta de respaldo), separados por comas")
+    parser.add_argument('--mongo-uri', default='mongodb://127.0.0.1:27017',
+                        help="mongod local para --backend mongod (se usa una base temporal)")
+    parser.add_argument('--tutoriales', default='13,1000', help="Tamaños del catálogo, p. ej. 13,1000,10000")
+    parser.add_argument('--concurrencia', type=int, default=8)
+    parser.add_argument('--peticiones', type=int, default=200, help="Peticiones por ruta y escenario")
+    parser.add_argument('--rutas', default=','.join(RUTAS))
+    parser.add_argument('--contenido-max-kb', type=int, default=16,
+                        help="Recorta el contenido de cada tutorial sintético a este tamaño")
+    parser.add_argument('--semilla', type=int, default=1)
+    parser.add_argument('--salida', help="Archivo JSON de resultados (por defecto en benchmarks/resultados/)")
+    parser.add_argument('--comparar', help="Resultados anteriores contra los que comparar")
+    parser.add_argument('--umbral', type=float, default=20.0, help="Porcentaje de empeoramiento tolerado")
+    parser.add_argument('--escenario', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.escenario:
+        # Subproceso: el resultado va a stdout tras una marca (la app también imprime)
+        print(_MARCA_RESULTADO + json.dumps(ejecutar_escenario(json.loads(args.escenario))))
+        sys.stdout.flush()
+        os._exit(0)  # Sin esperar a los hilos de fondo de la app
+
+    informe = ejecutar(args)
+    if args.comparar:
+        with open(args.comparar, 'r', encoding='utf-8') as f:
+            base = json.load(f)
+        if comparar(base, informe, args.umbral):
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,32 @@
+"""CodeVerse: tutoriales de programación y herramientas web sobre Flask.
+
+app.py (en la raíz) solo importa `app` de aquí: gunicorn app:app y
+flask --app app siguen funcionando igual. Los módulos se importan en este
+orden porque registran hooks de Flask (before_request, observadores del
+almacén...) y el orden de registro es el de ejecución.
+"""
+
+import os
+import time
+
+from dotenv import load_dotenv
+from flask import Flask
+from flask_cors import CORS
+
+_INICIO_PROCESO = time.monotonic()
+
+# Cargar variables de entorno (.env)
+load_dotenv()
+
+# templates/ y static/ siguen en la raíz del repositorio
+app = Flask(__name__, root_path=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+CORS(app)
+app.secret_key = os.getenv('FLASK_SECRET_KEY', 'advpjsh')
+
+from . import (  # noqa: E402
+    config, metricas, mongo, almacen, resaltado, revisiones, sincronizacion, respuestas,
+    estaticos, busqueda, listado, lotes, escrituras, instantaneas, limites, rutas, tiktok,
+    arranque
+)
+
+arranque.arrancar()
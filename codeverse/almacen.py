@@ -0,0 +1,604 @@
+"""Almacén de contenidos: un JSON por tutorial, índice de metadatos y caché"""
+
+from html.parser import HTMLParser
+import hashlib
+import html
+import json
+import math
+import mmap
+import os
+import re
+import struct
+import tempfile
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from contextlib import contextmanager
+
+try:
+    import fcntl  # Bloqueo entre procesos (Linux/macOS)
+except ImportError:
+    fcntl = None
+
+from .config import CONTENIDO_DIR, CONTENIDO_FILE
+from .metricas import medir, observar
+
+# ==============================
+# 🗄️ Almacén de contenidos (un archivo por tutorial)
+# ==============================
+# Cada tutorial vive en CONTENIDO_DIR/<id>.json. Las escrituras son atómicas
+# (archivo temporal + rename) y se serializan entre workers con flock, así
+# que guardar un tutorial solo reescribe ese tutorial.
+#
+# Junto a ellos, CONTENIDO_DIR/.indice.json guarda los metadatos de todos
+# los tutoriales (título, lenguaje, nivel, duración...) y campos derivados
+# (palabras, minutos de lectura, tabla de contenidos). Los listados solo
+# necesitan ese índice; el cuerpo de cada tutorial se lee cuando se pide.
+_ID_VALIDO = re.compile(r'^[A-Za-z0-9_-]{1,64}$')
+_LOCK_FILE = os.path.join(CONTENIDO_DIR, '.lock')
+_INDICE_FILE = os.path.join(CONTENIDO_DIR, '.indice.json')
+CAMPOS_METADATOS = ('title', 'language', 'level', 'duration', 'description', 'lastUpdated')
+CAMPOS_DERIVADOS = ('palabras', 'minutos_lectura', 'toc', 'secciones', 'huella')
+CAMPOS_INTERNOS = ('firma', 'huella')  # Solo para el servidor, no salen en la API
+PALABRAS_POR_MINUTO = 200
+_almacen_lock = threading.RLock()
+
+def _ruta_tutorial(tutorial_id):
+    """Ruta del archivo de un tutorial (valida el id para evitar rutas arbitrarias)"""
+    if not _ID_VALIDO.match(str(tutorial_id)):
+        raise ValueError(f"ID de tutorial no válido: {tutorial_id}")
+    return os.path.join(CONTENIDO_DIR, f"{tutorial_id}.json")
+
+@contextmanager
+def _bloqueo_archivo(ruta, lock_hilos):
+    """Bloqueo exclusivo entre hilos (lock_hilos) y entre procesos (flock sobre ruta)"""
+    with lock_hilos:
+        with open(ruta, 'a') as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+def _bloqueo_almacen():
+    """Bloqueo exclusivo del almacén entre hilos y entre procesos"""
+    return _bloqueo_archivo(_LOCK_FILE, _almacen_lock)
+
+def _escribir_atomico(ruta, datos, compacto=False):
+    """Escribe JSON en un temporal del mismo directorio y lo renombra encima"""
+    directorio = os.path.dirname(ruta) or '.'
+    fd, tmp = tempfile.mkstemp(prefix='.', suffix='.tmp', dir=directorio)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            if compacto:
+                json.dump(datos, f, ensure_ascii=False, separators=(',', ':'))
+            else:
+                json.dump(datos, f, indent=2, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, ruta)
+    except Exception:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+def _firma_archivo(ruta):
+    """Devuelve [mtime_ns, tamaño] del archivo o None si no existe"""
+    try:
+        st = os.stat(ruta)
+        return [st.st_mtime_ns, st.st_size]
+    except OSError:
+        return None
+
+# Letra latina acentuada -> letra base (un carácter por carácter)
+_TABLA_PLIEGUE = {
+    cp: unicodedata.normalize('NFKD', chr(cp))[:1].lower()
+    for cp in range(0xC0, 0x250)
+    if unicodedata.normalize('NFKD', chr(cp))[:1].lower() not in ('', chr(cp))
+}
+
+def _plegar(texto):
+    """Minúsculas sin acentos conservando la longitud (para ubicar fragmentos)"""
+    return texto.translate(_TABLA_PLIEGUE).lower()
+
+def _texto_plano(html_texto):
+    """Quita etiquetas, scripts y entidades de un HTML"""
+    sin_bloques = re.sub(r'(?is)<(script|style)\b.*?</\1>', ' ', html_texto or '')
+    return re.sub(r'\s+', ' ', html.unescape(re.sub(r'<[^>]+>', ' ', sin_bloques))).strip()
+
+_ETIQUETAS_VACIAS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'track', 'wbr'}
+
+class _EncabezadosRaiz(HTMLParser):
+    """Encuentra los h2/h3 de primer nivel: los de dentro de ejemplos y vistas previas no cuentan"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.abiertas = []
+        self.encabezados = []  # [nivel, (línea, columna), título]
+        self.actual = None
+
+    def handle_starttag(self, etiqueta, atributos):
+        if etiqueta in ('h2', 'h3') and self.actual is None and all(e == 'p' for e in self.abiertas):
+            self.actual = [int(etiqueta[1]), self.getpos(), []]
+        if etiqueta not in _ETIQUETAS_VACIAS:
+            self.abiertas.append(etiqueta)
+
+    def handle_endtag(self, etiqueta):
+        if etiqueta not in self.abiertas:
+            return
+        while self.abiertas.pop() != etiqueta:
+            pass
+        if self.actual is not None and etiqueta == f"h{self.actual[0]}":
+            self.encabezados.append(self.actual)
+            self.actual = None
+
+    def handle_data(self, texto):
+        if self.actual is not None:
+            self.actual[2].append(texto)
+
+def _estructura(html_texto):
+    """Tabla de contenidos y secciones (cortadas en cada h2 de primer nivel) del contenido.
+
+    Cada sección es {'titulo', 'inicio', 'fin'} con posiciones de carácter
+    en el HTML, para servirla después sin volver a analizarlo. Lo que haya
+    antes del primer h2 va con la primera sección.
+    """
+    html_texto = html_texto or ''
+    analizador = _EncabezadosRaiz()
+    try:
+        analizador.feed(html_texto)
+        analizador.close()
+    except Exception as e:
+        print(f"⚠️ No se pudo analizar la estructura del contenido: {e}")
+    lineas = [0] + [m.end() for m in re.finditer('\n', html_texto)]
+    toc, secciones = [], []
+    for nivel, (linea, columna), partes in analizador.encabezados:
+        titulo = re.sub(r'\s+', ' ', ''.join(partes)).strip()
+        if nivel == 2:
+            inicio = lineas[linea - 1] + columna
+            if secciones:
+                secciones[-1]['fin'] = inicio
+            secciones.append({'titulo': titulo, 'inicio': inicio if secciones else 0, 'fin': len(html_texto)})
+        toc.append({'nivel': nivel, 'titulo': titulo, 'seccion': max(len(secciones) - 1, 0)})
+    if not secciones:
+        secciones.append({'titulo': None, 'inicio': 0, 'fin': len(html_texto)})
+    return toc, secciones
+
+def _derivar_metadatos(datos, firma):
+    """Entrada del índice para un tutorial: metadatos + campos precalculados"""
+    palabras = len(_texto_plano(datos.get('content')).split())
+    toc, secciones = _estructura(datos.get('content'))
+    return {
+        **{campo: datos.get(campo) for campo in CAMPOS_METADATOS},
+        'palabras': palabras,
+        'minutos_lectura': max(1, math.ceil(palabras / PALABRAS_POR_MINUTO)),
+        'toc': toc,
+        'secciones': secciones,
+        # Hash del registro completo: la versión (ETag) cambia con el contenido
+        # aunque Mongo no haya movido updatedAt
+        'huella': hashlib.sha1(json.dumps(datos, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()[:20],
+        'firma': firma,
+    }
+
+def _leer_indice_disco():
+    try:
+        with open(_INDICE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _verificar_indice():
+    """Compara el índice con los archivos del almacén y rehace las entradas que no cuadren"""
+    indice = _leer_indice_disco()
+    actualizado = {}
+    cambios = 0
+    for nombre in os.listdir(CONTENIDO_DIR):
+        if not nombre.endswith('.json') or nombre.startswith('.'):
+            continue
+        tutorial_id = nombre[:-5]
+        ruta = os.path.join(CONTENIDO_DIR, nombre)
+        firma = _firma_archivo(ruta)
+        entrada = indice.get(tutorial_id)
+        if entrada is not None and entrada.get('firma') == firma and all(c in entrada for c in CAMPOS_DERIVADOS):
+            actualizado[tutorial_id] = entrada
+            continue
+        try:
+            with open(ruta, 'r', encoding='utf-8') as f:
+                actualizado[tutorial_id] = _derivar_metadatos(json.load(f), firma)
+            cambios += 1
+        except Exception as e:
+            print(f"Error indexando {tutorial_id}: {e}")
+    if cambios or len(actualizado) != len(indice) or not os.path.exists(_INDICE_FILE):
+        _escribir_atomico(_INDICE_FILE, actualizado, compacto=True)
+        _publicar_cambios(None)
+        print(f"✅ Índice de metadatos actualizado ({cambios} tutoriales reindexados)")
+
+def inicializar_almacen(verificar=True):
+    """Crea el almacén (desde el JSON semilla si está vacío) y verifica su índice.
+
+    Con verificar=False solo se reconstruye el índice si falta, para que el
+    arranque no tenga que hacer stat de cada tutorial.
+    """
+    os.makedirs(CONTENIDO_DIR, exist_ok=True)
+    with _bloqueo_almacen():
+        _abrir_canal()
+        vacio = not any(n.endswith('.json') and not n.startswith('.') for n in os.listdir(CONTENIDO_DIR))
+        if vacio and os.path.exists(CONTENIDO_FILE):
+            try:
+                with open(CONTENIDO_FILE, 'r', encoding='utf-8') as f:
+                    semilla = json.load(f)
+                for tutorial_id, datos in semilla.items():
+                    _escribir_atomico(_ruta_tutorial(tutorial_id), datos)
+                print(f"✅ Almacén de contenidos creado desde {CONTENIDO_FILE} ({len(semilla)} tutoriales)")
+            except Exception as e:
+                print(f"Error migrando JSON al almacén: {e}")
+        if verificar or not os.path.exists(_INDICE_FILE):
+            _verificar_indice()
+
+# ==============================
+# 📣 Canal de cambios entre workers
+# ==============================
+# CONTENIDO_DIR/.versiones está mapeado en memoria por todos los workers del
+# host: un contador global de secuencia y un anillo con los últimos ids
+# cambiados. Quien escribe (siempre con el bloqueo del almacén) apunta cada
+# id y sube el contador; los demás comparan el contador en cada acceso
+# (una lectura de memoria, sin syscalls) y releen solo esos tutoriales. Si
+# se quedaron atrás más de CANAL_CAPACIDAD cambios, recargan el índice entero.
+CANAL_CAPACIDAD = 4096
+_CANAL_FILE = os.path.join(CONTENIDO_DIR, '.versiones')
+_CANAL_CABECERA = struct.Struct('<Q')        # Última secuencia publicada
+_CANAL_ENTRADA = struct.Struct('<Q64s')      # (secuencia, tutorial_id)
+_CANAL_TAMANO = _CANAL_CABECERA.size + CANAL_CAPACIDAD * _CANAL_ENTRADA.size
+_CANAL_TODO = b''                            # id vacío: recargar el índice entero
+
+_canal = {'mmap': None}
+
+def _abrir_canal():
+    """Mapea el archivo del canal (llamar con _bloqueo_almacen() tomado)"""
+    if _canal['mmap'] is not None:
+        return
+    try:
+        fd = os.open(_CANAL_FILE, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if os.fstat(fd).st_size < _CANAL_TAMANO:
+                os.ftruncate(fd, _CANAL_TAMANO)
+            _canal['mmap'] = mmap.mmap(fd, _CANAL_TAMANO)
+        finally:
+            os.close(fd)
+    except (OSError, ValueError) as e:
+        # Sin canal cada acceso vuelve a hacer stat del índice
+        print(f"⚠️ Canal de cambios no disponible: {e}")
+
+def secuencia_publicada():
+    """Última secuencia publicada por cualquier worker, o None sin canal"""
+    if _canal['mmap'] is None:
+        return None
+    return _CANAL_CABECERA.unpack_from(_canal['mmap'], 0)[0]
+
+def _publicar_cambios(tutorial_ids):
+    """Anuncia ids cambiados; None anuncia una recarga completa (con el bloqueo del almacén)"""
+    memoria = _canal['mmap']
+    if memoria is None:
+        return None
+    secuencia = _CANAL_CABECERA.unpack_from(memoria, 0)[0]
+    for tutorial_id in ([None] if tutorial_ids is None else tutorial_ids):
+        secuencia += 1
+        clave = _CANAL_TODO if tutorial_id is None else tutorial_id.encode('ascii')
+        _CANAL_ENTRADA.pack_into(
+            memoria, _CANAL_CABECERA.size + (secuencia % CANAL_CAPACIDAD) * _CANAL_ENTRADA.size,
+            secuencia, clave
+        )
+    # La cabecera va al final: quien la lea ya encuentra las entradas escritas
+    _CANAL_CABECERA.pack_into(memoria, 0, secuencia)
+    return secuencia
+
+def _cambios_publicados(desde, hasta):
+    """Ids cambiados en (desde, hasta], o None si hace falta recargar todo"""
+    if desde is None or hasta - desde > CANAL_CAPACIDAD:
+        return None
+    memoria = _canal['mmap']
+    ids = set()
+    for secuencia in range(desde + 1, hasta + 1):
+        leida, clave = _CANAL_ENTRADA.unpack_from(
+            memoria, _CANAL_CABECERA.size + (secuencia % CANAL_CAPACIDAD) * _CANAL_ENTRADA.size
+        )
+        clave = clave.rstrip(b'\0')
+        if leida != secuencia or clave == _CANAL_TODO:
+            return None  # Entrada ya pisada por otra más nueva, o recarga completa
+        ids.add(clave.decode('ascii'))
+    return ids
+
+# ==============================
+# 🗃️ Caché de contenidos en memoria
+# ==============================
+# Cada worker guarda el índice de metadatos completo y un LRU acotado de
+# cuerpos. En cada acceso se mira el contador del canal de cambios: si otro
+# worker publicó, se releen solo los tutoriales anunciados (o el índice
+# entero si el anillo ya los pisó). Sin canal, se hace stat de .indice.json
+# y, si cambió, se relee el índice y se descartan los cuerpos cuya firma ya
+# no coincide.
+CONTENIDO_CACHE_MAX_BYTES = int(os.getenv('CONTENIDO_CACHE_MAX_BYTES', 64 * 1024 * 1024))
+
+_cache_lock = threading.Lock()
+_cache_contenidos = {
+    'indice': {},               # tutorial_id -> metadatos (con 'firma' del archivo)
+    'firma_indice': None,
+    'secuencia': None,          # Última secuencia del canal ya aplicada
+    'cuerpos': OrderedDict(),   # tutorial_id -> (firma, datos completos)
+    'bytes_cuerpos': 0,
+    'cambiados': set(),         # ids releídos o escritos pendientes de notificar
+    'recargas_indice': 0,
+    'entradas_releidas': 0,
+    'hits': 0,
+    'misses': 0,
+}
+_observadores_contenido = []
+_preparadores_guardado = []
+
+def al_cambiar_contenido(funcion):
+    """Registra funcion(tutorial_id), llamada por cada tutorial creado, editado o borrado"""
+    _observadores_contenido.append(funcion)
+    return funcion
+
+def antes_de_guardar(funcion):
+    """Registra funcion(tutorial_id, previo, datos), llamada antes de escribir cada tutorial.
+
+    previo es lo que hay en el almacén (o None) y datos lo que se va a
+    escribir (None si se borra). Corre con _bloqueo_almacen() tomado y fuera
+    de _cache_lock; si falla, el guardado sigue adelante.
+    """
+    _preparadores_guardado.append(funcion)
+    return funcion
+
+def _preparar_guardado(tutorial_id, previo, datos):
+    for funcion in _preparadores_guardado:
+        try:
+            funcion(tutorial_id, previo, datos)
+        except Exception as e:
+            print(f"⚠️ Error preparando el guardado de {tutorial_id}: {e}")
+
+def _notificar_cambios(tutorial_ids):
+    """Avisa a los observadores (fuera de _cache_lock para que puedan leer la caché)"""
+    for tutorial_id in tutorial_ids:
+        for funcion in _observadores_contenido:
+            try:
+                funcion(tutorial_id)
+            except Exception as e:
+                print(f"⚠️ Error notificando cambio de {tutorial_id}: {e}")
+
+def _descartar_cuerpo(tutorial_id):
+    entrada = _cache_contenidos['cuerpos'].pop(tutorial_id, None)
+    if entrada is not None:
+        _cache_contenidos['bytes_cuerpos'] -= len(entrada[1].get('content') or '')
+
+def _cachear_cuerpo(tutorial_id, firma, datos):
+    _descartar_cuerpo(tutorial_id)
+    _cache_contenidos['cuerpos'][tutorial_id] = (firma, datos)
+    _cache_contenidos['bytes_cuerpos'] += len(datos.get('content') or '')
+    while _cache_contenidos['bytes_cuerpos'] > CONTENIDO_CACHE_MAX_BYTES and len(_cache_contenidos['cuerpos']) > 1:
+        _descartar_cuerpo(next(iter(_cache_contenidos['cuerpos'])))
+
+def _recargar_entrada(tutorial_id):
+    """Relee un tutorial anunciado por otro worker (llamar con _cache_lock tomado)"""
+    _cache_contenidos['entradas_releidas'] += 1
+    _cache_contenidos['cambiados'].add(tutorial_id)
+    habia_cuerpo = tutorial_id in _cache_contenidos['cuerpos']
+    _descartar_cuerpo(tutorial_id)
+    try:
+        with medir('codeverse_almacen_segundos', operacion='cargar'), \
+                open(_ruta_tutorial(tutorial_id), 'r', encoding='utf-8') as f:
+            st = os.fstat(f.fileno())
+            datos = json.load(f)
+    except FileNotFoundError:
+        _cache_contenidos['indice'].pop(tutorial_id, None)
+        return
+    except (OSError, ValueError) as e:
+        print(f"Error releyendo JSON de {tutorial_id}: {e}")
+        return
+    firma = [st.st_mtime_ns, st.st_size]
+    _cache_contenidos['indice'][tutorial_id] = _derivar_metadatos(datos, firma)
+    if habia_cuerpo:
+        _cachear_cuerpo(tutorial_id, firma, datos)
+
+def _refrescar_cache():
+    """Aplica los cambios publicados por otros workers (llamar con _cache_lock tomado)"""
+    secuencia = secuencia_publicada()
+    if secuencia is not None:
+        local = _cache_contenidos['secuencia']
+        if secuencia == local:
+            return
+        ids = _cambios_publicados(local, secuencia)
+        if ids is not None:
+            for tutorial_id in ids:
+                _recargar_entrada(tutorial_id)
+            _cache_contenidos['secuencia'] = secuencia
+            return
+        # La secuencia se lee antes que el índice: lo que se publique mientras
+        # tanto se volverá a aplicar en el próximo acceso, nunca se pierde.
+        firma_indice = None
+    else:
+        firma_indice = _firma_archivo(_INDICE_FILE)
+        if firma_indice == _cache_contenidos['firma_indice']:
+            return
+    _cache_contenidos['recargas_indice'] += 1
+    anterior = _cache_contenidos['indice']
+    with medir('codeverse_almacen_segundos', operacion='cargar_indice'):
+        nuevo = _leer_indice_disco()
+    for tutorial_id in set(anterior) | set(nuevo):
+        if (anterior.get(tutorial_id) or {}).get('firma') != (nuevo.get(tutorial_id) or {}).get('firma'):
+            _descartar_cuerpo(tutorial_id)
+            _cache_contenidos['cambiados'].add(tutorial_id)
+    _cache_contenidos['indice'] = nuevo
+    _cache_contenidos['firma_indice'] = firma_indice
+    _cache_contenidos['secuencia'] = secuencia
+
+def _cuerpo(tutorial_id):
+    """Tutorial completo desde el LRU o desde su archivo (llamar con _cache_lock tomado)"""
+    metadatos = _cache_contenidos['indice'].get(tutorial_id)
+    if metadatos is None:
+        return None
+    entrada = _cache_contenidos['cuerpos'].get(tutorial_id)
+    if entrada is not None and entrada[0] == metadatos.get('firma'):
+        _cache_contenidos['cuerpos'].move_to_end(tutorial_id)
+        _cache_contenidos['hits'] += 1
+        return entrada[1]
+    _cache_contenidos['misses'] += 1
+    try:
+        with medir('codeverse_almacen_segundos', operacion='cargar'), \
+                open(_ruta_tutorial(tutorial_id), 'r', encoding='utf-8') as f:
+            st = os.fstat(f.fileno())
+            datos = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Error cargando JSON de {tutorial_id}: {e}")
+        return None
+    _cachear_cuerpo(tutorial_id, [st.st_mtime_ns, st.st_size], datos)
+    return datos
+
+def _leer_cache(funcion):
+    """Aplica funcion(indice) sobre la caché al día y notifica lo que cambió"""
+    with _cache_lock:
+        _refrescar_cache()
+        resultado = funcion(_cache_contenidos['indice'])
+        cambiados = _cache_contenidos['cambiados']
+        _cache_contenidos['cambiados'] = set()
+    _notificar_cambios(cambiados)
+    return resultado
+
+def _publico(metadatos):
+    return {k: v for k, v in metadatos.items() if k not in CAMPOS_INTERNOS}
+
+def cargar_indice():
+    """Metadatos de todos los tutoriales, sin cuerpos (para listados)"""
+    return _leer_cache(lambda indice: {tid: _publico(m) for tid, m in indice.items()})
+
+def huellas_tutoriales():
+    """Hash del contenido de cada tutorial (para saber qué cambió de verdad)"""
+    return _leer_cache(lambda indice: {tid: m.get('huella') or '' for tid, m in indice.items()})
+
+def metadatos_de(tutorial_ids):
+    """Metadatos de unos tutoriales concretos (p. ej. una página del listado)"""
+    return _leer_cache(lambda indice: {tid: _publico(indice[tid]) for tid in tutorial_ids if tid in indice})
+
+def obtener_metadatos(tutorial_id):
+    """Metadatos y campos derivados de un tutorial, o None"""
+    metadatos = _leer_cache(lambda indice: indice.get(tutorial_id))
+    return _publico(metadatos) if metadatos is not None else None
+
+def cargar_contenidos():
+    """Carga todos los contenidos del almacén, con cuerpos (servido desde la caché)"""
+    # Copias de cada entrada, como obtener_contenido(): los llamadores pueden
+    # cambiarlas sin alterar la caché compartida hasta guardar_contenidos().
+    def todos(indice):
+        contenidos = {}
+        for tutorial_id in list(indice):
+            datos = _cuerpo(tutorial_id)
+            if datos is not None:
+                contenidos[tutorial_id] = dict(datos)
+        return contenidos
+    return _leer_cache(todos)
+
+def obtener_contenido(tutorial_id):
+    """Devuelve el contenido de un tutorial desde la caché o None"""
+    contenido = _leer_cache(lambda indice: _cuerpo(tutorial_id))
+    return dict(contenido) if contenido is not None else None
+
+def invalidar_cache_contenidos():
+    """Fuerza a releer índice y cuerpos en el próximo acceso"""
+    with _cache_lock:
+        _cache_contenidos['indice'] = {}
+        _cache_contenidos['firma_indice'] = None
+        _cache_contenidos['secuencia'] = None
+        _cache_contenidos['cuerpos'].clear()
+        _cache_contenidos['bytes_cuerpos'] = 0
+
+def estadisticas_cache():
+    """Contadores de aciertos/fallos de la caché de contenidos"""
+    with _cache_lock:
+        total = _cache_contenidos['hits'] + _cache_contenidos['misses']
+        return {
+            'hits': _cache_contenidos['hits'],
+            'misses': _cache_contenidos['misses'],
+            'hit_ratio': round(_cache_contenidos['hits'] / total, 4) if total else 0.0,
+            'entradas': len(_cache_contenidos['indice']),
+            'cuerpos': len(_cache_contenidos['cuerpos']),
+            'bytes_cuerpos': _cache_contenidos['bytes_cuerpos'],
+            'recargas_indice': _cache_contenidos['recargas_indice'],
+            'entradas_releidas': _cache_contenidos['entradas_releidas'],
+            'secuencia': _cache_contenidos['secuencia']
+        }
+
+def _aplicar_cambios(cambios, eliminados=()):
+    """Escribe/borra tutoriales en el almacén, rehace el índice y actualiza la caché.
+
+    Debe llamarse con _bloqueo_almacen() tomado.
+    """
+    inicio = time.perf_counter()
+    # Fuera de _cache_lock: resaltar y diffear no deben frenar a los lectores
+    for tutorial_id, datos in cambios.items():
+        _preparar_guardado(tutorial_id, obtener_contenido(tutorial_id), datos)
+    for tutorial_id in eliminados:
+        _preparar_guardado(tutorial_id, obtener_contenido(tutorial_id), None)
+    with _cache_lock:
+        # Ponerse al día antes de escribir para no ocultar cambios de otros workers
+        _refrescar_cache()
+        indice = dict(_cache_contenidos['indice'])
+        for tutorial_id, datos in cambios.items():
+            ruta = _ruta_tutorial(tutorial_id)
+            _escribir_atomico(ruta, datos)
+            firma = _firma_archivo(ruta)
+            indice[tutorial_id] = _derivar_metadatos(datos, firma)
+            _cachear_cuerpo(tutorial_id, firma, datos)
+        for tutorial_id in eliminados:
+            try:
+                os.unlink(_ruta_tutorial(tutorial_id))
+            except FileNotFoundError:
+                pass
+            indice.pop(tutorial_id, None)
+            _descartar_cuerpo(tutorial_id)
+        _escribir_atomico(_INDICE_FILE, indice, compacto=True)
+        _cache_contenidos['indice'] = indice
+        _cache_contenidos['firma_indice'] = _firma_archivo(_INDICE_FILE)
+        # Con el bloqueo del almacén nadie más publica: esta caché queda al día
+        _cache_contenidos['secuencia'] = _publicar_cambios(list(cambios) + list(eliminados))
+        cambiados = _cache_contenidos['cambiados'] | set(cambios) | set(eliminados)
+        _cache_contenidos['cambiados'] = set()
+    observar('codeverse_almacen_segundos', time.perf_counter() - inicio, operacion='guardar')
+    _notificar_cambios(cambiados)
+
+def guardar_tutorial_json(tutorial_id, datos):
+    """Guarda (crea o reemplaza) un único tutorial en el almacén"""
+    with _bloqueo_almacen():
+        _aplicar_cambios({tutorial_id: datos})
+
+def eliminar_tutorial_json(tutorial_id):
+    """Elimina un tutorial del almacén. Devuelve True si existía"""
+    with _bloqueo_almacen():
+        existia = os.path.exists(_ruta_tutorial(tutorial_id))
+        _aplicar_cambios({}, [tutorial_id])
+        return existia
+
+def guardar_contenidos(contenidos):
+    """Guarda los contenidos en el almacén, reescribiendo solo lo que cambió"""
+    try:
+        with _bloqueo_almacen():
+            actuales = cargar_contenidos()
+            cambios = {
+                tid: datos for tid, datos in contenidos.items()
+                if actuales.get(tid) != datos
+            }
+            eliminados = [tid for tid in actuales if tid not in contenidos]
+            _aplicar_cambios(cambios, eliminados)
+    except Exception as e:
+        print(f"Error guardando JSON: {e}")
+        invalidar_cache_contenidos()
+
+def exportar_json(ruta=CONTENIDO_FILE):
+    """Vuelca el almacén completo a un único JSON (p. ej. para versionarlo)"""
+    contenidos = cargar_contenidos()
+    _escribir_atomico(ruta, contenidos)
+    return len(contenidos)
@@ -0,0 +1,113 @@
+"""Arranque del worker y comandos de la CLI"""
+
+import atexit
+import os
+import threading
+import time
+
+from . import app, _INICIO_PROCESO
+from .config import CONTENIDO_FILE, ESTATICOS_BUILD
+from .mongo import iniciar_mongodb
+from .almacen import cargar_contenidos, exportar_json, inicializar_almacen
+from .sincronizacion import (
+    _bucle_sincronizacion, sincronizar_al_arrancar, SYNC_AL_ARRANCAR, SYNC_INTERVALO
+)
+from .respuestas import precalentar_paginas
+from .estaticos import construir_estaticos
+from .busqueda import _asegurar_indice
+from .listado import _asegurar_indice_listado
+from .escrituras import _bucle_escrituras, recuperar_diarios, _vaciar_al_salir
+from .instantaneas import exportar_al_arrancar, exportar_instantaneas, SERVIR_INSTANTANEAS
+
+# ==================== ARRANQUE ====================
+# Al importar solo se hace lo imprescindible para servir desde el almacén
+# local; Mongo conecta en segundo plano y el resto (verificar el índice de
+# metadatos, precalentar cachés) va en un hilo aparte. PRECALENTAR elige qué
+# se precalienta: contenidos, listado, busqueda y/o paginas. Con
+# LISTO_TRAS_PRECALENTAR=1 el worker no se declara listo hasta terminarlo.
+PRECALENTAR = [p.strip() for p in os.getenv('PRECALENTAR', 'busqueda,paginas').split(',') if p.strip()]
+LISTO_TRAS_PRECALENTAR = os.getenv('LISTO_TRAS_PRECALENTAR', '0') == '1'
+
+_arranque = {
+    'almacen_ms': None,       # Cuánto tardó el arranque síncrono (desde el import)
+    'sincronizado': None,     # Resumen de la sincronización de arranque (None si no se hizo)
+    'precalentado': [],
+    'precalentando': None,
+    'precalentado_ms': None,
+}
+
+def estado_arranque():
+    """Estado del arranque para las sondas de salud"""
+    terminado = _arranque['precalentado_ms'] is not None
+    return {
+        'listo': _arranque['almacen_ms'] is not None and (terminado or not LISTO_TRAS_PRECALENTAR),
+        'almacen_ms': _arranque['almacen_ms'],
+        'sincronizado': _arranque['sincronizado'],
+        'precalentar': PRECALENTAR,
+        'precalentado': list(_arranque['precalentado']),
+        'precalentando': _arranque['precalentando'],
+        'precalentado_ms': _arranque['precalentado_ms'],
+        'uptime_s': round(time.monotonic() - _INICIO_PROCESO, 1)
+    }
+
+def _tareas_arranque():
+    """Trabajo de arranque que no hace falta para empezar a servir"""
+    try:
+        inicializar_almacen()
+    except Exception as e:
+        print(f"⚠️ No se pudo verificar el índice de metadatos: {e}")
+    tareas = {
+        'contenidos': cargar_contenidos,
+        'listado': _asegurar_indice_listado,
+        'busqueda': _asegurar_indice,
+        'paginas': precalentar_paginas,
+    }
+    for nombre in PRECALENTAR:
+        if nombre not in tareas:
+            print(f"⚠️ PRECALENTAR: '{nombre}' no existe (opciones: {', '.join(tareas)})")
+            continue
+        _arranque['precalentando'] = nombre
+        try:
+            tareas[nombre]()
+            _arranque['precalentado'].append(nombre)
+        except Exception as e:
+            print(f"⚠️ Error precalentando {nombre}: {e}")
+    _arranque['precalentando'] = None
+    _arranque['precalentado_ms'] = round((time.monotonic() - _INICIO_PROCESO) * 1000)
+
+def arrancar():
+    """Arranque del worker (lo llama codeverse/__init__.py al terminar de importar)"""
+    iniciar_mongodb(esperar=SYNC_AL_ARRANCAR)
+    inicializar_almacen(verificar=False)
+    recuperar_diarios()
+    if SYNC_AL_ARRANCAR:
+        _arranque['sincronizado'] = sincronizar_al_arrancar()
+    if SYNC_INTERVALO > 0:
+        threading.Thread(target=_bucle_sincronizacion, name='sincronizacion', daemon=True).start()
+    if SERVIR_INSTANTANEAS:
+        exportar_al_arrancar()
+    threading.Thread(target=_bucle_escrituras, name='escrituras-diferidas', daemon=True).start()
+    atexit.register(_vaciar_al_salir)
+    threading.Thread(target=_tareas_arranque, name='arranque', daemon=True).start()
+    _arranque['almacen_ms'] = round((time.monotonic() - _INICIO_PROCESO) * 1000)
+
+# ==================== COMANDOS CLI ====================
+
+@app.cli.command('exportar-json')
+def exportar_json_cmd():
+    """Vuelca el almacén de tutoriales a contenido_tutoriales.json"""
+    total = exportar_json()
+    print(f"✅ {total} tutoriales exportados a {CONTENIDO_FILE}")
+
+@app.cli.command('construir-estaticos')
+def construir_estaticos_cmd():
+    """Minifica y pone huella al CSS/JS de static/src/ (y compila Tailwind si hay CLI)"""
+    manifiesto = construir_estaticos()
+    print(f"✅ {len(manifiesto)} recursos en {ESTATICOS_BUILD}")
+
+@app.cli.command('exportar-instantaneas')
+def exportar_instantaneas_cmd():
+    """Exporta /tutoriales y cada /tutorial/<id> como HTML estático (solo lo que cambió)"""
+    resumen = exportar_instantaneas()
+    print(f"✅ Instantáneas {resumen['version']}: {resumen['exportados']} tutoriales exportados, "
+          f"{resumen['eliminados']} eliminados, {resumen['paginas_listado']} páginas de listado")
@@ -0,0 +1,185 @@
+"""Índice invertido de búsqueda (BM25) sobre los tutoriales"""
+
+import heapq
+import math
+import re
+import threading
+
+from .almacen import (
+    al_cambiar_contenido, cargar_indice, obtener_contenido, obtener_metadatos, _plegar,
+    _texto_plano
+)
+from .listado import _claves_listado
+
+# ==============================
+# 🔎 Índice de búsqueda de texto completo
+# ==============================
+# Índice invertido en memoria sobre título, descripción y contenido (sin
+# HTML). Los términos se pliegan a minúsculas sin acentos y se puntúan con
+# BM25; el índice se actualiza tutorial a tutorial con al_cambiar_contenido.
+# Por documento solo se guardan sus términos, su longitud y lenguaje/nivel
+# (para filtrar antes de puntuar): el cuerpo se relee de la caché de
+# contenidos solo para los fragmentos de los resultados que se devuelven.
+BUSQUEDA_PESOS = {'title': 3, 'description': 2, 'content': 1}
+BUSQUEDA_BM25_K1 = 1.2
+BUSQUEDA_BM25_B = 0.75
+PALABRAS_VACIAS = set("""
+a al algo algun alguna algunas alguno algunos ante antes como con contra cual cuando de del
+desde donde e el ella ellas ellos en entre era es esa esas ese eso esos esta estas este esto
+estos fue ha hay la las le les lo los mas me mi muy nos o os para pero por que se ser si sin
+sobre su sus tambien te tiene tu un una unas uno unos y ya
+""".split())
+
+_busqueda_lock = threading.RLock()
+_construccion_lock = threading.Lock()  # Un solo hilo construye; no frena a las actualizaciones
+_indice_busqueda = {
+    'postings': {},      # termino -> {tutorial_id: frecuencia ponderada}
+    'docs': {},          # tutorial_id -> {'terminos', 'longitud', 'language', 'level'}
+    'longitud_total': 0,
+    'construido': False,
+    'construyendo': False,
+    'tocados': set(),    # cambiados mientras se construía: la construcción no los pisa
+}
+
+def _tokenizar(texto):
+    """Términos plegados de un texto, sin palabras vacías"""
+    return [t for t in re.findall(r'[a-z0-9]+', _plegar(texto)) if t not in PALABRAS_VACIAS and len(t) > 1]
+
+def _quitar_del_indice(tutorial_id):
+    doc = _indice_busqueda['docs'].pop(tutorial_id, None)
+    if doc is None:
+        return
+    _indice_busqueda['longitud_total'] -= doc['longitud']
+    for termino in doc['terminos']:
+        postings = _indice_busqueda['postings'].get(termino)
+        if postings is not None:
+            postings.pop(tutorial_id, None)
+            if not postings:
+                del _indice_busqueda['postings'][termino]
+
+def _documento_busqueda(contenido):
+    """(frecuencias, doc) de un tutorial; se calcula sin tomar _busqueda_lock"""
+    frecuencias = {}
+    for campo, peso in BUSQUEDA_PESOS.items():
+        valor = contenido.get(campo) or ''
+        texto = _texto_plano(valor) if campo == 'content' else valor
+        for termino in _tokenizar(texto):
+            frecuencias[termino] = frecuencias.get(termino, 0) + peso
+    lenguaje, nivel = _claves_listado(contenido)[:2]
+    return frecuencias, {
+        'terminos': tuple(frecuencias),
+        'longitud': sum(frecuencias.values()),
+        'language': lenguaje,
+        'level': nivel,
+    }
+
+def _indexar(tutorial_id, frecuencias, doc):
+    """Añade un documento ya tokenizado (llamar con _busqueda_lock tomado)"""
+    _indice_busqueda['docs'][tutorial_id] = doc
+    _indice_busqueda['longitud_total'] += doc['longitud']
+    for termino, frecuencia in frecuencias.items():
+        _indice_busqueda['postings'].setdefault(termino, {})[tutorial_id] = frecuencia
+
+@al_cambiar_contenido
+def actualizar_indice_busqueda(tutorial_id):
+    """Reindexa (o quita) un tutorial tras un cambio en el almacén"""
+    with _busqueda_lock:
+        if not _indice_busqueda['construido'] and not _indice_busqueda['construyendo']:
+            return  # _asegurar_indice() lo construirá entero
+    contenido = obtener_contenido(tutorial_id)
+    documento = _documento_busqueda(contenido) if contenido is not None else None
+    with _busqueda_lock:
+        if _indice_busqueda['construyendo']:
+            _indice_busqueda['tocados'].add(tutorial_id)
+        _quitar_del_indice(tutorial_id)
+        if documento is not None:
+            _indexar(tutorial_id, *documento)
+
+def _asegurar_indice():
+    """Construye el índice completo la primera vez que se necesita.
+
+    Lee y tokeniza los tutoriales de uno en uno, fuera de _busqueda_lock (que
+    solo se toma para insertar cada documento), así que ni se cargan todos
+    los cuerpos a la vez ni se frenan las búsquedas y actualizaciones.
+    """
+    with _construccion_lock:
+        with _busqueda_lock:
+            if _indice_busqueda['construido']:
+                return
+            _indice_busqueda['construyendo'] = True
+        try:
+            for tutorial_id in cargar_indice():
+                contenido = obtener_contenido(tutorial_id)
+                if contenido is None:
+                    continue
+                documento = _documento_busqueda(contenido)
+                with _busqueda_lock:
+                    # Si cambió mientras tanto, actualizar_indice_busqueda ya puso su versión
+                    if tutorial_id not in _indice_busqueda['tocados']:
+                        _quitar_del_indice(tutorial_id)
+                        _indexar(tutorial_id, *documento)
+            with _busqueda_lock:
+                _indice_busqueda['construido'] = True
+        finally:
+            with _busqueda_lock:
+                _indice_busqueda['construyendo'] = False
+                _indice_busqueda['tocados'] = set()
+
+def _fragmento(tutorial_id, terminos, ancho=160):
+    """Trozo del texto alrededor de la primera aparición de algún término"""
+    contenido = obtener_contenido(tutorial_id) or {}
+    texto = _texto_plano(contenido.get('content'))
+    plegado = _plegar(texto)
+    posiciones = [p for p in (plegado.find(t) for t in terminos) if p >= 0]
+    if not posiciones:
+        return texto[:ancho] + ('…' if len(texto) > ancho else '')
+    inicio = max(0, min(posiciones) - ancho // 3)
+    fin = min(len(texto), inicio + ancho)
+    return ('…' if inicio > 0 else '') + texto[inicio:fin].strip() + ('…' if fin < len(texto) else '')
+
+def buscar_tutoriales(consulta, limite=10, lenguaje=None, nivel=None):
+    """Tutoriales ordenados por relevancia BM25 con un fragmento de contexto.
+
+    lenguaje y nivel (en minúsculas) filtran antes de puntuar, así que el
+    límite se aplica sobre los que cumplen el filtro.
+    """
+    terminos = list(dict.fromkeys(_tokenizar(consulta)))
+    if not terminos:
+        return []
+    cargar_indice()  # Pone la caché al día y notifica cambios de otros workers
+    _asegurar_indice()
+    with _busqueda_lock:
+        docs = _indice_busqueda['docs']
+        if not docs:
+            return []
+        media = _indice_busqueda['longitud_total'] / len(docs) or 1
+        puntuaciones = {}
+        for termino in terminos:
+            postings = _indice_busqueda['postings'].get(termino, {})
+            if not postings:
+                continue
+            idf = math.log(1 + (len(docs) - len(postings) + 0.5) / (len(postings) + 0.5))
+            for tutorial_id, frecuencia in postings.items():
+                doc = docs[tutorial_id]
+                if (lenguaje and doc['language'] != lenguaje) or (nivel and doc['level'] != nivel):
+                    continue
+                norma = BUSQUEDA_BM25_K1 * (1 - BUSQUEDA_BM25_B + BUSQUEDA_BM25_B * doc['longitud'] / media)
+                puntuaciones[tutorial_id] = puntuaciones.get(tutorial_id, 0) + \
+                    idf * frecuencia * (BUSQUEDA_BM25_K1 + 1) / (frecuencia + norma)
+        mejores = heapq.nlargest(limite, puntuaciones.items(), key=lambda par: par[1])
+    fragmentos = {tid: _fragmento(tid, terminos) for tid, _ in mejores}
+
+    resultados = []
+    for tutorial_id, puntuacion in mejores:
+        contenido = obtener_metadatos(tutorial_id) or {}
+        resultados.append({
+            '_id': tutorial_id,
+            'title': contenido.get('title', 'Sin título'),
+            'description': contenido.get('description', ''),
+            'level': contenido.get('level', 'principiante'),
+            'duration': contenido.get('duration', '0'),
+            'language': contenido.get('language', 'python'),
+            'score': round(puntuacion, 4),
+            'snippet': fragmentos[tutorial_id]
+        })
+    return resultados
@@ -0,0 +1,46 @@
+"""Configuración general: Mongo, rutas de datos, TikTok y la sesión HTTP compartida"""
+
+import os
+import requests
+from requests.adapters import HTTPAdapter
+
+from . import app
+
+# ==============================
+# ⚙️ Configuración general
+# ==============================
+MONGO_USERNAME = os.getenv('MONGO_USERNAME')
+MONGO_PASSWORD = os.getenv('MONGO_PASSWORD')
+MONGO_URI = os.getenv('MONGO_URI') or (
+    f"mongodb+srv://{MONGO_USERNAME}:{MONGO_PASSWORD}"
+    "@cluster0.rhzhszo.mongodb.net/?retryWrites=true&w=majority&appName=Cluster0"
+)
+
+DB_NAME = "codeverse"
+COLLECTION_NAME = "tutorials"
+TOMBSTONES_COLLECTION = "tutorials_eliminados"  # Borrados, para la sincronización
+CONTENIDO_FILE = "contenido_tutoriales.json"  # Semilla / exportación en un solo archivo
+CONTENIDO_DIR = os.getenv('CONTENIDO_DIR', 'contenido_tutoriales')  # Un archivo por tutorial
+DOWNLOAD_FOLDER = "downloads"
+ESTATICOS_FUENTE = os.path.join(app.static_folder, 'src')    # CSS/JS de las plantillas
+ESTATICOS_BUILD = os.path.join(app.static_folder, 'build')   # Salida de `flask construir-estaticos`
+_MANIFIESTO_ESTATICOS = os.path.join(ESTATICOS_BUILD, 'manifest.json')
+
+# Descargas de TikTok: pool de hilos acotado con trabajos consultables
+TIKWM_API_URL = os.getenv('TIKWM_API_URL', 'https://tikwm.com/api')
+TIKTOK_TIMEOUT = (
+    float(os.getenv('TIKTOK_CONNECT_TIMEOUT', 5)),   # Conexión
+    float(os.getenv('TIKTOK_READ_TIMEOUT', 30))      # Lectura entre bloques
+)
+TIKTOK_MAX_BYTES = int(os.getenv('TIKTOK_MAX_BYTES', 200 * 1024 * 1024))
+TIKTOK_CHUNK = 64 * 1024
+TIKTOK_WORKERS = int(os.getenv('TIKTOK_WORKERS', 2))
+TIKTOK_COLA_MAX = int(os.getenv('TIKTOK_COLA_MAX', 8))     # En cola + en curso, por proceso
+TIKTOK_JOB_TTL = int(os.getenv('TIKTOK_JOB_TTL', 600))      # Segundos que se conserva cada trabajo
+TIKTOK_CACHE_MAX_BYTES = int(os.getenv('TIKTOK_CACHE_MAX_BYTES', 1024 * 1024 * 1024))
+TIKTOK_JANITOR_INTERVALO = int(os.getenv('TIKTOK_JANITOR_INTERVALO', 300))
+
+# Sesión HTTP compartida para reutilizar conexiones con tikwm y la CDN
+sesion_http = requests.Session()
+sesion_http.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16))
+sesion_http.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=16))
@@ -0,0 +1,292 @@
+"""Escritura diferida (almacén y Mongo) con diario para no perder guardados"""
+
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+import json
+import os
+import tempfile
+import threading
+import time
+import uuid
+from bson.objectid import ObjectId
+
+try:
+    import fcntl  # Bloqueo entre procesos (Linux/macOS)
+except ImportError:
+    fcntl = None
+
+from .config import CONTENIDO_DIR
+from .mongo import ahora_utc, conectar_mongodb, registrar_fallo_mongodb
+from .almacen import _aplicar_cambios, _bloqueo_almacen, _ruta_tutorial
+
+# ==============================
+# ✍️ Escritura diferida de guardados del editor
+# ==============================
+# POST /api/tutorial/<id>/contenido no escribe en el almacén ni en Mongo:
+# anota el guardado en un diario local (append + fsync), lo deja en memoria
+# y responde. Un hilo vacía la cola por lotes pasada ESCRITURA_VENTANA, con
+# una sola escritura del almacén y un solo bulk_write, quedándose solo con el
+# último guardado de cada tutorial. Lo que falla se reintenta cada
+# ESCRITURA_REINTENTO segundos. Hasta el vaciado el guardado solo lo ve este
+# worker (GET .../contenido lo sirve desde la cola); el resto lo ve en cuanto
+# llega al almacén, como mucho ESCRITURA_VENTANA después. Cada proceso
+# tiene su diario (.diferidas/<uuid>.jsonl, no por pid: los pids se repiten
+# entre reinicios del contenedor) y lo marca como vivo con flock; al
+# arrancar se recuperan los diarios de procesos que murieron sin vaciarlos.
+ESCRITURA_VENTANA = float(os.getenv('ESCRITURA_VENTANA', 1.0))
+ESCRITURA_REINTENTO = float(os.getenv('ESCRITURA_REINTENTO', 5.0))
+ESCRITURA_LOTE_MAX = int(os.getenv('ESCRITURA_LOTE_MAX', 200))
+_DIFERIDAS_DIR = os.path.join(CONTENIDO_DIR, '.diferidas')
+
+_diferidas_cond = threading.Condition(threading.Lock())
+_diferidas = {
+    'almacen': {},       # tutorial_id -> contenido pendiente de escribir en el almacén
+    'mongo': {},         # tutorial_id -> campos pendientes de $set en Mongo
+    'primera': None,     # time.monotonic() del guardado pendiente más antiguo
+    'reintento': None,   # cuándo volver a intentar lo que falló
+    'vaciando': set(),   # ids del lote que se está aplicando ahora mismo
+    'nombre': None,      # nombre del diario de este proceso (uuid)
+    'pid': None,         # proceso que abrió el diario (un fork abre el suyo)
+    'diario': None,      # diario abierto de este proceso
+    'marca': None,       # archivo con flock que indica que el diario tiene dueño
+    'guardados': 0,
+    'coalescidos': 0,
+    'vaciados': 0,
+    'fallos_almacen': 0,
+    'fallos_mongo': 0,
+}
+
+def _ruta_diario(nombre, extension):
+    return os.path.join(_DIFERIDAS_DIR, f"{nombre}.{extension}")
+
+def _abrir_diario():
+    """Abre el diario de este proceso (llamar con _diferidas_cond tomado)"""
+    if _diferidas['diario'] is not None and _diferidas['pid'] == os.getpid():
+        return
+    os.makedirs(_DIFERIDAS_DIR, exist_ok=True)
+    nombre = uuid.uuid4().hex
+    marca = open(_ruta_diario(nombre, 'lock'), 'a')
+    if fcntl is not None:
+        fcntl.flock(marca, fcntl.LOCK_EX)
+    _diferidas.update(
+        nombre=nombre, pid=os.getpid(), marca=marca,
+        diario=open(_ruta_diario(nombre, 'jsonl'), 'a', encoding='utf-8')
+    )
+
+def _anotar(entrada):
+    diario = _diferidas['diario']
+    diario.write(json.dumps(entrada, ensure_ascii=False) + '\n')
+    diario.flush()
+    os.fsync(diario.fileno())
+
+def _coalescer(tutorial_id, contenido, campos_mongo):
+    """Deja solo el último guardado de cada tutorial (llamar con _diferidas_cond tomado)"""
+    if tutorial_id in _diferidas['almacen'] or tutorial_id in _diferidas['mongo']:
+        _diferidas['coalescidos'] += 1
+    if _diferidas['primera'] is None:
+        _diferidas['primera'] = time.monotonic()
+    if contenido is not None:
+        _diferidas['almacen'][tutorial_id] = contenido
+    if campos_mongo:
+        _diferidas['mongo'][tutorial_id] = {**_diferidas['mongo'].get(tutorial_id, {}), **campos_mongo}
+
+def _compactar_diario():
+    """Reescribe el diario con lo que sigue pendiente (llamar con _diferidas_cond tomado)"""
+    if _diferidas['diario'] is None or _diferidas['pid'] != os.getpid():
+        return
+    ruta = _ruta_diario(_diferidas['nombre'], 'jsonl')
+    fd, tmp = tempfile.mkstemp(prefix='.', suffix='.tmp', dir=_DIFERIDAS_DIR)
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        for tutorial_id in set(_diferidas['almacen']) | set(_diferidas['mongo']):
+            f.write(json.dumps({
+                'tutorial_id': tutorial_id,
+                'contenido': _diferidas['almacen'].get(tutorial_id),
+                'mongo': _diferidas['mongo'].get(tutorial_id)
+            }, ensure_ascii=False) + '\n')
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, ruta)
+    _diferidas['diario'].close()
+    _diferidas['diario'] = open(ruta, 'a', encoding='utf-8')
+
+def encolar_guardado(tutorial_id, contenido, campos_mongo=None):
+    """Anota un guardado de forma duradera y lo deja para el hilo de escritura"""
+    _ruta_tutorial(tutorial_id)  # Valida el id antes de aceptarlo
+    if campos_mongo and not ObjectId.is_valid(tutorial_id):
+        campos_mongo = None  # Tutorial solo local: no existe en Mongo
+    if contenido is None and not campos_mongo:
+        return
+    with _diferidas_cond:
+        _abrir_diario()
+        _anotar({'tutorial_id': tutorial_id, 'contenido': contenido, 'mongo': campos_mongo})
+        _coalescer(tutorial_id, contenido, campos_mongo)
+        _diferidas['guardados'] += 1
+        _diferidas_cond.notify()
+
+def escritura_pendiente(tutorial_id):
+    """Contenido guardado en este proceso que aún no llegó al almacén, o None"""
+    with _diferidas_cond:
+        contenido = _diferidas['almacen'].get(tutorial_id)
+        return dict(contenido) if contenido is not None else None
+
+def escrituras_pendientes():
+    """Ids con cambios de este proceso todavía sin aplicar (almacén o Mongo)"""
+    with _diferidas_cond:
+        return set(_diferidas['almacen']) | set(_diferidas['mongo']) | _diferidas['vaciando']
+
+def descartar_escrituras(tutorial_ids):
+    """Olvida los guardados pendientes de tutoriales que se van a reemplazar o borrar"""
+    with _diferidas_cond:
+        descartados = False
+        for tutorial_id in tutorial_ids:
+            descartados |= _diferidas['almacen'].pop(tutorial_id, None) is not None
+            descartados |= _diferidas['mongo'].pop(tutorial_id, None) is not None
+        if not _diferidas['almacen'] and not _diferidas['mongo']:
+            _diferidas['primera'] = None
+        if descartados:
+            _compactar_diario()
+
+def vaciar_escrituras():
+    """Aplica ya todo lo pendiente: una escritura del almacén y un bulk_write en Mongo"""
+    with _diferidas_cond:
+        almacen, _diferidas['almacen'] = _diferidas['almacen'], {}
+        mongo, _diferidas['mongo'] = _diferidas['mongo'], {}
+        # Siguen contando como pendientes hasta aplicarse: la sincronización no los pisa
+        _diferidas['vaciando'] = set(almacen) | set(mongo)
+        _diferidas['primera'] = None
+        _diferidas['reintento'] = None
+    if not almacen and not mongo:
+        return
+
+    fallidas_almacen = {}
+    if almacen:
+        try:
+            with _bloqueo_almacen():
+                _aplicar_cambios(almacen)
+        except Exception as e:
+            print(f"⚠️ No se pudieron escribir {len(almacen)} guardados en el almacén: {e}")
+            fallidas_almacen = almacen
+
+    fallidas_mongo = {}
+    if mongo:
+        tutorials_collection = conectar_mongodb()
+        if tutorials_collection is None:
+            fallidas_mongo = mongo
+        else:
+            ahora = ahora_utc()
+            try:
+                tutorials_collection.bulk_write([
+                    UpdateOne({'_id': ObjectId(tutorial_id)}, {'$set': {**campos, 'updatedAt': ahora}})
+                    for tutorial_id, campos in mongo.items()
+                ], ordered=False)
+            except BulkWriteError as e:
+                # Errores del propio documento: reintentar no los arreglaría
+                print(f"⚠️ Guardados rechazados por MongoDB: {e.details['writeErrors']}")
+            except Exception as e:
+                registrar_fallo_mongodb(e)
+                print(f"⚠️ MongoDB no disponible, se reintentará el guardado: {e}")
+                fallidas_mongo = mongo
+
+    with _diferidas_cond:
+        # Lo que llegó mientras tanto es más reciente y tiene prioridad
+        for tutorial_id, contenido in fallidas_almacen.items():
+            _diferidas['almacen'].setdefault(tutorial_id, contenido)
+        for tutorial_id, campos in fallidas_mongo.items():
+            _diferidas['mongo'][tutorial_id] = {**campos, **_diferidas['mongo'].get(tutorial_id, {})}
+        if fallidas_almacen:
+            _diferidas['fallos_almacen'] += 1
+        if fallidas_mongo:
+            _diferidas['fallos_mongo'] += 1
+        if fallidas_almacen or fallidas_mongo:
+            _diferidas['reintento'] = time.monotonic() + ESCRITURA_REINTENTO
+        _diferidas['vaciando'] = set()
+        _diferidas['vaciados'] += 1
+        _compactar_diario()
+
+def _proximo_vaciado():
+    """Instante (monotonic) del próximo vaciado, o None si no hay nada pendiente"""
+    if not _diferidas['almacen'] and not _diferidas['mongo']:
+        return None
+    if len(_diferidas['almacen']) + len(_diferidas['mongo']) >= ESCRITURA_LOTE_MAX:
+        return time.monotonic()
+    plazos = []
+    if _diferidas['primera'] is not None:
+        plazos.append(_diferidas['primera'] + ESCRITURA_VENTANA)
+    if _diferidas['reintento'] is not None:
+        plazos.append(_diferidas['reintento'])
+    return min(plazos) if plazos else time.monotonic()
+
+def _bucle_escrituras():
+    while True:
+        with _diferidas_cond:
+            while True:
+                plazo = _proximo_vaciado()
+                if plazo is not None and plazo <= time.monotonic():
+                    break
+                _diferidas_cond.wait(None if plazo is None else plazo - time.monotonic())
+        try:
+            vaciar_escrituras()
+        except Exception as e:
+            print(f"⚠️ Error vaciando guardados pendientes: {e}")
+
+def recuperar_diarios():
+    """Reencola los diarios de procesos que terminaron sin vaciarlos.
+
+    Se distinguen por el flock de su .lock, no por el nombre: un diario solo
+    se da por huérfano si nadie mantiene su marca.
+    """
+    if not os.path.isdir(_DIFERIDAS_DIR):
+        return
+    with _diferidas_cond:
+        propio = _diferidas['nombre'] if _diferidas['pid'] == os.getpid() else None
+    for archivo in os.listdir(_DIFERIDAS_DIR):
+        nombre = archivo[:-6]
+        if not archivo.endswith('.jsonl') or nombre == propio:
+            continue
+        with open(_ruta_diario(nombre, 'lock'), 'a') as marca:
+            if fcntl is not None:
+                try:
+                    fcntl.flock(marca, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except OSError:
+                    continue  # Su proceso sigue vivo
+            recuperados = 0
+            with open(_ruta_diario(nombre, 'jsonl'), 'r', encoding='utf-8') as f:
+                for linea in f:
+                    try:
+                        entrada = json.loads(linea)
+                    except ValueError:
+                        continue  # Última línea a medias si el proceso murió escribiendo
+                    encolar_guardado(entrada['tutorial_id'], entrada.get('contenido'), entrada.get('mongo'))
+                    recuperados += 1
+            os.unlink(_ruta_diario(nombre, 'jsonl'))
+            os.unlink(_ruta_diario(nombre, 'lock'))
+        if recuperados:
+            print(f"✅ Recuperados {recuperados} guardados pendientes del diario {nombre}")
+
+def _vaciar_al_salir():
+    try:
+        vaciar_escrituras()
+    except Exception as e:
+        print(f"⚠️ No se pudieron vaciar los guardados pendientes al salir: {e}")
+    with _diferidas_cond:
+        if (_diferidas['diario'] is None or _diferidas['pid'] != os.getpid()
+                or _diferidas['almacen'] or _diferidas['mongo']):
+            return  # Lo que quede lo recupera el próximo proceso
+        _diferidas['diario'].close()
+        os.unlink(_ruta_diario(_diferidas['nombre'], 'jsonl'))
+        os.unlink(_ruta_diario(_diferidas['nombre'], 'lock'))
+        _diferidas['marca'].close()
+        _diferidas.update(diario=None, marca=None, nombre=None, pid=None)
+
+def estadisticas_escrituras():
+    """Estado de la cola de guardados diferidos"""
+    with _diferidas_cond:
+        return {
+            'pendientes_almacen': len(_diferidas['almacen']),
+            'pendientes_mongo': len(_diferidas['mongo']),
+            'guardados': _diferidas['guardados'],
+            'coalescidos': _diferidas['coalescidos'],
+            'vaciados': _diferidas['vaciados'],
+            'fallos_almacen': _diferidas['fallos_almacen'],
+            'fallos_mongo': _diferidas['fallos_mongo']
+        }
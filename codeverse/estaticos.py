@@ -0,0 +1,170 @@
+"""Recursos estáticos con huella: construcción y helper asset()"""
+
+from flask import url_for
+import gzip
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+
+try:
+    import brotli  # Opcional: respuestas en br además de gzip
+except ImportError:
+    brotli = None
+
+try:
+    import rjsmin  # Opcional: minificado de JS en `flask construir-estaticos`
+except ImportError:
+    rjsmin = None
+
+from . import app
+from .config import ESTATICOS_BUILD, ESTATICOS_FUENTE, _MANIFIESTO_ESTATICOS
+from .almacen import _escribir_atomico
+from .respuestas import COMPRESION_NIVEL_BROTLI, COMPRESION_NIVEL_GZIP
+
+# ==============================
+# 📦 Recursos estáticos (CSS/JS con huella)
+# ==============================
+# El CSS y JS de las plantillas vive en static/src/. `flask construir-estaticos`
+# los minifica, les pone en el nombre un hash de su contenido y los deja en
+# static/build/ (con variantes .gz/.br ya comprimidas) junto a manifest.json;
+# el JS se minifica con rjsmin y, si encuentra la CLI de Tailwind, compila
+# también las clases que usan las plantillas. Se ejecuta en el build del
+# despliegue (render.yaml), no al arrancar: un reinicio no descarga la CLI de
+# Tailwind. Como el nombre cambia con el contenido, /assets/ los sirve como
+# inmutables. Sin build, asset() apunta a static/src/ y todo sigue funcionando.
+ASSETS_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+TAILWIND_CLI = os.getenv('TAILWIND_CLI', 'tailwindcss')
+# pytailwindcss (requirements.txt) instala la CLI `tailwindcss` y descarga el
+# binario la primera vez; se fija la v3, la del CDN y la del formato de
+# tailwind.config.js, para que el CSS construido sea el mismo.
+TAILWIND_VERSION = os.getenv('TAILWINDCSS_VERSION', 'v3.4.17')
+_TAILWIND_CONFIG = os.path.join(app.root_path, 'tailwind.config.js')
+_TAILWIND_ENTRADA = os.path.join(ESTATICOS_FUENTE, 'tailwind', 'entrada.css')
+_TIPOS_ASSETS = {'.css': 'text/css', '.js': 'text/javascript'}
+
+_manifiesto = {}
+
+def cargar_manifiesto():
+    """Lee static/build/manifest.json (ruta lógica -> archivo con huella)"""
+    try:
+        with open(_MANIFIESTO_ESTATICOS, 'r', encoding='utf-8') as f:
+            nuevo = json.load(f)
+    except (OSError, ValueError):
+        nuevo = {}
+    _manifiesto.clear()
+    _manifiesto.update(nuevo)
+    return len(nuevo)
+
+@app.template_global()
+def asset(ruta):
+    """URL de un recurso ('css/base.css'): la versión con huella si está construida.
+
+    Devuelve None si el recurso no existe ni construido ni en static/src/
+    (p. ej. 'css/tailwind.css' antes de compilar Tailwind).
+    """
+    construido = _manifiesto.get(ruta)
+    if construido is not None:
+        return url_for('servir_asset', archivo=construido)
+    if os.path.isfile(os.path.join(ESTATICOS_FUENTE, ruta)):
+        return url_for('static', filename=f"src/{ruta}")
+    return None
+
+_CSS_LITERALES = re.compile(r'"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\'|/\*.*?\*/', re.S)
+
+def _compactar_css(codigo):
+    codigo = re.sub(r'\s+', ' ', codigo)
+    codigo = re.sub(r'\s*([{};,>])\s*', r'\1', codigo)
+    return re.sub(r':\s+', ':', codigo).replace(';}', '}')
+
+def minificar_css(css):
+    """Quita comentarios y espacios sobrantes (las cadenas no se tocan)"""
+    partes, posicion = [], 0
+    for literal in _CSS_LITERALES.finditer(css):
+        partes.append(_compactar_css(css[posicion:literal.start()]))
+        if not literal.group(0).startswith('/*'):
+            partes.append(literal.group(0))
+        posicion = literal.end()
+    partes.append(_compactar_css(css[posicion:]))
+    return ''.join(partes).strip().replace(';}', '}')
+
+def minificar_js(codigo):
+    """Minifica JS con rjsmin; sin él se deja tal cual (solo se pierde tamaño)"""
+    if rjsmin is None:
+        print("⚠️ rjsmin no está instalado: el JS se publica sin minificar")
+        return codigo
+    return rjsmin.jsmin(codigo) + '\n'
+
+def _compilar_tailwind():
+    """CSS de Tailwind con las clases usadas en plantillas y scripts, o None sin CLI"""
+    cli = shutil.which(TAILWIND_CLI)
+    if cli is None:
+        print(f"⚠️ No se encontró la CLI de Tailwind ({TAILWIND_CLI}): se seguirá usando el CDN")
+        return None
+    with tempfile.TemporaryDirectory() as temporal:
+        salida = os.path.join(temporal, 'tailwind.css')
+        try:
+            subprocess.run(
+                [cli, '-c', _TAILWIND_CONFIG, '-i', _TAILWIND_ENTRADA, '-o', salida, '--minify'],
+                check=True, cwd=app.root_path, env={**os.environ, 'TAILWINDCSS_VERSION': TAILWIND_VERSION}
+            )
+            with open(salida, 'r', encoding='utf-8') as f:
+                return f.read()
+        except (OSError, subprocess.CalledProcessError) as e:
+            # Sin Tailwind el resto del build sigue valiendo: las plantillas usan el CDN
+            print(f"⚠️ Falló la compilación de Tailwind ({e}): se seguirá usando el CDN")
+            return None
+
+def construir_estaticos():
+    """Minifica y pone huella a static/src/{css,js}/* (y Tailwind) en static/build/.
+
+    Se conservan los archivos del build anterior para que las páginas ya
+    servidas con las URLs viejas sigan encontrándolos; lo demás se borra.
+    """
+    fuentes = {}
+    for tipo in ('css', 'js'):
+        carpeta = os.path.join(ESTATICOS_FUENTE, tipo)
+        for nombre in sorted(os.listdir(carpeta)) if os.path.isdir(carpeta) else []:
+            with open(os.path.join(carpeta, nombre), 'r', encoding='utf-8') as f:
+                fuentes[f"{tipo}/{nombre}"] = f.read()
+    tailwind = _compilar_tailwind()
+    
+    anterior = dict(_manifiesto)
+    manifiesto = {}
+    for ruta, texto in fuentes.items():
+        minificado = minificar_css(texto) if ruta.endswith('.css') else minificar_js(texto)
+        manifiesto[ruta] = _escribir_asset(ruta, minificado.encode('utf-8'))
+        print(f"📦 {ruta}: {len(texto.encode('utf-8'))} → {len(minificado.encode('utf-8'))} bytes")
+    if tailwind is not None:
+        manifiesto['css/tailwind.css'] = _escribir_asset('css/tailwind.css', tailwind.encode('utf-8'))
+        print(f"📦 css/tailwind.css: {len(tailwind)} bytes")
+    
+    conservar = set(manifiesto.values()) | set(anterior.values())
+    for raiz, _, archivos in os.walk(ESTATICOS_BUILD):
+        for nombre in archivos:
+            relativo = os.path.relpath(os.path.join(raiz, nombre), ESTATICOS_BUILD).replace(os.sep, '/')
+            base = re.sub(r'\.(gz|br)$', '', relativo)
+            if relativo != 'manifest.json' and base not in conservar:
+                os.unlink(os.path.join(raiz, nombre))
+    _escribir_atomico(_MANIFIESTO_ESTATICOS, manifiesto)
+    cargar_manifiesto()
+    return manifiesto
+
+def _escribir_asset(ruta, datos):
+    """Guarda un recurso con huella y sus variantes comprimidas; devuelve su ruta en build/"""
+    raiz, extension = os.path.splitext(ruta)
+    construido = f"{raiz}.{hashlib.sha256(datos).hexdigest()[:10]}{extension}"
+    destino = os.path.join(ESTATICOS_BUILD, construido)
+    os.makedirs(os.path.dirname(destino), exist_ok=True)
+    variantes = {'': datos, '.gz': gzip.compress(datos, compresslevel=COMPRESION_NIVEL_GZIP, mtime=0)}
+    if brotli is not None:
+        variantes['.br'] = brotli.compress(datos, quality=COMPRESION_NIVEL_BROTLI)
+    for sufijo, contenido in variantes.items():
+        with open(destino + sufijo, 'wb') as f:
+            f.write(contenido)
+    return construido
+
+cargar_manifiesto()
@@ -0,0 +1,255 @@
+"""Instantáneas HTML estáticas del listado y de cada tutorial"""
+
+from flask import request, send_file
+import hashlib
+import json
+import math
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+from . import app
+from .config import _MANIFIESTO_ESTATICOS
+from .metricas import contar, observar
+from .almacen import (
+    al_cambiar_contenido, _bloqueo_archivo, _escribir_atomico, huellas_tutoriales, _ID_VALIDO
+)
+from .resaltado import _VERSION_RESALTADO
+from .respuestas import (
+    CACHE_CONTROL_TUTORIALES, codificacion_aceptada, CODIFICACIONES, _comprimir, _huella_archivos,
+    renderizar_tutorial
+)
+from .listado import _listar_json, parametros_listado, renderizar_listado, TUTORIALES_POR_PAGINA
+
+# ==============================
+# 📸 Instantáneas estáticas del catálogo
+# ==============================
+# `flask exportar-instantaneas` renderiza /tutoriales (sus páginas sin
+# filtros) y cada /tutorial/<id> a INSTANTANEAS_DIR/<versión>/, con variantes
+# .gz/.br. La versión sale de las plantillas y los estáticos: si cambian se
+# exporta todo a un directorio nuevo y el enlace 'actual' pasa a apuntarle
+# de golpe. Si no, solo se rehacen los tutoriales cuyo contenido cambió
+# (estado.json recuerda lo exportado). Con INSTANTANEAS_AUTO=1 cada guardado
+# programa una reexportación en segundo plano, y con SERVIR_INSTANTANEAS=1
+# esas rutas se sirven con send_file (sendfile en gunicorn), sin Jinja ni Mongo.
+# Solo se sirve la instantánea si es de la versión de este código: tras un
+# despliegue que cambie plantillas o estáticos Flask renderiza hasta que la
+# exportación del arranque activa la versión nueva.
+INSTANTANEAS_DIR = os.getenv('INSTANTANEAS_DIR', 'instantaneas')
+SERVIR_INSTANTANEAS = os.getenv('SERVIR_INSTANTANEAS', '0') == '1'
+INSTANTANEAS_AUTO = os.getenv('INSTANTANEAS_AUTO', '1' if SERVIR_INSTANTANEAS else '0') == '1'
+INSTANTANEAS_VENTANA = float(os.getenv('INSTANTANEAS_VENTANA', 2.0))  # Agrupa guardados seguidos
+_INSTANTANEA_ACTUAL = os.path.join(INSTANTANEAS_DIR, 'actual')
+_SUFIJOS_CODIFICACION = {'br': '.br', 'gzip': '.gz'}
+
+_instantaneas_lock = threading.Lock()
+_instantaneas_cond = threading.Condition(threading.Lock())
+_instantaneas = {
+    'pendiente': None,   # Instante (monotonic) del primer guardado sin exportar
+    'hilo': None,
+    'exportaciones': 0,
+    'ultima': None,      # Resumen de la última exportación de este proceso
+    'version': None,     # _version_instantaneas() de este proceso (no cambia sin redesplegar)
+}
+
+def _version_instantaneas():
+    """Huella de todo lo que, además de los datos, cambia el HTML exportado"""
+    plantillas = _huella_archivos(
+        os.path.join(app.root_path, 'templates', 'tutoriales.html'),
+        os.path.join(app.root_path, 'templates', 'tutorial-detalle.html'),
+        os.path.join(app.root_path, 'templates', 'base.html'),
+        _MANIFIESTO_ESTATICOS
+    )
+    return hashlib.sha1(f"{plantillas}:{_VERSION_RESALTADO}".encode('utf-8')).hexdigest()[:12]
+
+def _escribir_instantanea(directorio, relativa, html_texto):
+    """Escribe una página y sus variantes comprimidas (cada una con rename atómico)"""
+    destino = os.path.join(directorio, relativa)
+    os.makedirs(os.path.dirname(destino), exist_ok=True)
+    datos = html_texto.encode('utf-8')
+    variantes = {'': datos}
+    for codificacion in CODIFICACIONES:
+        variantes[_SUFIJOS_CODIFICACION[codificacion]] = _comprimir(datos, codificacion)
+    for sufijo, contenido in variantes.items():
+        fd, tmp = tempfile.mkstemp(prefix='.', suffix='.tmp', dir=os.path.dirname(destino))
+        with os.fdopen(fd, 'wb') as f:
+            f.write(contenido)
+        os.replace(tmp, destino + sufijo)
+
+def _borrar_instantanea(directorio, relativa):
+    for sufijo in ('',) + tuple(_SUFIJOS_CODIFICACION.values()):
+        try:
+            os.unlink(os.path.join(directorio, relativa) + sufijo)
+        except FileNotFoundError:
+            pass
+
+def _exportar_listado(directorio, paginas_antes):
+    """Exporta todas las páginas del listado sin filtros; devuelve cuántas hay"""
+    parametros = parametros_listado({}, TUTORIALES_POR_PAGINA)
+    total_paginas = pagina = 1
+    while pagina <= total_paginas:
+        parametros['page'] = pagina
+        resultado = _listar_json(parametros)
+        total_paginas = max(1, math.ceil(resultado['total'] / parametros['limit']))
+        _escribir_instantanea(directorio, f"tutoriales/{pagina}.html", renderizar_listado(parametros, resultado))
+        pagina += 1
+    for sobrante in range(total_paginas + 1, paginas_antes + 1):
+        _borrar_instantanea(directorio, f"tutoriales/{sobrante}.html")
+    return total_paginas
+
+def _activar_version(version):
+    """Apunta 'actual' a la versión (cambio atómico) y borra las anteriores menos una"""
+    try:
+        anterior = os.readlink(_INSTANTANEA_ACTUAL)
+    except OSError:
+        anterior = None
+    if anterior != version:
+        tmp = f"{_INSTANTANEA_ACTUAL}.{os.getpid()}.tmp"
+        if os.path.lexists(tmp):
+            os.unlink(tmp)
+        os.symlink(version, tmp)
+        os.replace(tmp, _INSTANTANEA_ACTUAL)
+        print(f"📸 Instantáneas: versión {version} activa")
+    for nombre in os.listdir(INSTANTANEAS_DIR):
+        ruta = os.path.join(INSTANTANEAS_DIR, nombre)
+        if nombre not in (version, anterior) and not nombre.startswith(('.', 'actual')) and os.path.isdir(ruta):
+            shutil.rmtree(ruta, ignore_errors=True)
+
+def exportar_instantaneas():
+    """Exporta las páginas del catálogo que hayan cambiado desde la última vez"""
+    inicio = time.perf_counter()
+    os.makedirs(INSTANTANEAS_DIR, exist_ok=True)
+    with _bloqueo_archivo(os.path.join(INSTANTANEAS_DIR, '.lock'), _instantaneas_lock):
+        version = _version_instantaneas()
+        directorio = os.path.join(INSTANTANEAS_DIR, version)
+        ruta_estado = os.path.join(directorio, 'estado.json')
+        try:
+            with open(ruta_estado, 'r', encoding='utf-8') as f:
+                estado = json.load(f)
+        except (OSError, ValueError):
+            estado = {'tutoriales': {}, 'paginas_listado': 0}
+        
+        actuales = huellas_tutoriales()
+        cambiados = [tid for tid, huella in actuales.items() if estado['tutoriales'].get(tid) != huella]
+        eliminados = [tid for tid in estado['tutoriales'] if tid not in actuales]
+        paginas = estado['paginas_listado']
+        with app.test_request_context('/'):
+            for tutorial_id in cambiados:
+                html_pagina = renderizar_tutorial(tutorial_id)
+                if html_pagina is None:  # Borrado mientras se exportaba
+                    actuales.pop(tutorial_id)
+                    continue
+                _escribir_instantanea(directorio, f"tutorial/{tutorial_id}.html", html_pagina)
+            for tutorial_id in eliminados:
+                _borrar_instantanea(directorio, f"tutorial/{tutorial_id}.html")
+            if cambiados or eliminados or not paginas:
+                paginas = _exportar_listado(directorio, paginas)
+        
+        _escribir_atomico(ruta_estado, {'tutoriales': actuales, 'paginas_listado': paginas})
+        _activar_version(version)
+    resumen = {
+        'version': version,
+        'exportados': len(cambiados),
+        'eliminados': len(eliminados),
+        'paginas_listado': paginas,
+        'ms': round((time.perf_counter() - inicio) * 1000),
+    }
+    observar('codeverse_instantaneas_segundos', time.perf_counter() - inicio)
+    with _instantaneas_cond:
+        _instantaneas['exportaciones'] += 1
+        _instantaneas['ultima'] = resumen
+    return resumen
+
+def _bucle_instantaneas():
+    while True:
+        with _instantaneas_cond:
+            while True:
+                pendiente = _instantaneas['pendiente']
+                if pendiente is not None and pendiente + INSTANTANEAS_VENTANA <= time.monotonic():
+                    break
+                _instantaneas_cond.wait(None if pendiente is None else pendiente + INSTANTANEAS_VENTANA - time.monotonic())
+            _instantaneas['pendiente'] = None
+        try:
+            exportar_instantaneas()
+        except Exception as e:
+            print(f"⚠️ Error exportando instantáneas: {e}")
+
+def exportar_al_arrancar():
+    """Pone al día las instantáneas en segundo plano (la versión activa puede ser de otro despliegue)"""
+    def exportar():
+        try:
+            exportar_instantaneas()
+        except Exception as e:
+            print(f"⚠️ Error exportando instantáneas al arrancar: {e}")
+    threading.Thread(target=exportar, name='instantaneas-arranque', daemon=True).start()
+
+@al_cambiar_contenido
+def programar_instantaneas(tutorial_id):
+    """Tras un guardado, reexporta en segundo plano (agrupando los que lleguen seguidos)"""
+    if not INSTANTANEAS_AUTO:
+        return
+    with _instantaneas_cond:
+        if _instantaneas['pendiente'] is None:
+            _instantaneas['pendiente'] = time.monotonic()
+        if _instantaneas['hilo'] is None:
+            _instantaneas['hilo'] = threading.Thread(target=_bucle_instantaneas, name='instantaneas', daemon=True)
+            _instantaneas['hilo'].start()
+        _instantaneas_cond.notify()
+
+def instantanea_para(ruta_regla, argumentos, vista):
+    """Archivo de la instantánea que responde a esta petición, o None"""
+    if ruta_regla == '/tutoriales':
+        if set(argumentos) - {'page'}:
+            return None
+        pagina = argumentos.get('page', '1')
+        return f"tutoriales/{pagina}.html" if pagina.isdigit() else None
+    if ruta_regla == '/tutorial/<tutorial_id>' and not argumentos and _ID_VALIDO.match(vista['tutorial_id']):
+        return f"tutorial/{vista['tutorial_id']}.html"
+    return None
+
+def estadisticas_instantaneas():
+    try:
+        activa = os.readlink(_INSTANTANEA_ACTUAL)
+    except OSError:
+        activa = None
+    with _instantaneas_cond:
+        return {
+            'servir': SERVIR_INSTANTANEAS,
+            'auto': INSTANTANEAS_AUTO,
+            'version_activa': activa,
+            'exportaciones': _instantaneas['exportaciones'],
+            'ultima': _instantaneas['ultima'],
+            'pendiente': _instantaneas['pendiente'] is not None
+        }
+
+@app.before_request
+def _servir_instantanea():
+    """Con SERVIR_INSTANTANEAS=1, responde desde la instantánea si la hay (si no, sigue Flask)"""
+    if not SERVIR_INSTANTANEAS or request.method not in ('GET', 'HEAD') or request.url_rule is None:
+        return None
+    relativa = instantanea_para(request.url_rule.rule, request.args, request.view_args)
+    if relativa is None:
+        return None
+    if _instantaneas['version'] is None:
+        _instantaneas['version'] = _version_instantaneas()
+    try:
+        if os.readlink(_INSTANTANEA_ACTUAL) != _instantaneas['version']:
+            return None  # Exportada con otras plantillas o estáticos
+    except OSError:
+        return None
+    ruta = os.path.abspath(os.path.join(_INSTANTANEA_ACTUAL, relativa))
+    codificacion = codificacion_aceptada()
+    variante = ruta + _SUFIJOS_CODIFICACION[codificacion] if codificacion else ruta
+    if not os.path.isfile(variante):
+        codificacion, variante = None, ruta
+        if not os.path.isfile(ruta):
+            return None
+    respuesta = send_file(variante, mimetype='text/html', conditional=True)
+    if codificacion:
+        respuesta.content_encoding = codificacion
+    respuesta.vary.add('Accept-Encoding')
+    respuesta.headers['Cache-Control'] = CACHE_CONTROL_TUTORIALES
+    contar('codeverse_instantaneas_servidas_total')
+    return respuesta
@@ -0,0 +1,182 @@
+"""Límites de peticiones por cliente (cubetas de tokens)"""
+
+from flask import request, render_template, flash, jsonify
+import hashlib
+import json
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+
+try:
+    import fcntl  # Bloqueo entre procesos (Linux/macOS)
+except ImportError:
+    fcntl = None
+
+from . import app
+from .config import CONTENIDO_DIR
+from .metricas import contar
+
+# ==============================
+# 🚦 Límites de peticiones
+# ==============================
+# Cada ruta cara (descargas de TikTok, sincronización, escrituras) tiene dos
+# cubos de fichas: uno por cliente y otro global. Cada cubo se rellena a
+# `tasa` fichas por segundo, hasta `rafaga`. Los cubos viven en cada
+# proceso, como las métricas, así que con varios workers el límite efectivo
+# se multiplica por su número. Las rutas con 'concurrencia' reservan además
+# un turno compartido por todos los workers, con flock sin espera sobre
+# .limites/. Lo que sobra se rechaza al momento con 429 y Retry-After, antes
+# de leer el cuerpo, en vez de quedarse en cola ocupando workers.
+LIMITES_ACTIVOS = os.getenv('LIMITES', '1') == '1'
+# Proxies de confianza que añaden X-Forwarded-For. En Render (que define
+# RENDER=true) hay siempre uno delante: sin contarlo todas las peticiones
+# llegarían con la IP del proxy y compartirían un único cubo por cliente.
+# Detrás de otro proxy o CDN hay que fijarlo a mano.
+LIMITES_PROXIES = int(os.getenv('LIMITES_PROXIES', 1 if os.getenv('RENDER') else 0))
+LIMITES_CLIENTES_MAX = int(os.getenv('LIMITES_CLIENTES_MAX', 10000))  # Cubos por cliente en memoria
+LIMITES_REINTENTO_CONCURRENCIA = 5
+_LIMITES_DIR = os.path.join(CONTENIDO_DIR, '.limites')
+# 'MÉTODO regla': {'cliente': (fichas/s, ráfaga), 'global': (fichas/s, ráfaga), 'concurrencia': n}
+# Se sobrescriben por ruta con LIMITES_RUTAS (JSON); null quita el límite de una ruta.
+LIMITES_RUTAS = {
+    'POST /tiktok-download': {'cliente': (0.2, 5), 'global': (2, 20), 'pagina': 'tiktok.html'},
+    'POST /api/tiktok/jobs': {'cliente': (0.2, 5), 'global': (2, 20)},
+    'GET /api/tiktok/jobs/<job_id>/descarga': {'cliente': (1, 10), 'global': (10, 40)},
+    'POST /api/sincronizar-json': {'cliente': (1 / 60, 3), 'global': (0.1, 5)},
+    'POST /api/tutorial/<tutorial_id>/contenido': {'cliente': (2, 20), 'global': (50, 200)},
+    'POST /api/tutorial/nuevo': {'cliente': (0.5, 10), 'global': (5, 50)},
+    'POST /api/tutoriales/bulk': {'cliente': (0.2, 5), 'global': (1, 10), 'concurrencia': 2},
+    'DELETE /api/tutorial/<tutorial_id>': {'cliente': (1, 20), 'global': (10, 100)},
+}
+
+def _limites_configurados():
+    rutas = {ruta: dict(limites) for ruta, limites in LIMITES_RUTAS.items()}
+    try:
+        extra = json.loads(os.getenv('LIMITES_RUTAS') or '{}')
+        for ruta, limites in extra.items():
+            if limites is None:
+                rutas.pop(ruta, None)
+            else:
+                rutas[ruta] = {**rutas.get(ruta, {}), **limites}
+    except (ValueError, AttributeError, TypeError) as e:
+        print(f"⚠️ LIMITES_RUTAS no es válido, se usan los límites por defecto: {e}")
+        rutas = {ruta: dict(limites) for ruta, limites in LIMITES_RUTAS.items()}
+    return rutas
+
+_limites = _limites_configurados()
+_limites_lock = threading.Lock()
+_cubos_clientes = OrderedDict()  # (ruta, cliente) -> [fichas, time.monotonic() del último relleno]
+_cubos_globales = {}             # ruta -> [fichas, time.monotonic() del último relleno]
+_rechazos = {'cliente': 0, 'global': 0, 'concurrencia': 0}
+
+def cliente_peticion():
+    """IP del cliente; detrás de LIMITES_PROXIES proxies, la que vio el más externo"""
+    if LIMITES_PROXIES > 0:
+        ruta = request.access_route
+        if len(ruta) >= LIMITES_PROXIES:
+            return ruta[-LIMITES_PROXIES]
+    return request.remote_addr or 'desconocido'
+
+def _tomar_ficha(ruta, cliente, limites):
+    """Gasta una ficha del cubo del cliente y del global.
+
+    Devuelve (None, None) si hay fichas, o (segundos hasta la próxima, motivo).
+    Si el cliente ya no tiene, no se toca el cubo global.
+    """
+    ahora = time.monotonic()
+    cubos = []
+    with _limites_lock:
+        for alcance in ('cliente', 'global'):
+            if alcance not in limites:
+                continue
+            tasa, rafaga = limites[alcance]
+            if alcance == 'cliente':
+                tabla, llave = _cubos_clientes, (ruta, cliente)
+            else:
+                tabla, llave = _cubos_globales, ruta
+            cubo = tabla.get(llave)
+            if cubo is None:
+                cubo = tabla[llave] = [rafaga, ahora]
+                if alcance == 'cliente' and len(tabla) > LIMITES_CLIENTES_MAX:
+                    tabla.popitem(last=False)  # El más antiguo: volverá con el cubo lleno
+            else:
+                cubo[0] = min(rafaga, cubo[0] + (ahora - cubo[1]) * tasa)
+                cubo[1] = ahora
+                if alcance == 'cliente':
+                    tabla.move_to_end(llave)
+            if cubo[0] < 1:
+                return (1 - cubo[0]) / tasa, alcance
+            cubos.append(cubo)
+        for cubo in cubos:
+            cubo[0] -= 1
+    return None, None
+
+def _reservar_turno(ruta, concurrencia):
+    """Toma uno de los `concurrencia` turnos de la ruta entre todos los workers, o None.
+
+    El turno es un archivo con flock: se libera al cerrarlo (o al morir el proceso).
+    """
+    os.makedirs(_LIMITES_DIR, exist_ok=True)
+    prefijo = hashlib.sha1(ruta.encode('utf-8')).hexdigest()[:12]
+    for numero in range(concurrencia):
+        turno = open(os.path.join(_LIMITES_DIR, f"{prefijo}.{numero}.lock"), 'a')
+        if fcntl is None:
+            return turno  # Sin flock no hay tope entre workers
+        try:
+            fcntl.flock(turno, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return turno
+        except OSError:
+            turno.close()
+    return None
+
+def respuesta_limitada(motivo, segundos, pagina=None):
+    """429 con Retry-After (JSON, o la plantilla `pagina` con un flash para formularios)"""
+    reintento = max(1, math.ceil(segundos))
+    with _limites_lock:
+        _rechazos[motivo] += 1
+    contar('codeverse_limites_rechazos_total', metodo=request.method,
+           ruta=request.url_rule.rule if request.url_rule is not None else 'sin_ruta', motivo=motivo)
+    if pagina:
+        flash("Hay demasiadas peticiones. Inténtalo en unos segundos.", "error")
+        respuesta = app.make_response(render_template(pagina))
+    else:
+        respuesta = jsonify({"error": "Demasiadas peticiones", "motivo": motivo, "retry_after": reintento})
+    respuesta.status_code = 429
+    respuesta.headers['Retry-After'] = str(reintento)
+    return respuesta
+
+def estadisticas_limites():
+    with _limites_lock:
+        return {
+            'activos': LIMITES_ACTIVOS,
+            'rutas': sorted(_limites),
+            'clientes': len(_cubos_clientes),
+            'rechazos': dict(_rechazos)
+        }
+
+@app.before_request
+def _aplicar_limites():
+    if not LIMITES_ACTIVOS or request.url_rule is None:
+        return None
+    ruta = f"{request.method} {request.url_rule.rule}"
+    limites = _limites.get(ruta)
+    if limites is None:
+        return None
+    espera, motivo = _tomar_ficha(ruta, cliente_peticion(), limites)
+    if espera is None and limites.get('concurrencia'):
+        turno = _reservar_turno(ruta, limites['concurrencia'])
+        if turno is None:
+            espera, motivo = LIMITES_REINTENTO_CONCURRENCIA, 'concurrencia'
+        else:
+            request.environ['codeverse.turno'] = turno
+    if espera is None:
+        return None
+    return respuesta_limitada(motivo, espera, limites.get('pagina'))
+
+@app.teardown_request
+def _liberar_turno(error=None):
+    turno = request.environ.pop('codeverse.turno', None)
+    if turno is not None:
+        turno.close()
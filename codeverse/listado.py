@@ -0,0 +1,272 @@
+"""Listados paginados con cursor, desde Mongo o el índice en memoria"""
+
+from flask import render_template
+from datetime import datetime
+import base64
+import bisect
+import json
+import math
+import os
+import threading
+from bson.objectid import ObjectId
+
+from .metricas import contar_origen
+from .mongo import conectar_mongodb, registrar_fallo_mongodb
+from .almacen import (
+    al_cambiar_contenido, cargar_indice, _leer_cache, metadatos_de, obtener_metadatos, _plegar
+)
+
+# ==============================
+# 📚 Listados paginados, filtrados y ordenados
+# ==============================
+# Los filtros (language, level), el orden y la página se resuelven en Mongo
+# con índices que los cubren. Sin Mongo se usa un índice secundario en
+# memoria (conjuntos por lenguaje/nivel y listas ordenadas) que se mantiene
+# con al_cambiar_contenido. La paginación admite page o un cursor opaco.
+LISTADO_LIMITE_DEFECTO = 50
+LISTADO_LIMITE_MAX = 200
+TUTORIALES_POR_PAGINA = int(os.getenv('TUTORIALES_POR_PAGINA', 24))
+ORDENES_LISTADO = {
+    # orden: (campo en Mongo, campo en el índice en memoria, dirección)
+    'title': ('title', 'title', 1),
+    '-title': ('title', 'title', -1),
+    'recientes': ('updatedAt', 'recientes', -1),
+}
+CAMPOS_LISTADO = {"_id": 1, "title": 1, "description": 1, "level": 1, "duration": 1, "language": 1}
+
+_listado_lock = threading.Lock()
+_indice_listado = {
+    'construido': False,
+    'claves': {},       # tutorial_id -> (language, level, clave de título, lastUpdated)
+    'language': {},     # language -> set(ids)
+    'level': {},        # level -> set(ids)
+    'title': [],        # [(clave de título, id)] ordenada
+    'recientes': [],    # [(lastUpdated, id)] ordenada
+}
+_POSICION_ORDEN = {'title': 2, 'recientes': 3}
+
+def _codificar_cursor(valor, tutorial_id):
+    crudo = json.dumps([valor, tutorial_id], default=str).encode('utf-8')
+    return base64.urlsafe_b64encode(crudo).decode('ascii')
+
+def _decodificar_cursor(cursor, orden):
+    """(valor, id) del cursor. Lanza ValueError si no es uno nuestro.
+
+    Solo se aceptan cadenas (y None como valor): un objeto acabaría como
+    operador dentro del $or de la consulta de Mongo.
+    """
+    try:
+        valor, tutorial_id = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+    except Exception:
+        raise ValueError("cursor no válido")
+    if not isinstance(tutorial_id, str) or not (valor is None or isinstance(valor, str)):
+        raise ValueError("cursor no válido")
+    if ORDENES_LISTADO[orden][0] == 'updatedAt' and valor:
+        try:
+            datetime.fromisoformat(valor)
+        except ValueError:
+            raise ValueError("cursor no válido")
+    return valor, tutorial_id
+
+def parametros_listado(args, limite_defecto=LISTADO_LIMITE_DEFECTO):
+    """Valida page/limit/cursor/language/level/sort. Lanza ValueError si algo no cuadra"""
+    try:
+        pagina = max(int(args.get('page', 1)), 1)
+        limite = min(max(int(args.get('limit', limite_defecto)), 1), LISTADO_LIMITE_MAX)
+    except ValueError:
+        raise ValueError("page y limit deben ser números")
+    orden = args.get('sort', 'title')
+    if orden not in ORDENES_LISTADO:
+        raise ValueError(f"sort debe ser uno de: {', '.join(ORDENES_LISTADO)}")
+    cursor = args.get('cursor')
+    return {
+        'language': (args.get('language') or '').strip().lower() or None,
+        'level': (args.get('level') or '').strip().lower() or None,
+        'sort': orden,
+        'page': pagina,
+        'limit': limite,
+        'cursor': _decodificar_cursor(cursor, orden) if cursor else None,
+    }
+
+def _resumen_tutorial(tutorial_id, contenido, metadatos=None):
+    # Los campos derivados solo existen en el índice local de metadatos
+    metadatos = metadatos if metadatos is not None else contenido
+    return {
+        '_id': tutorial_id,
+        'title': contenido.get('title', 'Sin título'),
+        'description': contenido.get('description', ''),
+        'level': contenido.get('level', 'principiante'),
+        'duration': contenido.get('duration', '0'),
+        'language': contenido.get('language', 'python'),
+        'minutos_lectura': metadatos.get('minutos_lectura')
+    }
+
+def _claves_listado(contenido):
+    return (
+        (contenido.get('language') or 'python').lower(),
+        (contenido.get('level') or 'principiante').lower(),
+        _plegar(contenido.get('title') or ''),
+        contenido.get('lastUpdated') or ''
+    )
+
+def _quitar_del_listado(tutorial_id):
+    claves = _indice_listado['claves'].pop(tutorial_id, None)
+    if claves is None:
+        return
+    _indice_listado['language'].get(claves[0], set()).discard(tutorial_id)
+    _indice_listado['level'].get(claves[1], set()).discard(tutorial_id)
+    for nombre, posicion in _POSICION_ORDEN.items():
+        lista = _indice_listado[nombre]
+        i = bisect.bisect_left(lista, (claves[posicion], tutorial_id))
+        if i < len(lista) and lista[i] == (claves[posicion], tutorial_id):
+            del lista[i]
+
+def _poner_en_listado(tutorial_id, contenido):
+    claves = _claves_listado(contenido)
+    _indice_listado['claves'][tutorial_id] = claves
+    _indice_listado['language'].setdefault(claves[0], set()).add(tutorial_id)
+    _indice_listado['level'].setdefault(claves[1], set()).add(tutorial_id)
+    for nombre, posicion in _POSICION_ORDEN.items():
+        bisect.insort(_indice_listado[nombre], (claves[posicion], tutorial_id))
+
+@al_cambiar_contenido
+def actualizar_indice_listado(tutorial_id):
+    """Mantiene el índice secundario del listado al día"""
+    with _listado_lock:
+        if not _indice_listado['construido']:
+            return
+    contenido = obtener_metadatos(tutorial_id)
+    with _listado_lock:
+        _quitar_del_listado(tutorial_id)
+        if contenido is not None:
+            _poner_en_listado(tutorial_id, contenido)
+
+def _asegurar_indice_listado():
+    contenidos = None
+    with _listado_lock:
+        if _indice_listado['construido']:
+            return
+    contenidos = cargar_indice()
+    with _listado_lock:
+        if _indice_listado['construido']:
+            return
+        for tutorial_id, contenido in contenidos.items():
+            _poner_en_listado(tutorial_id, contenido)
+        _indice_listado['construido'] = True
+
+def _listar_json(parametros):
+    """Listado desde el almacén local usando el índice secundario"""
+    _leer_cache(lambda indice: None)  # Pone la caché al día y notifica cambios
+    _asegurar_indice_listado()
+    _, nombre, direccion = ORDENES_LISTADO[parametros['sort']]
+    limite = parametros['limit']
+    with _listado_lock:
+        candidatos = None
+        for filtro in ('language', 'level'):
+            if parametros[filtro]:
+                ids = _indice_listado[filtro].get(parametros[filtro], set())
+                candidatos = set(ids) if candidatos is None else candidatos & ids
+        if candidatos is None:
+            ordenados = _indice_listado[nombre]
+        else:
+            posicion = _POSICION_ORDEN[nombre]
+            ordenados = sorted((_indice_listado['claves'][tid][posicion], tid) for tid in candidatos)
+
+        total = len(ordenados)
+        # El índice guarda '' donde Mongo tiene None
+        cursor = (parametros['cursor'][0] or '', parametros['cursor'][1]) if parametros['cursor'] else None
+        if direccion == 1:
+            inicio = bisect.bisect_right(ordenados, cursor) if cursor else (parametros['page'] - 1) * limite
+            pagina = ordenados[inicio:inicio + limite]
+            hay_mas = inicio + limite < total
+        else:
+            fin = bisect.bisect_left(ordenados, cursor) if cursor else total - (parametros['page'] - 1) * limite
+            fin = max(fin, 0)
+            pagina = ordenados[max(fin - limite, 0):fin][::-1]
+            hay_mas = fin - limite > 0
+
+    indice = metadatos_de([tutorial_id for _, tutorial_id in pagina])
+    datos = [
+        _resumen_tutorial(tutorial_id, indice[tutorial_id])
+        for _, tutorial_id in pagina if tutorial_id in indice
+    ]
+    return {
+        'data': datos,
+        'total': total,
+        'next_cursor': _codificar_cursor(*pagina[-1]) if hay_mas and pagina else None
+    }
+
+def _listar_mongodb(coleccion, parametros):
+    """Listado resuelto en Mongo (filtro, orden y límite en la consulta)"""
+    campo, _, direccion = ORDENES_LISTADO[parametros['sort']]
+    limite = parametros['limit']
+    filtro = {k: parametros[k] for k in ('language', 'level') if parametros[k]}
+    total = coleccion.count_documents(filtro)
+
+    consulta = dict(filtro)
+    if parametros['cursor']:
+        valor, ultimo_id = parametros['cursor']
+        if campo == 'updatedAt' and valor:
+            valor = datetime.fromisoformat(valor)
+        ultimo_id = ObjectId(ultimo_id) if ObjectId.is_valid(ultimo_id) else ultimo_id
+        operador = '$gt' if direccion == 1 else '$lt'
+        consulta['$or'] = [{campo: {operador: valor}}, {campo: valor, '_id': {operador: ultimo_id}}]
+
+    resultado = coleccion.find(consulta, {**CAMPOS_LISTADO, campo: 1}).sort([(campo, direccion), ('_id', direccion)])
+    if not parametros['cursor']:
+        resultado = resultado.skip((parametros['page'] - 1) * limite)
+    documentos = list(resultado.limit(limite + 1))
+    hay_mas = len(documentos) > limite
+    documentos = documentos[:limite]
+
+    siguiente = None
+    if hay_mas and documentos:
+        ultimo = documentos[-1]
+        valor = ultimo.get(campo)
+        siguiente = _codificar_cursor(valor.isoformat() if isinstance(valor, datetime) else valor, str(ultimo['_id']))
+    metadatos = metadatos_de([str(d['_id']) for d in documentos])
+    return {
+        'data': [
+            _resumen_tutorial(str(d['_id']), d, metadatos.get(str(d['_id']), {}))
+            for d in documentos
+        ],
+        'total': total,
+        'next_cursor': siguiente
+    }
+
+def listar_tutoriales(parametros):
+    """Listado paginado desde Mongo o, si no está disponible, desde el JSON"""
+    tutorials_collection = conectar_mongodb()
+    if tutorials_collection is not None:
+        try:
+            resultado = _listar_mongodb(tutorials_collection, parametros)
+            contar_origen('listado', 'mongodb')
+            return resultado
+        except Exception as e:
+            registrar_fallo_mongodb(e)
+            print(f"Error consultando MongoDB: {e}")
+    contar_origen('listado', 'json')
+    return _listar_json(parametros)
+
+def renderizar_listado(parametros, resultado):
+    """HTML de una página del listado (lo usan la ruta y las instantáneas)"""
+    paginas = max(1, math.ceil(resultado['total'] / parametros['limit']))
+    filtros = {k: parametros[k] for k in ('language', 'level') if parametros[k]}
+    if parametros['sort'] != 'title':
+        filtros['sort'] = parametros['sort']
+    if parametros['limit'] != TUTORIALES_POR_PAGINA:
+        filtros['limit'] = parametros['limit']
+    return render_template(
+        'tutoriales.html',
+        compartida=True,
+        tutoriales=resultado['data'],
+        paginacion={
+            'page': parametros['page'],
+            'pages': paginas,
+            'total': resultado['total'],
+            'language': parametros['language'] or 'all',
+            'level': parametros['level'] or 'all',
+            'sort': parametros['sort'],
+            'filtros': filtros
+        }
+    )
@@ -0,0 +1,209 @@
+"""Operaciones en lote sobre tutoriales (/api/tutoriales/bulk)"""
+
+from pymongo import DeleteOne, InsertOne, UpdateOne
+from pymongo.errors import BulkWriteError
+from datetime import datetime
+import os
+from bson.objectid import ObjectId
+
+from .config import TOMBSTONES_COLLECTION
+from .mongo import ahora_utc, conectar_mongodb, registrar_fallo_mongodb
+from .almacen import (
+    _aplicar_cambios, _bloqueo_almacen, _ID_VALIDO, obtener_contenido, obtener_metadatos
+)
+from .escrituras import descartar_escrituras
+
+# ==============================
+# 📦 Operaciones en lote
+# ==============================
+# /api/tutoriales/bulk recibe muchas altas, ediciones y bajas a la vez y las
+# aplica con una sola consulta previa, un solo bulk_write en Mongo y una
+# sola escritura del almacén (un único rehacer del índice de metadatos).
+BULK_MAX_OPERACIONES = int(os.getenv('BULK_MAX_OPERACIONES', 500))
+CAMPOS_EDITABLES = ('title', 'language', 'level', 'duration', 'description', 'content')
+
+def _error_lote(indice, mensaje, codigo=400):
+    return {'indice': indice, 'success': False, 'error': mensaje, 'codigo': codigo}
+
+def _validar_operacion(indice, operacion):
+    """Normaliza una operación del lote o devuelve su resultado de error"""
+    if not isinstance(operacion, dict):
+        return None, _error_lote(indice, "Operación no válida")
+    tipo = operacion.get('op')
+    datos = operacion.get('datos') or {}
+    if tipo not in ('crear', 'actualizar', 'eliminar'):
+        return None, _error_lote(indice, "op debe ser crear, actualizar o eliminar")
+    if not isinstance(datos, dict):
+        return None, _error_lote(indice, "datos debe ser un objeto")
+    if tipo == 'crear':
+        if not datos.get('title') or not datos.get('description') or not datos.get('duration'):
+            return None, _error_lote(indice, "Faltan campos requeridos")
+        tutorial_id = str(ObjectId())
+    else:
+        tutorial_id = str(operacion.get('id') or '')
+        if not _ID_VALIDO.match(tutorial_id):
+            return None, _error_lote(indice, "ID de tutorial no válido")
+    return {'indice': indice, 'op': tipo, 'id': tutorial_id, 'datos': datos}, None
+
+def _ediciones_sin_efecto(coleccion, ediciones, coincidentes):
+    """Índices de las ediciones ejecutadas ({indice: ObjectId}) que no encontraron su documento.
+
+    coincidentes es el nMatched del bulk_write: si cuadra con lo enviado,
+    todas lo encontraron; si no (alguien lo borró entre la consulta previa
+    y el lote) se mira en Mongo cuáles siguen existiendo.
+    """
+    if coincidentes == len(ediciones):
+        return set()
+    try:
+        existen = {d['_id'] for d in coleccion.find({'_id': {'$in': list(ediciones.values())}}, {'_id': 1})}
+    except Exception as e:
+        registrar_fallo_mongodb(e)
+        return set(ediciones)
+    return {indice for indice, oid in ediciones.items() if oid not in existen}
+
+def aplicar_lote_tutoriales(operaciones):
+    """Aplica un lote de operaciones y devuelve un resultado por operación, en orden"""
+    resultados = [None] * len(operaciones)
+    validas = []
+    for indice, operacion in enumerate(operaciones):
+        valida, error = _validar_operacion(indice, operacion)
+        if error is not None:
+            resultados[indice] = error
+        else:
+            validas.append(valida)
+
+    # El lote manda sobre los autoguardados del editor que sigan en cola
+    descartar_escrituras({o['id'] for o in validas})
+
+    tutorials_collection = conectar_mongodb()
+    ids_mongo = {
+        o['id'] for o in validas if o['op'] != 'crear' and ObjectId.is_valid(o['id'])
+    }
+    en_mongo = {}
+    if tutorials_collection is not None and ids_mongo:
+        try:
+            for doc in tutorials_collection.find(
+                {'_id': {'$in': [ObjectId(tid) for tid in ids_mongo]}},
+                {campo: 1 for campo in CAMPOS_EDITABLES}
+            ):
+                en_mongo[str(doc.pop('_id'))] = doc
+        except Exception as e:
+            registrar_fallo_mongodb(e)
+            print(f"⚠️ No se pudo consultar MongoDB: {e}")
+            tutorials_collection = None
+
+    # Estado local que va viendo cada operación (dos ediciones seguidas del
+    # mismo id, o una edición y después su baja, se resuelven en orden; un
+    # alta siempre estrena id, así que nunca coincide con otra operación)
+    locales = {}
+    cambios, eliminados = {}, set()
+    peticiones, origenes, objetivos, aplicadas = [], [], [], []
+    # Con Mongo disponible solo se le mandan ediciones y bajas de lo que tiene:
+    # un tutorial solo local no debe aparecer como aplicado en Mongo
+    enviar_a_mongo = set(en_mongo) if tutorials_collection is not None else ids_mongo
+    ahora = ahora_utc()
+    for operacion in validas:
+        tutorial_id, datos, tipo = operacion['id'], operacion['datos'], operacion['op']
+        if tutorial_id not in locales:
+            # Para borrar basta saber que existe: no hace falta leer el cuerpo
+            leer = obtener_metadatos if tipo == 'eliminar' else obtener_contenido
+            locales[tutorial_id] = leer(tutorial_id)
+        actual = locales[tutorial_id] or en_mongo.get(tutorial_id)
+
+        if tipo != 'crear' and not actual:
+            resultados[operacion['indice']] = _error_lote(operacion['indice'], "Tutorial no encontrado", 404)
+            continue
+
+        if tipo == 'eliminar':
+            locales[tutorial_id] = None
+            en_mongo.pop(tutorial_id, None)
+            cambios.pop(tutorial_id, None)
+            eliminados.add(tutorial_id)
+            if tutorial_id in enviar_a_mongo:
+                enviar_a_mongo.discard(tutorial_id)
+                origenes.append(operacion['indice'])
+                objetivos.append((tipo, tutorial_id))
+                peticiones.append(DeleteOne({'_id': ObjectId(tutorial_id)}))
+        else:
+            base = actual or {'language': 'python', 'level': 'principiante', 'content': ''}
+            contenido = {campo: datos.get(campo, base.get(campo)) for campo in CAMPOS_EDITABLES}
+            contenido['lastUpdated'] = datetime.now().isoformat()
+            locales[tutorial_id] = contenido
+            cambios[tutorial_id] = contenido
+            eliminados.discard(tutorial_id)
+            if tipo == 'crear':
+                origenes.append(operacion['indice'])
+                objetivos.append((tipo, tutorial_id))
+                peticiones.append(InsertOne({
+                    '_id': ObjectId(tutorial_id),
+                    **{campo: contenido[campo] for campo in CAMPOS_EDITABLES},
+                    'createdAt': datetime.now(),
+                    'updatedAt': ahora
+                }))
+            elif tutorial_id in enviar_a_mongo:
+                cambiados = {campo: datos[campo] for campo in CAMPOS_EDITABLES if campo in datos}
+                origenes.append(operacion['indice'])
+                objetivos.append((tipo, tutorial_id))
+                peticiones.append(UpdateOne(
+                    {'_id': ObjectId(tutorial_id)},
+                    {'$set': {**cambiados, 'updatedAt': ahora}}
+                ))
+        aplicadas.append(operacion)
+
+    with _bloqueo_almacen():
+        _aplicar_cambios(cambios, eliminados)
+
+    # Operaciones que no llegaron a Mongo: {indice: motivo}. Con ordered=True
+    # un error detiene el lote, así que lo posterior tampoco se aplicó.
+    fallidas_mongo = {}
+    if tutorials_collection is None:
+        fallidas_mongo = dict.fromkeys(origenes, "MongoDB no disponible")
+    elif peticiones:
+        try:
+            ejecutadas = len(peticiones)
+            coincidentes = tutorials_collection.bulk_write(peticiones, ordered=True).matched_count
+        except BulkWriteError as e:
+            # writeErrors[0]['index'] es la posición en peticiones de la que paró el lote
+            error = e.details['writeErrors'][0]
+            ejecutadas, coincidentes = error['index'], e.details['nMatched']
+            fallidas_mongo[origenes[error['index']]] = error.get('errmsg', 'Error de escritura')
+            for indice in origenes[error['index'] + 1:]:
+                fallidas_mongo.setdefault(indice, "No aplicada tras un error anterior")
+        except Exception as e:
+            registrar_fallo_mongodb(e)
+            print(f"⚠️ No se pudo aplicar el lote en MongoDB: {e}")
+            ejecutadas, coincidentes = 0, 0
+            fallidas_mongo = dict.fromkeys(origenes, "MongoDB no disponible")
+        ediciones = {
+            indice: ObjectId(tutorial_id)
+            for indice, (tipo, tutorial_id) in zip(origenes[:ejecutadas], objetivos[:ejecutadas])
+            if tipo == 'actualizar'
+        }
+        for indice in _ediciones_sin_efecto(tutorials_collection, ediciones, coincidentes):
+            fallidas_mongo[indice] = "No encontrado en MongoDB"
+
+        # Lápidas solo de las bajas que llegaron a ejecutarse (tras ellas el
+        # documento no existe), para que la sincronización incremental las vea
+        lapidas = [
+            {'tutorial_id': tutorial_id, 'deletedAt': ahora}
+            for tipo, tutorial_id in objetivos[:ejecutadas] if tipo == 'eliminar'
+        ]
+        if lapidas:
+            try:
+                tutorials_collection.database[TOMBSTONES_COLLECTION].insert_many(lapidas, ordered=False)
+            except Exception as e:
+                registrar_fallo_mongodb(e)
+                print(f"⚠️ No se pudieron guardar las lápidas: {e}")
+
+    for operacion in aplicadas:
+        resultado = {
+            'indice': operacion['indice'],
+            'success': True,
+            'op': operacion['op'],
+            'tutorial_id': operacion['id'],
+            'mongodb': operacion['indice'] in origenes and operacion['indice'] not in fallidas_mongo
+        }
+        if operacion['indice'] in fallidas_mongo:
+            resultado['aviso'] = fallidas_mongo[operacion['indice']]
+        resultados[operacion['indice']] = resultado
+    return resultados
@@ -0,0 +1,169 @@
+"""Métricas del proceso (histogramas y contadores) en formato Prometheus"""
+
+from flask import request
+from pymongo import monitoring
+import bisect
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from . import app
+
+# ==============================
+# 📈 Métricas (formato Prometheus)
+# ==============================
+# Histogramas y contadores en memoria del proceso, expuestos en /api/metrics.
+# Cada observación es una búsqueda en un dict y unas sumas bajo un lock, así
+# que pueden quedarse activadas en producción. Con varios workers cada uno
+# publica las suyas con la etiqueta pid.
+LATENCIA_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+_metricas_lock = threading.Lock()
+_metricas = {
+    'histogramas': {},   # (nombre, etiquetas) -> [cuentas por bucket..., suma, total]
+    'contadores': {},    # (nombre, etiquetas) -> valor
+}
+AYUDA_METRICAS = {
+    'codeverse_http_peticion_segundos': 'Latencia de las peticiones HTTP por ruta',
+    'codeverse_http_peticiones_total': 'Peticiones HTTP por ruta y código',
+    'codeverse_mongo_comando_segundos': 'Duración de los comandos enviados a MongoDB',
+    'codeverse_mongo_errores_total': 'Comandos de MongoDB fallidos',
+    'codeverse_mongo_disponible_total': 'Llamadas a conectar_mongodb según el estado del breaker',
+    'codeverse_mongo_conectado': '1 si el breaker de MongoDB está cerrado',
+    'codeverse_origen_datos_total': 'Peticiones servidas desde MongoDB o desde el almacén JSON',
+    'codeverse_almacen_segundos': 'Lecturas y escrituras del almacén JSON',
+    'codeverse_cache_total': 'Aciertos y fallos de las cachés en memoria',
+    'codeverse_cache_bytes': 'Bytes ocupados por cada caché en memoria',
+    'codeverse_resaltado_segundos': 'Tiempo en resaltar el código de un tutorial con Pygments',
+    'codeverse_revisiones_total': 'Revisiones registradas en el historial, por tipo',
+    'codeverse_revisiones_bytes_total': 'Bytes añadidos a los historiales de revisiones',
+    'codeverse_instantaneas_segundos': 'Duración de cada exportación de instantáneas',
+    'codeverse_instantaneas_servidas_total': 'Páginas servidas desde las instantáneas estáticas',
+    'codeverse_cache_invalidaciones_total': 'Cambios de otros workers aplicados a la caché de contenidos',
+    'codeverse_limites_rechazos_total': 'Peticiones rechazadas con 429 por los límites, por ruta y motivo',
+    'codeverse_sincronizacion_compartida_total': 'Sincronizaciones que recibieron el resultado de otra en curso',
+    'codeverse_escrituras_pendientes': 'Guardados diferidos sin aplicar',
+    'codeverse_escrituras_total': 'Guardados diferidos recibidos y coalescidos',
+    'codeverse_tiktok_segundos': 'Llamadas salientes a tikwm y a la CDN de TikTok',
+    'codeverse_tiktok_cache_total': 'Descargas pedidas según si el video ya estaba en caché',
+    'codeverse_tiktok_pendientes': 'Descargas de TikTok en cola o en curso',
+}
+
+def _etiquetas(etiquetas):
+    return tuple(sorted(etiquetas.items()))
+
+def observar(nombre, segundos, **etiquetas):
+    """Registra una duración en el histograma nombre{etiquetas}"""
+    clave = (nombre, _etiquetas(etiquetas))
+    posicion = bisect.bisect_left(LATENCIA_BUCKETS, segundos)
+    with _metricas_lock:
+        serie = _metricas['histogramas'].get(clave)
+        if serie is None:
+            serie = _metricas['histogramas'][clave] = [0] * (len(LATENCIA_BUCKETS) + 2)
+        if posicion < len(LATENCIA_BUCKETS):
+            serie[posicion] += 1
+        serie[-2] += segundos
+        serie[-1] += 1
+
+def contar(nombre, valor=1, **etiquetas):
+    """Suma valor al contador nombre{etiquetas}"""
+    clave = (nombre, _etiquetas(etiquetas))
+    with _metricas_lock:
+        _metricas['contadores'][clave] = _metricas['contadores'].get(clave, 0) + valor
+
+@contextmanager
+def medir(nombre, **etiquetas):
+    """with medir('...'): registra la duración del bloque, falle o no"""
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        observar(nombre, time.perf_counter() - inicio, **etiquetas)
+
+def _formatear_etiquetas(etiquetas):
+    if not etiquetas:
+        return ''
+    pares = ','.join(
+        '{}="{}"'.format(k, str(v).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for k, v in etiquetas
+    )
+    return '{' + pares + '}'
+
+def exportar_metricas(calculadas=()):
+    """Texto en formato de exposición de Prometheus (0.0.4).
+
+    calculadas son (nombre, tipo, etiquetas, valor) que no se acumulan
+    aquí (aciertos de cachés, tamaño de colas...).
+    """
+    pid = ('pid', str(os.getpid()))
+    with _metricas_lock:
+        histogramas = {c: list(v) for c, v in _metricas['histogramas'].items()}
+        contadores = dict(_metricas['contadores'])
+
+    lineas = []
+    def cabecera(nombre, tipo):
+        if nombre in AYUDA_METRICAS:
+            lineas.append(f"# HELP {nombre} {AYUDA_METRICAS[nombre]}")
+        lineas.append(f"# TYPE {nombre} {tipo}")
+
+    for nombre in sorted({c[0] for c in histogramas}):
+        cabecera(nombre, 'histogram')
+        for (serie_nombre, etiquetas), valores in sorted(histogramas.items()):
+            if serie_nombre != nombre:
+                continue
+            acumulado = 0
+            for limite, cuenta in zip(LATENCIA_BUCKETS, valores):
+                acumulado += cuenta
+                lineas.append(f"{nombre}_bucket{_formatear_etiquetas(etiquetas + (pid, ('le', repr(float(limite)))))} {acumulado}")
+            lineas.append(f"{nombre}_bucket{_formatear_etiquetas(etiquetas + (pid, ('le', '+Inf')))} {valores[-1]}")
+            lineas.append(f"{nombre}_sum{_formatear_etiquetas(etiquetas + (pid,))} {valores[-2]:.6f}")
+            lineas.append(f"{nombre}_count{_formatear_etiquetas(etiquetas + (pid,))} {valores[-1]}")
+
+    for nombre in sorted({c[0] for c in contadores}):
+        cabecera(nombre, 'counter')
+        for (serie_nombre, etiquetas), valor in sorted(contadores.items()):
+            if serie_nombre == nombre:
+                lineas.append(f"{nombre}{_formatear_etiquetas(etiquetas + (pid,))} {valor}")
+
+    vistos = set()
+    for nombre, tipo, etiquetas, valor in calculadas:
+        if nombre not in vistos:
+            cabecera(nombre, tipo)
+            vistos.add(nombre)
+        lineas.append(f"{nombre}{_formatear_etiquetas(_etiquetas(etiquetas) + (pid,))} {valor}")
+    return '\n'.join(lineas) + '\n'
+
+class _EscuchaMongo(monitoring.CommandListener):
+    """Mide cada comando que el driver envía a Mongo (find, update, ping...)"""
+
+    def started(self, event):
+        pass
+
+    def succeeded(self, event):
+        observar('codeverse_mongo_comando_segundos', event.duration_micros / 1e6,
+                 comando=event.command_name)
+
+    def failed(self, event):
+        observar('codeverse_mongo_comando_segundos', event.duration_micros / 1e6,
+                 comando=event.command_name)
+        contar('codeverse_mongo_errores_total', 1, comando=event.command_name)
+
+def contar_origen(uso, origen):
+    """Cuenta si una petición se sirvió desde Mongo o desde el almacén local"""
+    contar('codeverse_origen_datos_total', 1, uso=uso, origen=origen)
+
+@app.before_request
+def _iniciar_cronometro():
+    request.environ['codeverse.inicio'] = time.perf_counter()
+
+@app.after_request
+def _registrar_peticion(respuesta):
+    inicio = request.environ.get('codeverse.inicio')
+    if inicio is not None:
+        # La regla (/tutorial/<tutorial_id>) y no la URL, para no crear una serie por id
+        ruta = request.url_rule.rule if request.url_rule is not None else 'sin_ruta'
+        observar('codeverse_http_peticion_segundos', time.perf_counter() - inicio,
+                 ruta=ruta, metodo=request.method)
+        contar('codeverse_http_peticiones_total', 1, ruta=ruta, metodo=request.method, codigo=respuesta.status_code)
+    return respuesta
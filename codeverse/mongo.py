@@ -0,0 +1,170 @@
+"""Conexión a MongoDB: cliente único por proceso con circuit breaker"""
+
+from pymongo import MongoClient
+from pymongo.errors import ConfigurationError, ConnectionFailure
+from datetime import datetime, timezone
+import os
+import threading
+import time
+
+from .config import COLLECTION_NAME, DB_NAME, MONGO_URI, TOMBSTONES_COLLECTION
+from .metricas import contar, _EscuchaMongo
+
+# ==============================
+# 🧠 Conexión a MongoDB Atlas
+# ==============================
+# Un único MongoClient por proceso (con su pool). Si Atlas cae se abre un
+# circuit breaker: conectar_mongodb() devuelve None al instante y las rutas
+# usan el JSON, mientras un hilo en segundo plano reintenta con backoff
+# exponencial y cierra el breaker cuando el ping vuelve a responder.
+MONGO_POOL_MAX = int(os.getenv('MONGO_POOL_MAX', 20))
+MONGO_TIMEOUT_MS = int(os.getenv('MONGO_TIMEOUT_MS', 2000))
+MONGO_BACKOFF_INICIAL = float(os.getenv('MONGO_BACKOFF_INICIAL', 1))
+MONGO_BACKOFF_MAX = float(os.getenv('MONGO_BACKOFF_MAX', 60))
+# TLS lo decide la URI (mongodb+srv:// lo activa, ?tls=true para un mongod
+# propio). Saltarse la verificación del certificado solo si se pide aquí.
+MONGO_TLS_INSEGURO = os.getenv('MONGO_TLS_INSEGURO', '0') == '1'
+
+_mongo_lock = threading.Lock()
+_mongo = {
+    'client': None,
+    'coleccion': None,
+    'breaker': 'abierto',      # 'cerrado' = Mongo disponible, 'abierto' = usar JSON
+    'ultimo_error': None,
+    'fallos': 0,
+    'reconectando': False,
+    'indices': False,          # índices de listado creados en este proceso
+}
+
+def _crear_cliente_mongo():
+    """Crea el MongoClient del proceso con el pool ajustado"""
+    opciones = {'tlsAllowInvalidCertificates': True} if MONGO_TLS_INSEGURO else {}
+    return MongoClient(
+        MONGO_URI,
+        maxPoolSize=MONGO_POOL_MAX,
+        minPoolSize=0,
+        maxIdleTimeMS=60000,
+        serverSelectionTimeoutMS=MONGO_TIMEOUT_MS,
+        connectTimeoutMS=MONGO_TIMEOUT_MS,
+        socketTimeoutMS=MONGO_TIMEOUT_MS * 5,
+        event_listeners=[_EscuchaMongo()],
+        **opciones
+    )
+
+def _ping_mongodb():
+    """Un intento de conexión. Devuelve True si Mongo respondió"""
+    try:
+        with _mongo_lock:
+            if _mongo['client'] is None:
+                _mongo['client'] = _crear_cliente_mongo()
+            client = _mongo['client']
+        client.admin.command('ping')
+    except Exception as e:
+        with _mongo_lock:
+            _mongo['ultimo_error'] = str(e)
+        return False
+    coleccion = client[DB_NAME][COLLECTION_NAME]
+    # Se reserva la marca bajo el lock para que solo un hilo cree los índices
+    # (sin retener el lock durante la llamada de red) y se libera si falla.
+    with _mongo_lock:
+        crear_indices = not _mongo['indices']
+        _mongo['indices'] = True
+    if crear_indices:
+        try:
+            asegurar_indices_mongodb(coleccion)
+        except Exception as e:
+            with _mongo_lock:
+                _mongo['indices'] = False
+            print(f"⚠️ No se pudieron crear los índices de MongoDB: {e}")
+    with _mongo_lock:
+        _mongo['coleccion'] = coleccion
+        _mongo['breaker'] = 'cerrado'
+        _mongo['fallos'] = 0
+        _mongo['ultimo_error'] = None
+    print("✅ Conectado a MongoDB Atlas")
+    return True
+
+def _bucle_reconexion():
+    """Hilo de fondo: reintenta con backoff exponencial hasta reconectar"""
+    espera = MONGO_BACKOFF_INICIAL
+    while not _ping_mongodb():
+        if espera == MONGO_BACKOFF_INICIAL:
+            print(f"❌ Error al conectar a MongoDB: {_mongo['ultimo_error']}")
+        time.sleep(espera)
+        espera = min(espera * 2, MONGO_BACKOFF_MAX)
+    with _mongo_lock:
+        _mongo['reconectando'] = False
+
+def _lanzar_reconexion():
+    """Arranca el hilo de reconexión si no hay uno en marcha"""
+    with _mongo_lock:
+        if _mongo['reconectando']:
+            return
+        _mongo['reconectando'] = True
+    threading.Thread(target=_bucle_reconexion, name='mongo-reconexion', daemon=True).start()
+
+def registrar_fallo_mongodb(error):
+    """Abre el breaker si el error es de conexión (no por datos inválidos)"""
+    if not isinstance(error, (ConnectionFailure, ConfigurationError)):
+        return
+    with _mongo_lock:
+        _mongo['fallos'] += 1
+        _mongo['ultimo_error'] = str(error)
+        if _mongo['breaker'] == 'abierto':
+            return
+        _mongo['breaker'] = 'abierto'
+    print(f"⚠️ MongoDB no disponible, usando JSON: {error}")
+    _lanzar_reconexion()
+
+def conectar_mongodb():
+    """Devuelve la colección si Mongo está disponible o None sin bloquear"""
+    with _mongo_lock:
+        coleccion = _mongo['coleccion'] if _mongo['breaker'] == 'cerrado' else None
+    contar('codeverse_mongo_disponible_total', 1, resultado='si' if coleccion is not None else 'no')
+    if coleccion is None:
+        _lanzar_reconexion()
+    return coleccion
+
+def estado_mongodb():
+    """Estado del breaker para /api/health"""
+    with _mongo_lock:
+        return {
+            'breaker': _mongo['breaker'],
+            'fallos': _mongo['fallos'],
+            'reconectando': _mongo['reconectando'],
+            'ultimo_error': _mongo['ultimo_error']
+        }
+
+def mongo_conectado():
+    """True si el breaker está cerrado (Mongo respondiendo), sin intentar conectar"""
+    with _mongo_lock:
+        return _mongo['breaker'] == 'cerrado'
+
+def iniciar_mongodb(esperar=False):
+    """Conecta en segundo plano: hasta entonces las rutas leen del almacén local.
+
+    Con esperar=True el primer intento se hace en este hilo (acotado por
+    MONGO_TIMEOUT_MS) y solo los reintentos quedan en segundo plano.
+    """
+    if esperar and _ping_mongodb():
+        return
+    _lanzar_reconexion()
+
+def ahora_utc():
+    """Fecha actual en UTC (la que se guarda como updatedAt en Mongo)"""
+    return datetime.now(timezone.utc)
+
+# Índices de los listados (filtro + orden estable por _id) y de la sincronización
+INDICES_MONGODB = [
+    [('title', 1), ('_id', 1)],
+    [('language', 1), ('title', 1), ('_id', 1)],
+    [('level', 1), ('title', 1), ('_id', 1)],
+    [('language', 1), ('level', 1), ('title', 1), ('_id', 1)],
+    [('updatedAt', -1), ('_id', -1)],
+]
+
+def asegurar_indices_mongodb(coleccion):
+    """Crea (si faltan) los índices que usan los listados y la sincronización"""
+    for claves in INDICES_MONGODB:
+        coleccion.create_index(claves)
+    coleccion.database[TOMBSTONES_COLLECTION].create_index('deletedAt')
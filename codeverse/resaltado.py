@@ -0,0 +1,231 @@
+"""Resaltado de código en el servidor con Pygments"""
+
+import hashlib
+import html
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+
+try:
+    import pygments  # Opcional: resaltado de código en el servidor
+    from pygments.lexers import get_lexer_by_name
+    from pygments.token import Token
+    from pygments.util import ClassNotFound
+except ImportError:
+    pygments = None
+
+from .config import CONTENIDO_DIR
+from .metricas import medir
+from .almacen import (
+    antes_de_guardar, _cuerpo, _escribir_atomico, _estructura, _leer_cache, _publico,
+    _ruta_tutorial
+)
+
+# ==============================
+# 🎨 Resaltado de código en el servidor
+# ==============================
+# Los bloques <pre><code class="language-x"> se resaltan con Pygments al
+# guardar (y no en el navegador de cada lector con Prism). El resultado usa
+# las mismas clases que Prism ("token keyword"...), así que sirven los
+# estilos de la plantilla. El cuerpo guardado no cambia: el HTML resaltado
+# de cada sección vive en CONTENIDO_DIR/.resaltado/<id>.json, marcado con
+# la huella del contenido del que sale, y en un LRU en memoria. Como la
+# huella sale del propio contenido, un resaltado viejo nunca se sirve.
+RESALTADO_CACHE_MAX_BYTES = int(os.getenv('RESALTADO_CACHE_MAX_BYTES', 16 * 1024 * 1024))
+_RESALTADO_DIR = os.path.join(CONTENIDO_DIR, '.resaltado')
+_VERSION_RESALTADO = f"1:{pygments.__version__}" if pygments is not None else None
+_BLOQUE_CODIGO = re.compile(r'(?is)(<pre\b[^>]*>\s*<code\b([^>]*)>)(.*?)(</code>\s*</pre>)')
+_ALIAS_LENGUAJES = {'markup': 'html', 'js': 'javascript', 'py': 'python', 'shell': 'bash'}
+
+# Tipo de token de Pygments -> clase de Prism (se busca subiendo por los padres)
+_CLASES_PRISM = {
+    Token.Comment: 'comment',
+    Token.Keyword.Constant: 'boolean',
+    Token.Keyword: 'keyword',
+    Token.Name.Builtin: 'builtin',
+    Token.Name.Function: 'function',
+    Token.Name.Decorator: 'function',
+    Token.Name.Class: 'class-name',
+    Token.Name.Tag: 'tag',
+    Token.Name.Attribute: 'attr-name',
+    Token.Name.Variable: 'variable',
+    Token.Name.Constant: 'constant',
+    Token.Name.Entity: 'entity',
+    Token.Literal.String.Regex: 'regex',
+    Token.Literal.String: 'string',
+    Token.Literal.Number: 'number',
+    Token.Operator.Word: 'keyword',
+    Token.Operator: 'operator',
+    Token.Punctuation: 'punctuation',
+} if pygments is not None else {}
+
+_lexers = {}
+_resaltados_lock = threading.Lock()
+_resaltados = OrderedDict()  # tutorial_id -> (huella, [html de cada sección])
+_resaltados_estado = {'bytes': 0, 'hits': 0, 'misses': 0, 'generados': 0}
+
+def _lexer(lenguaje):
+    """Lexer de Pygments para un lenguaje (language-x), o None si no hay"""
+    nombre = _ALIAS_LENGUAJES.get(lenguaje, lenguaje)
+    if nombre not in _lexers:
+        try:
+            _lexers[nombre] = get_lexer_by_name(nombre, stripnl=False, ensurenl=False)
+        except ClassNotFound:
+            _lexers[nombre] = None
+    return _lexers[nombre]
+
+def _clase_prism(tipo):
+    while tipo is not Token:
+        clase = _CLASES_PRISM.get(tipo)
+        if clase is not None:
+            return clase
+        tipo = tipo.parent
+    return None
+
+def _resaltar_bloque(coincidencia):
+    apertura, atributos, codigo, cierre = coincidencia.groups()
+    lenguaje = re.search(r'\blanguage-([\w+-]+)', atributos)
+    lexer = _lexer(lenguaje.group(1).lower()) if lenguaje else None
+    if lexer is None:
+        return coincidencia.group(0)  # Sin lenguaje: igual que Prism, sin resaltar
+    partes = []
+    for tipo, valor in lexer.get_tokens(html.unescape(codigo)):
+        texto = html.escape(valor, quote=False)
+        clase = _clase_prism(tipo)
+        partes.append(f'<span class="token {clase}">{texto}</span>' if clase else texto)
+    return apertura + ''.join(partes) + cierre
+
+def resaltar_codigo(html_texto):
+    """HTML con los bloques de código ya resaltados (o tal cual sin Pygments)"""
+    if pygments is None or not html_texto:
+        return html_texto
+    return _BLOQUE_CODIGO.sub(_resaltar_bloque, html_texto)
+
+def _huella_contenido(texto):
+    return hashlib.sha1(f"{_VERSION_RESALTADO}:{texto}".encode('utf-8')).hexdigest()[:16]
+
+def _ruta_resaltado(tutorial_id):
+    return os.path.join(_RESALTADO_DIR, os.path.basename(_ruta_tutorial(tutorial_id)))
+
+def _sacar_resaltado(tutorial_id):
+    entrada = _resaltados.pop(tutorial_id, None)
+    if entrada is not None:
+        _resaltados_estado['bytes'] -= sum(len(h) for h in entrada[1])
+
+def _recordar_resaltado(tutorial_id, huella, secciones):
+    tamano = sum(len(h) for h in secciones)
+    if tamano > RESALTADO_CACHE_MAX_BYTES:
+        return
+    with _resaltados_lock:
+        _sacar_resaltado(tutorial_id)
+        _resaltados[tutorial_id] = (huella, secciones)
+        _resaltados_estado['bytes'] += tamano
+        while _resaltados_estado['bytes'] > RESALTADO_CACHE_MAX_BYTES:
+            _sacar_resaltado(next(iter(_resaltados)))
+
+def _generar_resaltado(tutorial_id, texto, posiciones, huella):
+    """Resalta sección a sección y lo deja en disco para los demás workers"""
+    with medir('codeverse_resaltado_segundos'):
+        secciones = [resaltar_codigo(texto[p['inicio']:p['fin']]) for p in posiciones]
+    with _resaltados_lock:
+        _resaltados_estado['generados'] += 1
+    try:
+        os.makedirs(_RESALTADO_DIR, exist_ok=True)
+        _escribir_atomico(_ruta_resaltado(tutorial_id), {'huella': huella, 'secciones': secciones}, compacto=True)
+    except OSError as e:
+        print(f"⚠️ No se pudo guardar el resaltado de {tutorial_id}: {e}")
+    return secciones
+
+def guardar_resaltado(tutorial_id, datos):
+    """Resalta el código de un tutorial recién guardado"""
+    if pygments is None:
+        return
+    texto = datos.get('content') or ''
+    try:
+        huella = _huella_contenido(texto)
+        secciones = _generar_resaltado(tutorial_id, texto, _estructura(texto)[1], huella)
+        _recordar_resaltado(tutorial_id, huella, secciones)
+    except Exception as e:
+        # El guardado sigue adelante: se resaltará al pedir la página
+        print(f"⚠️ Error resaltando {tutorial_id}: {e}")
+
+def borrar_resaltado(tutorial_id):
+    """Olvida el resaltado de un tutorial eliminado"""
+    with _resaltados_lock:
+        _sacar_resaltado(tutorial_id)
+    try:
+        os.unlink(_ruta_resaltado(tutorial_id))
+    except OSError:
+        pass
+
+def secciones_resaltadas(tutorial_id, texto, posiciones):
+    """HTML resaltado de cada sección para esa versión del contenido.
+
+    Se busca en memoria, luego en .resaltado/ y, si no está (contenido de
+    antes de activar el resaltado, o escrito sin Pygments), se genera una vez.
+    """
+    if pygments is None:
+        return [texto[p['inicio']:p['fin']] for p in posiciones]
+    huella = _huella_contenido(texto)
+    with _resaltados_lock:
+        entrada = _resaltados.get(tutorial_id)
+        if entrada is not None and entrada[0] == huella:
+            _resaltados.move_to_end(tutorial_id)
+            _resaltados_estado['hits'] += 1
+            return entrada[1]
+        _resaltados_estado['misses'] += 1
+    secciones = None
+    try:
+        with open(_ruta_resaltado(tutorial_id), 'r', encoding='utf-8') as f:
+            guardado = json.load(f)
+        if guardado.get('huella') == huella and len(guardado.get('secciones') or []) == len(posiciones):
+            secciones = guardado['secciones']
+    except (OSError, ValueError):
+        pass
+    if secciones is None:
+        secciones = _generar_resaltado(tutorial_id, texto, posiciones, huella)
+    _recordar_resaltado(tutorial_id, huella, secciones)
+    return secciones
+
+def estadisticas_resaltado():
+    with _resaltados_lock:
+        return {
+            'disponible': pygments is not None,
+            'entradas': len(_resaltados),
+            **_resaltados_estado
+        }
+
+def obtener_secciones(tutorial_id):
+    """(metadatos, secciones) de un tutorial del almacén, o None.
+
+    Cada sección es {'titulo', 'html'}: se corta el cuerpo con las posiciones
+    guardadas en el índice al escribirlo y su código llega ya resaltado.
+    Índice y cuerpo se leen a la vez para que las posiciones correspondan a
+    ese mismo cuerpo.
+    """
+    def leer(indice):
+        metadatos = indice.get(tutorial_id)
+        datos = _cuerpo(tutorial_id)
+        if datos is None:
+            return None
+        return _publico(metadatos), datos.get('content') or ''
+    leido = _leer_cache(leer)
+    if leido is None:
+        return None
+    metadatos, texto = leido
+    posiciones = metadatos.get('secciones')
+    if not posiciones or posiciones[-1]['fin'] != len(texto):
+        # Índice anterior a las secciones (aún sin verificar): se calculan aquí
+        metadatos['toc'], posiciones = _estructura(texto)
+    resaltadas = secciones_resaltadas(tutorial_id, texto, posiciones)
+    secciones = [{'titulo': p['titulo'], 'html': h} for p, h in zip(posiciones, resaltadas)]
+    return metadatos, secciones
+
+@antes_de_guardar
+def _resaltar_al_guardar(tutorial_id, previo, datos):
+    if datos is None:
+        borrar_resaltado(tutorial_id)
+    else:
+        guardar_resaltado(tutorial_id, datos)
@@ -0,0 +1,307 @@
+"""Versiones (ETag/304), compresión y caché de páginas renderizadas"""
+
+from flask import request, render_template
+from datetime import datetime, timezone
+import gzip
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+try:
+    import brotli  # Opcional: respuestas en br además de gzip
+except ImportError:
+    brotli = None
+
+try:
+    import pygments  # Opcional: resaltado de código en el servidor
+except ImportError:
+    pygments = None
+
+from . import app
+from .config import _MANIFIESTO_ESTATICOS
+from .almacen import al_cambiar_contenido, cargar_indice, _leer_cache
+from .resaltado import obtener_secciones
+
+# ==============================
+# 🏷️ Versiones y respuestas condicionales
+# ==============================
+# El ETag de un tutorial se deriva de su id y del hash de su contenido que
+# guarda el índice (más la huella de las plantillas en el caso de la
+# página), así que responder 304 no requiere cargar ni renderizar nada. No
+# sale de lastUpdated: un cambio en Mongo sin updatedAt nuevo también cuenta.
+CACHE_CONTROL_TUTORIALES = 'public, no-cache'
+
+def _huella_archivos(*rutas):
+    """Hash corto del contenido de varios archivos (cambia en cada despliegue que los toque)"""
+    h = hashlib.sha1()
+    for ruta in rutas:
+        try:
+            with open(ruta, 'rb') as f:
+                h.update(f.read())
+        except OSError:
+            pass
+    return h.hexdigest()[:12]
+
+_HUELLA_DETALLE = _huella_archivos(
+    os.path.join(app.root_path, 'templates', 'tutorial-detalle.html'),
+    os.path.join(app.root_path, 'templates', 'base.html'),
+    _MANIFIESTO_ESTATICOS  # Las URLs de los estáticos van en el HTML
+)
+
+def _fecha_utc(iso):
+    """Convierte un lastUpdated ISO (con o sin zona) a datetime UTC sin microsegundos"""
+    try:
+        fecha = datetime.fromisoformat(iso)
+    except (TypeError, ValueError):
+        return None
+    if fecha.tzinfo is None:
+        fecha = fecha.astimezone()  # Guardado con datetime.now(): hora local
+    return fecha.astimezone(timezone.utc).replace(microsecond=0)
+
+def _huella_y_fecha(tutorial_id):
+    """(hash del contenido, lastUpdated) de un tutorial del almacén o None si no está"""
+    entrada = _leer_cache(lambda indice: indice.get(tutorial_id))
+    if entrada is None:
+        return None
+    ultima = entrada.get('lastUpdated') or ''
+    # Un índice de antes de guardar la huella sirve hasta que _verificar_indice lo rehaga
+    return entrada.get('huella') or ultima, ultima
+
+def version_tutorial(tutorial_id, variante):
+    """(etag, last_modified) de un tutorial para una representación dada, o None"""
+    actual = _huella_y_fecha(tutorial_id)
+    if actual is None:
+        return None
+    huella, ultima = actual
+    etag = hashlib.sha1(f"{tutorial_id}:{huella}:{variante}".encode('utf-8')).hexdigest()[:20]
+    return etag, _fecha_utc(ultima)
+
+def _no_modificado(etag, ultima):
+    """True si la petición condicional coincide con la versión actual"""
+    if request.if_none_match:
+        # Vale el ETag de cualquiera de sus variantes comprimidas
+        return any(
+            request.if_none_match.contains(_etag_codificado(etag, codificacion))
+            for codificacion in (None,) + CODIFICACIONES
+        )
+    if request.if_modified_since and ultima:
+        return ultima <= request.if_modified_since
+    return False
+
+def marcar_version(respuesta, etag, ultima):
+    """Añade ETag, Last-Modified y Cache-Control a una respuesta"""
+    respuesta.set_etag(etag)
+    if ultima:
+        respuesta.last_modified = ultima
+    respuesta.headers['Cache-Control'] = CACHE_CONTROL_TUTORIALES
+    return respuesta
+
+def respuesta_no_modificada(version):
+    """Respuesta 304 si el cliente ya tiene esta versión, o None"""
+    if version is None or not _no_modificado(*version):
+        return None
+    return marcar_version(app.response_class(status=304), *version)
+
+# ==============================
+# 🖼️ Caché de páginas renderizadas
+# ==============================
+# El HTML de /tutorial/<id> se renderiza una vez por versión (su ETag) y se
+# guarda en un LRU acotado en bytes. Cada escritura en el almacén descarta
+# la página del tutorial afectado; al arrancar pueden precalentarse en segundo plano.
+PAGINAS_CACHE_MAX_BYTES = int(os.getenv('PAGINAS_CACHE_MAX_BYTES', 32 * 1024 * 1024))
+
+_paginas_lock = threading.Lock()
+_paginas = OrderedDict()  # tutorial_id -> (etag, html)
+_paginas_estado = {'bytes': 0, 'hits': 0, 'misses': 0}
+
+def pagina_cacheada(tutorial_id, etag):
+    """HTML renderizado de esa versión del tutorial, o None"""
+    with _paginas_lock:
+        entrada = _paginas.get(tutorial_id)
+        if entrada is not None and entrada[0] == etag:
+            _paginas.move_to_end(tutorial_id)
+            _paginas_estado['hits'] += 1
+            return entrada[1]
+        _paginas_estado['misses'] += 1
+        return None
+
+def cachear_pagina(tutorial_id, etag, html):
+    """Guarda una página y expulsa las menos usadas si se supera el presupuesto"""
+    tamano = len(html)
+    if tamano > PAGINAS_CACHE_MAX_BYTES:
+        return
+    with _paginas_lock:
+        anterior = _paginas.pop(tutorial_id, None)
+        if anterior is not None:
+            _paginas_estado['bytes'] -= len(anterior[1])
+        _paginas[tutorial_id] = (etag, html)
+        _paginas_estado['bytes'] += tamano
+        while _paginas_estado['bytes'] > PAGINAS_CACHE_MAX_BYTES:
+            _, (_, expulsada) = _paginas.popitem(last=False)
+            _paginas_estado['bytes'] -= len(expulsada)
+
+@al_cambiar_contenido
+def invalidar_pagina(tutorial_id):
+    """Descarta la página renderizada de un tutorial"""
+    with _paginas_lock:
+        entrada = _paginas.pop(tutorial_id, None)
+        if entrada is not None:
+            _paginas_estado['bytes'] -= len(entrada[1])
+
+def estadisticas_paginas():
+    with _paginas_lock:
+        return {'entradas': len(_paginas), **_paginas_estado}
+
+def renderizar_tutorial(tutorial_id, version=None, completo=False):
+    """Renderiza (o reutiliza) la página de un tutorial del almacén. None si no existe.
+
+    La página lleva la primera sección y la tabla de contenidos; el resto de
+    secciones las pide el navegador a /api/tutorial/<id>/seccion/<n>. Con
+    completo=True (enlace para navegadores sin JavaScript) van todas y no se
+    guarda en la caché de páginas.
+    """
+    version = version or version_tutorial(tutorial_id, _HUELLA_DETALLE)
+    if version is None:
+        return None
+    if not completo:
+        html = pagina_cacheada(tutorial_id, version[0])
+        if html is not None:
+            return html
+    leido = obtener_secciones(tutorial_id)
+    if leido is None:
+        return None
+    metadatos, secciones = leido
+    if completo:
+        secciones = [{'titulo': None, 'html': ''.join(s['html'] for s in secciones)}]
+    tutorial = {'_id': tutorial_id, **metadatos, 'content': secciones[0]['html'] or '<p>Contenido no disponible</p>'}
+    html = render_template(
+        'tutorial-detalle.html', tutorial=tutorial, secciones=secciones, toc=metadatos.get('toc'),
+        resaltado_servidor=pygments is not None, compartida=True
+    )
+    if not completo:
+        cachear_pagina(tutorial_id, version[0], html)
+    return html
+
+def precalentar_paginas():
+    """Renderiza de antemano las páginas de todos los tutoriales"""
+    with app.test_request_context('/'):
+        for tutorial_id in cargar_indice():
+            try:
+                renderizar_tutorial(tutorial_id)
+            except Exception as e:
+                print(f"⚠️ No se pudo precalentar {tutorial_id}: {e}")
+
+# ==============================
+# 🗜️ Respuestas comprimidas
+# ==============================
+# Las páginas de tutoriales, la API de contenido y las páginas estáticas se
+# comprimen (br o gzip según Accept-Encoding) una sola vez por versión: la
+# variante comprimida se guarda junto a su ETag en un LRU acotado en bytes.
+COMPRESION_MIN_BYTES = int(os.getenv('COMPRESION_MIN_BYTES', 1024))
+COMPRESION_CACHE_MAX_BYTES = int(os.getenv('COMPRESION_CACHE_MAX_BYTES', 32 * 1024 * 1024))
+COMPRESION_NIVEL_GZIP = 9
+COMPRESION_NIVEL_BROTLI = 11
+CODIFICACIONES = ('br', 'gzip') if brotli is not None else ('gzip',)
+
+_comprimidos_lock = threading.Lock()
+_comprimidos = OrderedDict()  # (clave, codificacion) -> (etag, bytes)
+_comprimidos_estado = {'bytes': 0, 'hits': 0, 'misses': 0}
+_huellas_plantillas = {}
+
+def _etag_codificado(etag, codificacion):
+    """Cada variante comprimida tiene su propio ETag (p. ej. "abc-gzip")"""
+    return f"{etag}-{codificacion}" if codificacion else etag
+
+def codificacion_aceptada():
+    """Mejor codificación que acepta el cliente, o None"""
+    return request.accept_encodings.best_match(CODIFICACIONES)
+
+def _comprimir(datos, codificacion):
+    if codificacion == 'br':
+        return brotli.compress(datos, quality=COMPRESION_NIVEL_BROTLI)
+    return gzip.compress(datos, compresslevel=COMPRESION_NIVEL_GZIP, mtime=0)
+
+def _sacar_comprimido(llave):
+    entrada = _comprimidos.pop(llave, None)
+    if entrada is not None:
+        _comprimidos_estado['bytes'] -= len(entrada[1])
+
+def _variante_comprimida(clave, etag, codificacion, generar):
+    """Bytes comprimidos de esa versión (del LRU o comprimiendo una vez), o None si es pequeña"""
+    llave = (clave, codificacion)
+    with _comprimidos_lock:
+        entrada = _comprimidos.get(llave)
+        if entrada is not None and entrada[0] == etag:
+            _comprimidos.move_to_end(llave)
+            _comprimidos_estado['hits'] += 1
+            return entrada[1] or None
+        _comprimidos_estado['misses'] += 1
+    datos = generar()
+    # b'' recuerda que esa versión no llega al umbral y va sin comprimir
+    comprimido = _comprimir(datos, codificacion) if len(datos) >= COMPRESION_MIN_BYTES else b''
+    with _comprimidos_lock:
+        _sacar_comprimido(llave)
+        _comprimidos[llave] = (etag, comprimido)
+        _comprimidos_estado['bytes'] += len(comprimido)
+        while _comprimidos_estado['bytes'] > COMPRESION_CACHE_MAX_BYTES and len(_comprimidos) > 1:
+            _sacar_comprimido(next(iter(_comprimidos)))
+    return comprimido or None
+
+def responder_version(clave, version, mimetype, generar):
+    """Respuesta con validadores para generar() (bytes), comprimida si el cliente lo acepta.
+
+    clave identifica el recurso (p. ej. ('pagina', tutorial_id)) y version es
+    (etag, last_modified): mientras no cambie el ETag se reutiliza la
+    variante comprimida. Los cuerpos menores que COMPRESION_MIN_BYTES se
+    envían tal cual.
+    """
+    codificacion = codificacion_aceptada()
+    cuerpo = None
+    if codificacion:
+        cuerpo = _variante_comprimida(clave, version[0], codificacion, generar)
+    if cuerpo is None:
+        codificacion = None
+        cuerpo = generar()
+    respuesta = app.response_class(cuerpo, mimetype=mimetype)
+    if codificacion:
+        respuesta.content_encoding = codificacion
+    respuesta.vary.add('Accept-Encoding')
+    return marcar_version(respuesta, _etag_codificado(version[0], codificacion), version[1])
+
+def pagina_estatica(plantilla, **contexto):
+    """Página sin datos de la base, versionada por su plantilla, base.html y los estáticos"""
+    etag = _huellas_plantillas.get(plantilla)
+    if etag is None:
+        etag = _huellas_plantillas[plantilla] = _huella_archivos(
+            os.path.join(app.root_path, 'templates', plantilla),
+            os.path.join(app.root_path, 'templates', 'base.html'),
+            _MANIFIESTO_ESTATICOS
+        )
+    version = (etag, None)
+    no_modificado = respuesta_no_modificada(version)
+    if no_modificado is not None:
+        return no_modificado
+    return responder_version(
+        ('plantilla', plantilla), version, 'text/html',
+        lambda: render_template(plantilla, compartida=True, **contexto).encode('utf-8')
+    )
+
+@al_cambiar_contenido
+def invalidar_comprimidos(tutorial_id):
+    """Descarta las variantes comprimidas de un tutorial que cambió"""
+    with _comprimidos_lock:
+        # Claves ('pagina', id), ('api', id), ('seccion', id, n)...
+        for llave in [llave for llave in _comprimidos if llave[0][1:2] == (tutorial_id,)]:
+            _sacar_comprimido(llave)
+
+def estadisticas_comprimidos():
+    """Tamaño y aciertos del LRU de variantes comprimidas"""
+    with _comprimidos_lock:
+        return {
+            'codificaciones': list(CODIFICACIONES),
+            'entradas': len(_comprimidos),
+            'bytes': _comprimidos_estado['bytes'],
+            'hits': _comprimidos_estado['hits'],
+            'misses': _comprimidos_estado['misses']
+        }
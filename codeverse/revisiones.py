@@ -0,0 +1,251 @@
+"""Historial de revisiones de cada tutorial (completas + deltas)"""
+
+from datetime import datetime, timezone
+import difflib
+import json
+import os
+import re
+import struct
+import threading
+import time
+import zlib
+from collections import OrderedDict
+
+from .config import CONTENIDO_DIR
+from .almacen import antes_de_guardar, _ruta_tutorial
+
+# ==============================
+# 🕓 Historial de revisiones
+# ==============================
+# Cada guardado que cambia un tutorial añade una revisión a
+# .revisiones/<id>.rev, un registro binario de solo añadir. Casi todas son
+# deltas comprimidos contra la revisión anterior: trozos del texto anterior
+# que se copian ([inicio, fin]) y texto nuevo, cortando el HTML tras cada
+# '>' y cada salto de línea. Cada REVISIONES_COMPLETA_CADA revisiones (o
+# cuando el delta no sale a cuenta) se guarda el tutorial completo, así que
+# reconstruir una revisión nunca aplica más de ese número de deltas. Las
+# lecturas de la versión actual no pasan por aquí, y borrar un tutorial no
+# borra su historial.
+REVISIONES_COMPLETA_CADA = int(os.getenv('REVISIONES_COMPLETA_CADA', 20))
+REVISIONES_CACHE_MAX = int(os.getenv('REVISIONES_CACHE_MAX', 256))  # Índices de historial en memoria
+_REVISIONES_DIR = os.path.join(CONTENIDO_DIR, '.revisiones')
+# (número, tipo, fecha epoch, bytes del payload, crc32 del payload, huella del tutorial)
+_REVISION_CABECERA = struct.Struct('<IBdIII')
+_TIPOS_REVISION = {0: 'completa', 1: 'delta'}
+_CORTES_DIFF = re.compile(r'(?<=[>\n])')
+
+_revisiones_lock = threading.Lock()
+_historiales = OrderedDict()  # tutorial_id -> {'ino', 'fin', 'entradas'}
+_revisiones_estado = {'completas': 0, 'deltas': 0, 'bytes_escritos': 0, 'reconstruidas': 0}
+
+def _ruta_revisiones(tutorial_id):
+    _ruta_tutorial(tutorial_id)  # Valida el id
+    return os.path.join(_REVISIONES_DIR, f"{tutorial_id}.rev")
+
+def _huella_revision(datos):
+    """crc32 del tutorial sin lastUpdated: un autoguardado sin cambios no es una revisión"""
+    campos = {k: v for k, v in datos.items() if k != 'lastUpdated'}
+    return zlib.crc32(json.dumps(campos, sort_keys=True, ensure_ascii=False).encode('utf-8'))
+
+def _leer_entradas(f, desde, entradas):
+    """Añade a entradas las revisiones válidas desde el offset dado y devuelve dónde acaban.
+
+    Un registro a medias (el proceso murió escribiendo) o corrupto termina la
+    lectura: lo que sigue se sobrescribe en el próximo guardado.
+    """
+    f.seek(desde)
+    fin = desde
+    while True:
+        cabecera = f.read(_REVISION_CABECERA.size)
+        if len(cabecera) < _REVISION_CABECERA.size:
+            return fin
+        numero, tipo, fecha, longitud, crc, huella = _REVISION_CABECERA.unpack(cabecera)
+        payload = f.read(longitud)
+        if len(payload) < longitud or zlib.crc32(payload) != crc or tipo not in _TIPOS_REVISION \
+                or numero != len(entradas) + 1:
+            return fin
+        entradas.append({'numero': numero, 'tipo': tipo, 'fecha': fecha, 'bytes': longitud,
+                         'offset': fin, 'huella': huella})
+        fin += _REVISION_CABECERA.size + longitud
+
+def _historial(tutorial_id):
+    """{'fin', 'entradas'} del historial de un tutorial, leyendo solo lo añadido desde la última vez"""
+    ruta = _ruta_revisiones(tutorial_id)
+    try:
+        f = open(ruta, 'rb')
+    except FileNotFoundError:
+        with _revisiones_lock:
+            _historiales.pop(tutorial_id, None)
+        return {'fin': 0, 'entradas': []}
+    with f:
+        st = os.fstat(f.fileno())
+        with _revisiones_lock:
+            previo = _historiales.get(tutorial_id)
+        if previo is not None and previo['ino'] == st.st_ino and previo['fin'] <= st.st_size:
+            if previo['fin'] == st.st_size:
+                with _revisiones_lock:
+                    if tutorial_id in _historiales:
+                        _historiales.move_to_end(tutorial_id)
+                return previo
+            entradas = list(previo['entradas'])
+            fin = _leer_entradas(f, previo['fin'], entradas)
+        else:
+            entradas = []
+            fin = _leer_entradas(f, 0, entradas)
+    historial = {'ino': st.st_ino, 'fin': fin, 'entradas': entradas}
+    with _revisiones_lock:
+        _historiales[tutorial_id] = historial
+        _historiales.move_to_end(tutorial_id)
+        while len(_historiales) > REVISIONES_CACHE_MAX:
+            _historiales.popitem(last=False)
+    return historial
+
+def _delta(previo, nuevo):
+    """Payload (sin comprimir) que convierte previo en nuevo, o None si no se puede"""
+    texto_previo, texto_nuevo = previo.get('content'), nuevo.get('content')
+    if not isinstance(texto_previo, str) or not isinstance(texto_nuevo, str):
+        return None
+    a = _CORTES_DIFF.split(texto_previo)
+    b = _CORTES_DIFF.split(texto_nuevo)
+    posiciones = [0]
+    for trozo in a:
+        posiciones.append(posiciones[-1] + len(trozo))
+    operaciones = []
+    for etiqueta, i1, i2, j1, j2 in difflib.SequenceMatcher(None, a, b).get_opcodes():
+        if etiqueta == 'equal':
+            operaciones.append([posiciones[i1], posiciones[i2]])
+        elif j2 > j1:
+            operaciones.append(''.join(b[j1:j2]))
+    return {
+        # lastUpdated cambia en cada guardado: siempre viaja en el delta
+        'campos': {k: v for k, v in nuevo.items()
+                   if k != 'content' and (k == 'lastUpdated' or previo.get(k) != v)},
+        'quitados': [k for k in previo if k not in nuevo],
+        'ops': operaciones
+    }
+
+def _aplicar_delta(previo, delta):
+    texto = previo['content']
+    partes = [texto[op[0]:op[1]] if isinstance(op, list) else op for op in delta['ops']]
+    datos = {k: v for k, v in previo.items() if k not in delta['quitados']}
+    datos.update(delta['campos'])
+    datos['content'] = ''.join(partes)
+    return datos
+
+def _empaquetar(objeto):
+    return zlib.compress(json.dumps(objeto, ensure_ascii=False, separators=(',', ':')).encode('utf-8'), 9)
+
+def _registro_revision(numero, tipo, payload, huella):
+    return _REVISION_CABECERA.pack(numero, tipo, time.time(), len(payload), zlib.crc32(payload), huella) + payload
+
+def registrar_revision(tutorial_id, previo, datos):
+    """Añade una revisión al historial de un tutorial.
+
+    previo es el tutorial que había en el almacén (o None). Debe llamarse con
+    _bloqueo_almacen() tomado: es lo que serializa las escrituras al registro.
+    """
+    huella = _huella_revision(datos)
+    historial = _historial(tutorial_id)
+    entradas = historial['entradas']
+    registros = []
+    if not entradas and previo is not None and _huella_revision(previo) != huella:
+        # Primer guardado de un tutorial que ya existía: el original pasa a ser
+        # la revisión 1 (completa) y el nuevo cuerpo va como delta contra él.
+        huella_previa = _huella_revision(previo)
+        registros.append(_registro_revision(1, 0, _empaquetar(previo), huella_previa))
+        entradas = [{'numero': 1, 'tipo': 0, 'huella': huella_previa}]
+    ultima = entradas[-1] if entradas else None
+    if ultima is not None and ultima['huella'] == huella:
+        return None  # Solo cambió lastUpdated
+    numero = len(entradas) + 1
+    ultima_completa = next((e['numero'] for e in reversed(entradas) if e['tipo'] == 0), 0)
+    payload = tipo = None
+    # El delta se calcula contra el almacén; solo vale si coincide con la última revisión
+    if previo is not None and ultima is not None and ultima['huella'] == _huella_revision(previo) \
+            and numero - ultima_completa < REVISIONES_COMPLETA_CADA:
+        delta = _delta(previo, datos)
+        if delta is not None:
+            payload, tipo = _empaquetar(delta), 1
+            if len(payload) * 4 > len(datos.get('content') or ''):
+                # Edición grande: si el tutorial entero ocupa menos, mejor completa
+                completa = _empaquetar(datos)
+                if len(completa) <= len(payload):
+                    payload, tipo = completa, 0
+    if payload is None:
+        payload, tipo = _empaquetar(datos), 0
+    registros.append(_registro_revision(numero, tipo, payload, huella))
+    os.makedirs(_REVISIONES_DIR, exist_ok=True)
+    ruta = _ruta_revisiones(tutorial_id)
+    with open(ruta, 'ab') as f:
+        # Descarta la cola de un registro que quedó a medias
+        if f.tell() > historial['fin']:
+            f.truncate(historial['fin'])
+        for registro in registros:
+            f.write(registro)
+        f.flush()
+        os.fsync(f.fileno())
+    with _revisiones_lock:
+        if len(registros) > 1:
+            _revisiones_estado['completas'] += 1
+        _revisiones_estado['completas' if tipo == 0 else 'deltas'] += 1
+        _revisiones_estado['bytes_escritos'] += sum(len(r) for r in registros)
+    return numero
+
+def _resumen_revision(entrada):
+    return {
+        'numero': entrada['numero'],
+        'tipo': _TIPOS_REVISION[entrada['tipo']],
+        'fecha': datetime.fromtimestamp(entrada['fecha'], timezone.utc).isoformat(),
+        'bytes': entrada['bytes']
+    }
+
+def listar_revisiones(tutorial_id):
+    """Revisiones de un tutorial (de la más antigua a la más reciente), sin descomprimir nada"""
+    historial = _historial(tutorial_id)
+    return [_resumen_revision(entrada) for entrada in historial['entradas']]
+
+def obtener_revision(tutorial_id, numero):
+    """(resumen, tutorial) de una revisión reconstruida, o None si no existe.
+
+    Lee de una vez desde la última revisión completa anterior hasta la pedida
+    y aplica los deltas en orden.
+    """
+    entradas = _historial(tutorial_id)['entradas']
+    if not 1 <= numero <= len(entradas):
+        return None
+    objetivo = entradas[numero - 1]
+    inicio = numero - 1
+    while entradas[inicio]['tipo'] != 0:
+        inicio -= 1
+    desde = entradas[inicio]['offset']
+    with open(_ruta_revisiones(tutorial_id), 'rb') as f:
+        f.seek(desde)
+        bloque = f.read(objetivo['offset'] + _REVISION_CABECERA.size + objetivo['bytes'] - desde)
+    datos = None
+    for entrada in entradas[inicio:numero]:
+        posicion = entrada['offset'] - desde + _REVISION_CABECERA.size
+        objeto = json.loads(zlib.decompress(bloque[posicion:posicion + entrada['bytes']]))
+        datos = objeto if entrada['tipo'] == 0 else _aplicar_delta(datos, objeto)
+    if _huella_revision(datos) != objetivo['huella']:
+        raise ValueError(f"La revisión {numero} de {tutorial_id} no cuadra con su huella")
+    with _revisiones_lock:
+        _revisiones_estado['reconstruidas'] += 1
+    return _resumen_revision(objetivo), datos
+
+def estadisticas_revisiones():
+    with _revisiones_lock:
+        return {
+            'completa_cada': REVISIONES_COMPLETA_CADA,
+            'historiales_en_memoria': len(_historiales),
+            **_revisiones_estado
+        }
+
+@antes_de_guardar
+def _revision_al_guardar(tutorial_id, previo, datos):
+    if datos is None:
+        return
+    try:
+        registrar_revision(tutorial_id, previo, datos)
+    except Exception as e:
+        # Sin revisión el guardado sigue valiendo: la próxima será completa
+        print(f"⚠️ No se pudo registrar la revisión de {tutorial_id}: {e}")
@@ -0,0 +1,682 @@
+"""Rutas de la aplicación"""
+
+from flask import request, render_template, redirect, url_for, jsonify, send_file, abort
+from datetime import datetime
+import hashlib
+import os
+import uuid
+from werkzeug.utils import safe_join
+from bson.objectid import ObjectId
+
+try:
+    import pygments  # Opcional: resaltado de código en el servidor
+except ImportError:
+    pygments = None
+
+from . import app
+from .config import ESTATICOS_BUILD, TOMBSTONES_COLLECTION
+from .metricas import contar_origen, exportar_metricas
+from .mongo import (
+    ahora_utc, conectar_mongodb, estado_mongodb, mongo_conectado, registrar_fallo_mongodb
+)
+from .almacen import (
+    cargar_indice, eliminar_tutorial_json, estadisticas_cache, guardar_tutorial_json,
+    obtener_contenido, obtener_metadatos
+)
+from .resaltado import estadisticas_resaltado, obtener_secciones, resaltar_codigo
+from .revisiones import estadisticas_revisiones, listar_revisiones, obtener_revision
+from .sincronizacion import sincronizar_una_vez, SYNC_REINTENTO
+from .respuestas import (
+    codificacion_aceptada, estadisticas_comprimidos, estadisticas_paginas, _HUELLA_DETALLE,
+    pagina_estatica, renderizar_tutorial, responder_version, respuesta_no_modificada,
+    version_tutorial
+)
+from .estaticos import ASSETS_CACHE_CONTROL, _TIPOS_ASSETS
+from .busqueda import buscar_tutoriales
+from .listado import (
+    LISTADO_LIMITE_DEFECTO, LISTADO_LIMITE_MAX, listar_tutoriales, parametros_listado,
+    renderizar_listado, TUTORIALES_POR_PAGINA
+)
+from .lotes import aplicar_lote_tutoriales, BULK_MAX_OPERACIONES
+from .escrituras import (
+    descartar_escrituras, encolar_guardado, escritura_pendiente, estadisticas_escrituras
+)
+from .instantaneas import estadisticas_instantaneas
+from .limites import estadisticas_limites
+from .tiktok import tiktok_pendientes
+from .arranque import estado_arranque
+
+# ==================== RUTAS ====================
+
+@app.route('/assets/<path:archivo>')
+def servir_asset(archivo):
+    """Recursos con huella de static/build/: inmutables y precomprimidos"""
+    ruta = safe_join(ESTATICOS_BUILD, archivo)
+    if ruta is None or archivo == 'manifest.json' or not os.path.isfile(ruta):
+        abort(404)
+    mimetype = _TIPOS_ASSETS.get(os.path.splitext(ruta)[1])
+    codificacion = codificacion_aceptada()
+    variante = f"{ruta}.{'br' if codificacion == 'br' else 'gz'}" if codificacion else None
+    if variante is None or not os.path.isfile(variante):
+        codificacion, variante = None, ruta
+    respuesta = send_file(variante, mimetype=mimetype, conditional=True)
+    if codificacion:
+        respuesta.content_encoding = codificacion
+    respuesta.vary.add('Accept-Encoding')
+    respuesta.headers['Cache-Control'] = ASSETS_CACHE_CONTROL
+    return respuesta
+
+@app.route('/')
+def inicio():
+    """Ruta para la página de inicio"""
+    return pagina_estatica('index.html')
+
+@app.route('/tutoriales')
+def tutoriales():
+    """Ruta para la página de tutoriales"""
+    try:
+        parametros = parametros_listado(request.args, TUTORIALES_POR_PAGINA)
+    except ValueError:
+        return redirect(url_for('tutoriales'))
+    try:
+        resultado = listar_tutoriales(parametros)
+    except Exception as e:
+        print(f"Error en tutoriales: {e}")
+        resultado = {'data': [], 'total': 0, 'next_cursor': None}
+    return renderizar_listado(parametros, resultado)
+
+@app.route('/tutorial/<tutorial_id>')
+def ver_tutorial(tutorial_id):
+    """Ruta para ver un tutorial específico con contenido del JSON"""
+    try:
+        completo = request.args.get('completo') == '1'
+        version = version_tutorial(tutorial_id, _HUELLA_DETALLE + (':completo' if completo else ''))
+        no_modificado = respuesta_no_modificada(version)
+        if no_modificado is not None:
+            return no_modificado
+        
+        # El almacén local es la réplica de lectura de Mongo (sincronizada al
+        # arrancar y cada SYNC_INTERVALO); Mongo cubre lo que aún no llegó.
+        html = renderizar_tutorial(tutorial_id, version, completo)
+        if html is not None:
+            contar_origen('tutorial', 'json')
+            return responder_version(
+                ('pagina', tutorial_id, completo), version, 'text/html', lambda: html.encode('utf-8')
+            )
+        
+        tutorial = None
+        tutorials_collection = conectar_mongodb()
+        if tutorials_collection is not None:
+            try:
+                tutorial = tutorials_collection.find_one({"_id": ObjectId(tutorial_id)})
+                if tutorial:
+                    tutorial['_id'] = str(tutorial['_id'])
+            except Exception as e:
+                registrar_fallo_mongodb(e)
+                print(f"Error consultando MongoDB: {e}")
+                tutorial = None
+        
+        if not tutorial:
+            return "Tutorial no encontrado", 404
+        
+        contar_origen('tutorial', 'mongodb')
+        if 'content' not in tutorial or not tutorial['content']:
+            tutorial['content'] = '<p>Contenido no disponible</p>'
+        tutorial['content'] = resaltar_codigo(tutorial['content'])
+        
+        return render_template('tutorial-detalle.html', tutorial=tutorial, resaltado_servidor=pygments is not None)
+    except Exception as e:
+        print(f"Error en ver_tutorial: {e}")
+        return f"Error al cargar el tutorial: {str(e)}", 500
+
+@app.route('/admin/editor')
+def editor_admin():
+    """Página para editar tutoriales y guardarlos en JSON"""
+    try:
+        tutorials_collection = conectar_mongodb()
+        
+        tutoriales_list = []
+        
+        if tutorials_collection is not None:
+            try:
+                tutoriales_list = list(tutorials_collection.find({}, {"_id": 1, "title": 1, "language": 1, "level": 1}))
+                for tutorial in tutoriales_list:
+                    tutorial['_id'] = str(tutorial['_id'])
+                print(f"✅ Cargados {len(tutoriales_list)} tutoriales de MongoDB")
+                contar_origen('editor', 'mongodb')
+            except Exception as e:
+                registrar_fallo_mongodb(e)
+                print(f"Error consultando MongoDB: {e}")
+                tutoriales_list = []
+        
+        if not tutoriales_list:
+            print("📄 Cargando tutoriales desde JSON...")
+            contenidos = cargar_indice()
+            tutoriales_list = [
+                {
+                    '_id': tid,
+                    'title': content.get('title', 'Sin título'),
+                    'language': content.get('language', 'python'),
+                    'level': content.get('level', 'principiante')
+                }
+                for tid, content in contenidos.items()
+            ]
+            print(f"✅ Cargados {len(tutoriales_list)} tutoriales de JSON")
+            contar_origen('editor', 'json')
+        
+        return render_template('admin-editor.html', tutoriales=tutoriales_list)
+    except Exception as e:
+        print(f"Error en editor_admin: {e}")
+        return f"Error al cargar el editor: {str(e)}", 500
+
+# ==================== API ENDPOINTS ====================
+
+@app.route('/api/tutorial/<tutorial_id>/contenido', methods=['GET'])
+def get_contenido(tutorial_id):
+    """Obtener contenido de un tutorial desde JSON"""
+    try:
+        pendiente = escritura_pendiente(tutorial_id)
+        if pendiente is not None:
+            # Guardado aún en cola: se sirve tal cual, sin validadores
+            respuesta = jsonify({"success": True, "data": pendiente})
+            respuesta.headers['Cache-Control'] = 'no-store'
+            return respuesta, 200
+        
+        version = version_tutorial(tutorial_id, 'api')
+        no_modificado = respuesta_no_modificada(version)
+        if no_modificado is not None:
+            return no_modificado
+        
+        contenido = obtener_contenido(tutorial_id)
+        
+        if contenido is not None:
+            metadatos = obtener_metadatos(tutorial_id) or {}
+            for campo in ('palabras', 'minutos_lectura', 'toc'):
+                contenido[campo] = metadatos.get(campo)
+            return responder_version(
+                ('api', tutorial_id), version, 'application/json',
+                lambda: app.json.dumps({"success": True, "data": contenido}).encode('utf-8')
+            ), 200
+        else:
+            return jsonify({
+                "success": False,
+                "message": "Contenido no encontrado"
+            }), 404
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+@app.route('/api/tutorial/<tutorial_id>/seccion/<int:numero>', methods=['GET'])
+def get_seccion(tutorial_id, numero):
+    """Obtener una sección (cortada en cada h2) del contenido de un tutorial"""
+    try:
+        # Como la página, sale del almacén: un guardado aún en cola no se ve
+        # hasta que se escribe, así las secciones cuadran con la página.
+        version = version_tutorial(tutorial_id, f"seccion:{numero}")
+        no_modificado = respuesta_no_modificada(version)
+        if no_modificado is not None:
+            return no_modificado
+        
+        leido = obtener_secciones(tutorial_id)
+        if leido is None or numero >= len(leido[1]):
+            return jsonify({
+                "success": False,
+                "message": "Sección no encontrada"
+            }), 404
+        
+        secciones = leido[1]
+        seccion = {
+            "numero": numero,
+            "total": len(secciones),
+            "titulo": secciones[numero]['titulo'],
+            "html": secciones[numero]['html']
+        }
+        return responder_version(
+            ('seccion', tutorial_id, numero), version, 'application/json',
+            lambda: app.json.dumps({"success": True, "data": seccion}).encode('utf-8')
+        ), 200
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+@app.route('/api/tutorial/<tutorial_id>/revisiones', methods=['GET'])
+def get_revisiones(tutorial_id):
+    """Historial de revisiones de un tutorial, de la más reciente a la más antigua.
+
+    Pagina con limit y antes=<número> (el de la última revisión recibida).
+    """
+    try:
+        limite = min(int(request.args.get('limit', LISTADO_LIMITE_DEFECTO)), LISTADO_LIMITE_MAX)
+        antes = request.args.get('antes', type=int)
+        if limite < 1:
+            raise ValueError
+    except ValueError:
+        return jsonify({"error": "limit debe ser un entero positivo"}), 400
+    try:
+        revisiones = listar_revisiones(tutorial_id)
+        if not revisiones and obtener_metadatos(tutorial_id) is None:
+            return jsonify({
+                "success": False,
+                "message": "Tutorial no encontrado"
+            }), 404
+        
+        recientes = [r for r in reversed(revisiones) if antes is None or r['numero'] < antes]
+        pagina = recientes[:limite]
+        return jsonify({
+            "success": True,
+            "count": len(pagina),
+            "total": len(revisiones),
+            "bytes": sum(r['bytes'] for r in revisiones),
+            "next_cursor": pagina[-1]['numero'] if len(recientes) > limite else None,
+            "data": pagina
+        }), 200
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+@app.route('/api/tutorial/<tutorial_id>/revisiones/<int:numero>', methods=['GET'])
+def get_revision(tutorial_id, numero):
+    """Obtener un tutorial tal como quedó en una revisión"""
+    try:
+        leida = obtener_revision(tutorial_id, numero)
+        if leida is None:
+            return jsonify({
+                "success": False,
+                "message": "Revisión no encontrada"
+            }), 404
+        
+        resumen, datos = leida
+        # Una revisión no cambia nunca: su ETag solo depende de qué es
+        version = (hashlib.sha1(f"{tutorial_id}:revision:{numero}:{resumen['fecha']}".encode('utf-8')).hexdigest()[:20], None)
+        no_modificado = respuesta_no_modificada(version)
+        if no_modificado is not None:
+            return no_modificado
+        return responder_version(
+            ('revision', tutorial_id, numero), version, 'application/json',
+            lambda: app.json.dumps({"success": True, "data": {**resumen, "tutorial": datos}}).encode('utf-8')
+        ), 200
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+@app.route('/api/tutorial/<tutorial_id>/contenido', methods=['POST'])
+def guardar_contenido(tutorial_id):
+    """Guardar contenido de un tutorial (se escribe en segundo plano)"""
+    try:
+        data = request.get_json()
+        
+        # La réplica local basta como base; Mongo solo para lo no sincronizado
+        tutorial_data = escritura_pendiente(tutorial_id) or obtener_contenido(tutorial_id) or {}
+        if not tutorial_data:
+            tutorials_collection = conectar_mongodb()
+            if tutorials_collection is not None:
+                try:
+                    tutorial_data = tutorials_collection.find_one({"_id": ObjectId(tutorial_id)}) or {}
+                except Exception as e:
+                    registrar_fallo_mongodb(e)
+        
+        if not tutorial_data:
+            return jsonify({"error": "Tutorial no encontrado"}), 404
+        
+        contenido = {
+            'title': data.get('title', tutorial_data.get('title')),
+            'language': data.get('language', tutorial_data.get('language')),
+            'level': data.get('level', tutorial_data.get('level')),
+            'duration': data.get('duration', tutorial_data.get('duration')),
+            'description': data.get('description', tutorial_data.get('description')),
+            'content': data.get('content', ''),
+            'lastUpdated': datetime.now().isoformat()
+        }
+        
+        encolar_guardado(tutorial_id, contenido, {"content": contenido['content']})
+        
+        return jsonify({
+            "success": True,
+            "message": "Contenido guardado exitosamente",
+            "data": contenido
+        }), 200
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+@app.route('/api/sincronizar-json', methods=['POST'])
+def sincronizar():
+    """Sincronizar MongoDB con JSON"""
+    try:
+        completo = request.args.get('completo', '').lower() in ('1', 'true', 'si')
+        try:
+            # Si ya hay una en curso se espera a que acabe y se devuelve su resultado
+            resumen, compartido = sincronizar_una_vez(completo=completo)
+        except TimeoutError as e:
+            respuesta = jsonify({"error": str(e), "retry_after": SYNC_REINTENTO})
+            respuesta.headers['Retry-After'] = str(SYNC_REINTENTO)
+            return respuesta, 429
+        if resumen is not None:
+            return jsonify({
+                "success": True,
+                "message": "JSON sincronizado exitosamente",
+                "compartido": compartido,
+                "resumen": resumen
+            }), 200
+        else:
+            return jsonify({
+                "success": False,
+                "message": "Error sincronizando JSON"
+            }), 500
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+@app.route('/api/tutoriales', methods=['GET'])
+def get_all_tutoriales():
+    """Obtener tutoriales (paginado: page/limit o cursor, filtros language/level y sort)"""
+    try:
+        parametros = parametros_listado(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    try:
+        resultado = listar_tutoriales(parametros)
+        return jsonify({
+            "success": True,
+            "count": len(resultado['data']),
+            "total": resultado['total'],
+            "page": None if parametros['cursor'] else parametros['page'],
+            "limit": parametros['limit'],
+            "next_cursor": resultado['next_cursor'],
+            "data": resultado['data']
+        }), 200
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+@app.route('/api/tutoriales/buscar', methods=['GET'])
+def buscar():
+    """Buscar tutoriales por texto (título, descripción y contenido), con filtros de lenguaje y nivel"""
+    consulta = request.args.get('q', '').strip()
+    if not consulta:
+        return jsonify({"error": "Falta el parámetro q"}), 400
+    try:
+        limite = min(max(int(request.args.get('limit', 10)), 1), 50)
+    except ValueError:
+        return jsonify({"error": "limit debe ser un número"}), 400
+    lenguaje = request.args.get('language', '').strip().lower() or None
+    nivel = request.args.get('level', '').strip().lower() or None
+    try:
+        resultados = buscar_tutoriales(consulta, limite, lenguaje, nivel)
+        return jsonify({
+            "success": True,
+            "query": consulta,
+            "count": len(resultados),
+            "data": resultados
+        }), 200
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+@app.route('/api/tutorial/nuevo', methods=['POST'])
+def crear_tutorial():
+    """Crear un nuevo tutorial"""
+    try:
+        tutorials_collection = conectar_mongodb()
+        
+        data = request.get_json()
+        
+        if not data.get('title') or not data.get('description') or not data.get('duration'):
+            return jsonify({"error": "Faltan campos requeridos"}), 400
+        
+        nuevo_tutorial = {
+            'title': data.get('title'),
+            'description': data.get('description'),
+            'language': data.get('language', 'python'),
+            'level': data.get('level', 'principiante'),
+            'duration': data.get('duration'),
+            'content': data.get('content', ''),
+            'createdAt': datetime.now(),
+            'updatedAt': ahora_utc()
+        }
+        
+        tutorial_id = None
+        
+        if tutorials_collection is not None:
+            try:
+                resultado = tutorials_collection.insert_one(nuevo_tutorial)
+                tutorial_id = str(resultado.inserted_id)
+            except Exception as e:
+                registrar_fallo_mongodb(e)
+                print(f"⚠️ No se pudo insertar en MongoDB: {e}")
+        
+        if not tutorial_id:
+            tutorial_id = str(uuid.uuid4())
+        
+        guardar_tutorial_json(tutorial_id, {
+            'title': nuevo_tutorial['title'],
+            'language': nuevo_tutorial['language'],
+            'level': nuevo_tutorial['level'],
+            'duration': nuevo_tutorial['duration'],
+            'description': nuevo_tutorial['description'],
+            'content': nuevo_tutorial['content'],
+            'lastUpdated': datetime.now().isoformat()
+        })
+        
+        return jsonify({
+            "success": True,
+            "message": "Tutorial creado exitosamente",
+            "tutorial_id": tutorial_id
+        }), 201
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+@app.route('/api/tutoriales/bulk', methods=['POST'])
+def tutoriales_bulk():
+    """Crear, actualizar y eliminar tutoriales en lote"""
+    try:
+        data = request.get_json(silent=True) or {}
+        operaciones = data.get('operaciones')
+        if not isinstance(operaciones, list) or not operaciones:
+            return jsonify({"error": "Se esperaba una lista 'operaciones'"}), 400
+        if len(operaciones) > BULK_MAX_OPERACIONES:
+            return jsonify({"error": f"Máximo {BULK_MAX_OPERACIONES} operaciones por lote"}), 413
+        
+        resultados = aplicar_lote_tutoriales(operaciones)
+        errores = sum(1 for r in resultados if not r['success'])
+        return jsonify({
+            "success": errores == 0,
+            "total": len(resultados),
+            "errores": errores,
+            "resultados": resultados
+        }), 200
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+@app.route('/api/tutorial/<tutorial_id>', methods=['DELETE'])
+def eliminar_tutorial(tutorial_id):
+    """Eliminar un tutorial"""
+    try:
+        descartar_escrituras([tutorial_id])
+        tutorials_collection = conectar_mongodb()
+        
+        eliminado = False
+        
+        if tutorials_collection is not None:
+            try:
+                resultado = tutorials_collection.delete_one({"_id": ObjectId(tutorial_id)})
+                eliminado = resultado.deleted_count > 0
+                if eliminado:
+                    # Lápida para que la sincronización incremental vea el borrado
+                    tutorials_collection.database[TOMBSTONES_COLLECTION].insert_one(
+                        {"tutorial_id": tutorial_id, "deletedAt": ahora_utc()}
+                    )
+            except Exception as e:
+                registrar_fallo_mongodb(e)
+                print(f"⚠️ No se pudo eliminar de MongoDB: {e}")
+        
+        try:
+            if eliminar_tutorial_json(tutorial_id):
+                eliminado = True
+        except ValueError:
+            pass
+        
+        if not eliminado:
+            return jsonify({"error": "Tutorial no encontrado"}), 404
+        
+        return jsonify({
+            "success": True,
+            "message": "Tutorial eliminado exitosamente"
+        }), 200
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+@app.route('/api/metrics', methods=['GET'])
+def metricas():
+    """Métricas del proceso en formato de texto de Prometheus"""
+    cache = estadisticas_cache()
+    paginas = estadisticas_paginas()
+    comprimidos = estadisticas_comprimidos()
+    escrituras = estadisticas_escrituras()
+    revisiones = estadisticas_revisiones()
+    pendientes_tiktok = tiktok_pendientes()
+    calculadas = [
+        ('codeverse_mongo_conectado', 'gauge', {}, 1 if mongo_conectado() else 0),
+        ('codeverse_cache_total', 'counter', {'cache': 'contenidos', 'resultado': 'hit'}, cache['hits']),
+        ('codeverse_cache_total', 'counter', {'cache': 'contenidos', 'resultado': 'miss'}, cache['misses']),
+        ('codeverse_cache_total', 'counter', {'cache': 'paginas', 'resultado': 'hit'}, paginas['hits']),
+        ('codeverse_cache_total', 'counter', {'cache': 'paginas', 'resultado': 'miss'}, paginas['misses']),
+        ('codeverse_cache_total', 'counter', {'cache': 'comprimidos', 'resultado': 'hit'}, comprimidos['hits']),
+        ('codeverse_cache_total', 'counter', {'cache': 'comprimidos', 'resultado': 'miss'}, comprimidos['misses']),
+        ('codeverse_cache_bytes', 'gauge', {'cache': 'contenidos'}, cache['bytes_cuerpos']),
+        ('codeverse_cache_bytes', 'gauge', {'cache': 'paginas'}, paginas['bytes']),
+        ('codeverse_cache_bytes', 'gauge', {'cache': 'comprimidos'}, comprimidos['bytes']),
+        ('codeverse_cache_invalidaciones_total', 'counter', {'alcance': 'tutorial'}, cache['entradas_releidas']),
+        ('codeverse_cache_invalidaciones_total', 'counter', {'alcance': 'indice'}, cache['recargas_indice']),
+        ('codeverse_escrituras_pendientes', 'gauge', {'destino': 'almacen'}, escrituras['pendientes_almacen']),
+        ('codeverse_escrituras_pendientes', 'gauge', {'destino': 'mongodb'}, escrituras['pendientes_mongo']),
+        ('codeverse_escrituras_total', 'counter', {'tipo': 'recibidos'}, escrituras['guardados']),
+        ('codeverse_escrituras_total', 'counter', {'tipo': 'coalescidos'}, escrituras['coalescidos']),
+        ('codeverse_revisiones_total', 'counter', {'tipo': 'completa'}, revisiones['completas']),
+        ('codeverse_revisiones_total', 'counter', {'tipo': 'delta'}, revisiones['deltas']),
+        ('codeverse_revisiones_bytes_total', 'counter', {}, revisiones['bytes_escritos']),
+        ('codeverse_tiktok_pendientes', 'gauge', {}, pendientes_tiktok),
+    ]
+    return app.response_class(
+        exportar_metricas(calculadas),
+        content_type='text/plain; version=0.0.4; charset=utf-8',
+        headers={'Cache-Control': 'no-store'}
+    )
+
+@app.route('/api/health/live', methods=['GET'])
+def health_live():
+    """Liveness: el proceso está vivo y atiende peticiones"""
+    return jsonify({"status": "alive"}), 200
+
+@app.route('/api/health/ready', methods=['GET'])
+def health_ready():
+    """Readiness: el worker puede recibir tráfico (Mongo no es imprescindible)"""
+    arranque = estado_arranque()
+    return jsonify({
+        "status": "ready" if arranque['listo'] else "starting",
+        "arranque": arranque,
+        "mongodb": estado_mongodb()
+    }), 200 if arranque['listo'] else 503
+
+@app.route('/api/health', methods=['GET'])
+def health_check():
+    """Verificar el estado de la API"""
+    try:
+        conectado = conectar_mongodb() is not None
+        estado = {
+            "status": "healthy" if conectado else "degraded",
+            "database": "connected" if conectado else "disconnected",
+        }
+        if not conectado:
+            estado["fallback"] = "using JSON"
+        return jsonify({
+            **estado,
+            "arranque": estado_arranque(),
+            "mongodb": estado_mongodb(),
+            "cache": estadisticas_cache(),
+            "paginas": estadisticas_paginas(),
+            "compresion": estadisticas_comprimidos(),
+            "resaltado": estadisticas_resaltado(),
+            "revisiones": estadisticas_revisiones(),
+            "instantaneas": estadisticas_instantaneas(),
+            "escrituras": estadisticas_escrituras(),
+            "limites": estadisticas_limites(),
+            "timestamp": datetime.now().isoformat()
+        }), 200
+    except Exception as e:
+        return jsonify({
+            "status": "error",
+            "message": str(e)
+        }), 500
+
+@app.route('/snippets')
+def snippets():
+    return pagina_estatica('snippets.html')
+
+@app.route('/tutorial/snippets')
+def snippets_tutorial():
+    return pagina_estatica('snippets-tutorial.html')
+
+HERRAMIENTAS = {
+    'imc': {
+        'template': 'imc.html',
+        'title': 'Calculadora IMC'
+    },
+    'convertidor': {
+        'template': 'convertidor.html',
+        'title': 'Convertidor de Unidades'
+    },
+    'calculadora': {
+        'template': 'calculadora.html',
+        'title': 'Calculadora'
+    }
+}
+
+@app.route('/herramientas')
+def listar_herramientas():
+    """Ruta para la página principal que lista las herramientas."""
+    return pagina_estatica('herramientas.html', current_tool='list')
+
+@app.route('/qrgen')
+def qrgen():
+    return pagina_estatica("qr.html")
+
+@app.route('/terminos')
+def term():
+    return pagina_estatica("terminos.html")
+
+@app.route('/contacto')
+def contac():
+    return pagina_estatica("contacto.html")
+
+@app.route('/privacidad')
+def priv():
+    return pagina_estatica("privacidad.html")
+
+@app.route('/convertidor')
+def convert():
+    return pagina_estatica("convertidor.html")
+
+@app.route('/caluladora_fechas')
+def fechas_cal():
+    return pagina_estatica("calculadora_fechas.html")
+
+@app.route('/notas')
+def notas():
+    return pagina_estatica("notas.html")
+
+@app.route('/herramienta/<nombre_herramienta>')
+def mostrar_herramienta(nombre_herramienta):
+    """Ruta dinámica que renderiza la herramienta seleccionada."""
+    herramienta_info = HERRAMIENTAS.get(nombre_herramienta)
+    
+    if herramienta_info:
+        return render_template(
+            herramienta_info['template'], 
+            title=herramienta_info['title'],
+            current_tool=nombre_herramienta
+        )
+    else:
+        abort(404)
+
+# ==================== MANEJO DE ERRORES ====================
+
+@app.errorhandler(404)
+def not_found(error):
+    return render_template('404.html'), 404
+
+@app.errorhandler(500)
+def internal_error(error):
+    return jsonify({"error": "Error interno del servidor"}), 500
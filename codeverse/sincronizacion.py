@@ -0,0 +1,242 @@
+"""Sincronización incremental MongoDB → almacén local"""
+
+from datetime import datetime, timedelta
+import json
+import os
+import threading
+import time
+
+try:
+    import fcntl  # Bloqueo entre procesos (Linux/macOS)
+except ImportError:
+    fcntl = None
+
+from .config import CONTENIDO_DIR, TOMBSTONES_COLLECTION
+from .metricas import contar
+from .mongo import ahora_utc, conectar_mongodb, registrar_fallo_mongodb
+from .almacen import (
+    _aplicar_cambios, _bloqueo_almacen, cargar_indice, _escribir_atomico, obtener_contenido,
+    obtener_metadatos
+)
+from .escrituras import escrituras_pendientes
+
+# ==============================
+# 🔄 Sincronización MongoDB → JSON
+# ==============================
+# Incremental: solo se piden los documentos con updatedAt posterior a la
+# última marca de agua (con un margen por desfase de relojes) y los borrados
+# registrados en la colección de lápidas. El cursor se recorre por lotes y
+# solo se escriben los tutoriales que realmente cambiaron. Nunca corren dos
+# a la vez: quien pide una con otra en curso (en este proceso o en otro
+# worker) espera a que termine y recibe su resultado en vez de repetirla.
+# Si tarda más de SYNC_ESPERA_MAX se rinde con TimeoutError (429 en la API).
+#
+# Mongo es la fuente de verdad y el almacén su réplica de lectura: cada
+# worker sincroniza antes de empezar a servir (el almacén puede venir de la
+# semilla del repositorio, más vieja que Mongo) y luego cada SYNC_INTERVALO
+# segundos, saltándose la vuelta si otro worker acaba de hacerla.
+SYNC_BATCH = int(os.getenv('SYNC_BATCH', 100))
+SYNC_MARGEN = timedelta(seconds=5)
+SYNC_ESPERA_MAX = float(os.getenv('SYNC_ESPERA_MAX', 60))  # Espera máxima a otra sincronización en curso
+SYNC_REINTENTO = 5  # Retry-After del 429 cuando se agota esa espera
+_SYNC_FILE = os.path.join(CONTENIDO_DIR, '.sincronizacion')
+_SYNC_LOCK_FILE = os.path.join(CONTENIDO_DIR, '.sincronizacion.lock')
+_SYNC_RESULTADO = os.path.join(CONTENIDO_DIR, '.sincronizacion.resultado')
+SYNC_AL_ARRANCAR = os.getenv('SYNC_AL_ARRANCAR', '1') == '1'
+SYNC_INTERVALO = float(os.getenv('SYNC_INTERVALO', 300))  # 0 = sin sincronización periódica
+
+_sincronizaciones_lock = threading.Lock()
+_sincronizaciones = {}  # completo -> {'evento', 'resultado'} de la que está en curso en este proceso
+
+def _leer_marca_sync():
+    """Devuelve la marca de agua de la última sincronización o None"""
+    try:
+        with open(_SYNC_FILE, 'r', encoding='utf-8') as f:
+            return datetime.fromisoformat(json.load(f)['watermark'])
+    except Exception:
+        return None
+
+def _documento_a_contenido(tutorial):
+    """Convierte un documento de Mongo en una entrada del almacén"""
+    actualizado = tutorial.get('updatedAt') or tutorial.get('createdAt')
+    return {
+        'title': tutorial.get('title'),
+        'language': tutorial.get('language'),
+        'level': tutorial.get('level'),
+        'duration': tutorial.get('duration'),
+        'description': tutorial.get('description'),
+        'content': tutorial.get('content', '<p>Contenido no disponible</p>'),
+        'lastUpdated': (actualizado or datetime.now()).isoformat()
+    }
+
+def _sin_marca(contenido):
+    """Entrada sin lastUpdated, para comparar si cambió algo de verdad"""
+    return {k: v for k, v in (contenido or {}).items() if k != 'lastUpdated'}
+
+def _volcar_lote(lote, resumen):
+    """Escribe en el almacén los documentos del lote que cambiaron"""
+    cambios = {}
+    pendientes = escrituras_pendientes()
+    for tutorial in lote:
+        tutorial_id = str(tutorial['_id'])
+        if tutorial_id in pendientes:
+            continue  # Hay un guardado más reciente camino de Mongo
+        contenido = _documento_a_contenido(tutorial)
+        if _sin_marca(obtener_contenido(tutorial_id)) != _sin_marca(contenido):
+            cambios[tutorial_id] = contenido
+    resumen['revisados'] += len(lote)
+    if cambios:
+        with _bloqueo_almacen():
+            _aplicar_cambios(cambios)
+        resumen['actualizados'] += len(cambios)
+
+def sincronizar_json(completo=False):
+    """Sincroniza MongoDB con el JSON automáticamente.
+
+    Devuelve un resumen con los documentos revisados, actualizados y
+    eliminados, o None si no se pudo sincronizar.
+    """
+    try:
+        tutorials_collection = conectar_mongodb()
+        if tutorials_collection is None:
+            print("❌ Colección no disponible para sincronizar")
+            return None
+        
+        inicio = ahora_utc()
+        marca = None if completo else _leer_marca_sync()
+        resumen = {
+            'modo': 'completo' if marca is None else 'incremental',
+            'revisados': 0,
+            'actualizados': 0,
+            'eliminados': 0
+        }
+        
+        filtro = {} if marca is None else {'updatedAt': {'$gte': marca - SYNC_MARGEN}}
+        vistos = set()
+        lote = []
+        for tutorial in tutorials_collection.find(filtro).batch_size(SYNC_BATCH):
+            vistos.add(str(tutorial['_id']))
+            lote.append(tutorial)
+            if len(lote) >= SYNC_BATCH:
+                _volcar_lote(lote, resumen)
+                lote = []
+        if lote:
+            _volcar_lote(lote, resumen)
+        
+        if marca is None:
+            # Sincronización completa: sobra todo lo que Mongo ya no tiene
+            eliminados = [tid for tid in cargar_indice() if tid not in vistos]
+        else:
+            lapidas = tutorials_collection.database[TOMBSTONES_COLLECTION].find(
+                {'deletedAt': {'$gte': marca - SYNC_MARGEN}}, {'tutorial_id': 1}
+            ).batch_size(SYNC_BATCH)
+            eliminados = [
+                l['tutorial_id'] for l in lapidas
+                if l['tutorial_id'] not in vistos and obtener_metadatos(l['tutorial_id']) is not None
+            ]
+        if eliminados:
+            with _bloqueo_almacen():
+                _aplicar_cambios({}, eliminados)
+            resumen['eliminados'] = len(eliminados)
+        
+        _escribir_atomico(_SYNC_FILE, {'watermark': inicio.isoformat()})
+        print(f"✅ JSON sincronizado con MongoDB: {resumen}")
+        return resumen
+    except Exception as e:
+        registrar_fallo_mongodb(e)
+        print(f"❌ Error sincronizando JSON: {e}")
+        return None
+
+def _sincronizar_entre_workers(completo):
+    """(resumen, compartido): sincroniza si ningún otro worker lo está haciendo.
+
+    flock sobre .sincronizacion.lock; si está tomado se espera a que se
+    libere y se usa el resultado que dejó el otro worker (si terminó después
+    de pedirla y cubre lo pedido: una completa vale por una incremental).
+    """
+    pedida = time.time()
+    with open(_SYNC_LOCK_FILE, 'a') as lock:
+        if fcntl is not None:
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                limite = time.monotonic() + SYNC_ESPERA_MAX
+                while True:
+                    time.sleep(0.1)
+                    try:
+                        fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                        break
+                    except OSError:
+                        if time.monotonic() > limite:
+                            raise TimeoutError("Hay otra sincronización en curso")
+                try:
+                    with open(_SYNC_RESULTADO, 'r', encoding='utf-8') as f:
+                        anterior = json.load(f)
+                    if anterior['terminada'] >= pedida and (anterior['completo'] or not completo):
+                        return anterior['resumen'], True
+                except (OSError, ValueError, KeyError):
+                    pass
+        resumen = sincronizar_json(completo=completo)
+        if resumen is not None:
+            _escribir_atomico(_SYNC_RESULTADO, {
+                'completo': completo, 'terminada': time.time(), 'resumen': resumen
+            }, compacto=True)
+        return resumen, False
+
+def sincronizar_una_vez(completo=False):
+    """sincronizar_json() sin duplicar trabajo: devuelve (resumen, compartido).
+
+    Si ya hay otra del mismo modo en curso (en este proceso o en otro worker)
+    se espera a que acabe y se recibe su resumen (compartido=True), o
+    TimeoutError pasado SYNC_ESPERA_MAX.
+    """
+    with _sincronizaciones_lock:
+        vuelo = _sincronizaciones.get(completo)
+        propia = vuelo is None
+        if propia:
+            vuelo = _sincronizaciones[completo] = {'evento': threading.Event(), 'resultado': (None, False)}
+    if not propia:
+        if not vuelo['evento'].wait(SYNC_ESPERA_MAX):
+            raise TimeoutError("Hay otra sincronización en curso")
+        contar('codeverse_sincronizacion_compartida_total')
+        return vuelo['resultado'][0], True
+    try:
+        vuelo['resultado'] = _sincronizar_entre_workers(completo)
+    finally:
+        with _sincronizaciones_lock:
+            del _sincronizaciones[completo]
+        vuelo['evento'].set()
+    if vuelo['resultado'][1]:
+        contar('codeverse_sincronizacion_compartida_total')
+    return vuelo['resultado']
+
+def sincronizar_al_arrancar():
+    """Sincronización bloqueante antes de servir. Devuelve el resumen o None"""
+    if conectar_mongodb() is None:
+        print("⚠️ MongoDB no responde: se arranca con el almacén local sin sincronizar")
+        return None
+    try:
+        # Los workers que arrancan a la vez esperan a la primera y reutilizan su resultado
+        return sincronizar_una_vez()[0]
+    except TimeoutError as e:
+        print(f"⚠️ Arranque sin sincronizar: {e}")
+        return None
+
+def _bucle_sincronizacion():
+    """Hilo de fondo: sincronización incremental periódica"""
+    while True:
+        time.sleep(SYNC_INTERVALO)
+        try:
+            # Con varios workers basta con que uno la haga en cada intervalo
+            if time.time() - os.path.getmtime(_SYNC_RESULTADO) < SYNC_INTERVALO / 2:
+                continue
+        except OSError:
+            pass
+        if conectar_mongodb() is None:
+            continue
+        try:
+            sincronizar_una_vez()
+        except TimeoutError:
+            pass  # Otro worker sigue con ella
+        except Exception as e:
+            print(f"⚠️ Error en la sincronización periódica: {e}")
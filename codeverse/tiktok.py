@@ -0,0 +1,359 @@
+"""Descargas de TikTok en segundo plano con caché de videos"""
+
+from flask import request, render_template, redirect, url_for, flash, jsonify, send_file, session
+from datetime import datetime
+from urllib.parse import urlsplit
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+import uuid
+from werkzeug.utils import secure_filename
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from . import app
+from .config import (
+    DOWNLOAD_FOLDER, sesion_http, TIKTOK_CACHE_MAX_BYTES, TIKTOK_CHUNK, TIKTOK_COLA_MAX,
+    TIKTOK_JANITOR_INTERVALO, TIKTOK_JOB_TTL, TIKTOK_MAX_BYTES, TIKTOK_TIMEOUT, TIKTOK_WORKERS,
+    TIKWM_API_URL
+)
+from .metricas import contar, medir
+from .almacen import _bloqueo_archivo, _escribir_atomico
+from .respuestas import pagina_estatica
+
+# ==================== DESCARGAS DE TIKTOK ====================
+# Las descargas se hacen en un pool acotado de hilos para no ocupar los
+# workers de gunicorn. El estado de cada trabajo se guarda en un pequeño JSON
+# dentro de DOWNLOAD_FOLDER para que cualquier worker pueda responder al
+# sondeo. Si la cola está llena se rechaza con 429.
+#
+# Los videos se guardan en una caché direccionada por contenido
+# (DOWNLOAD_FOLDER/videos/<hash del id de TikTok>.mp4) con un presupuesto de
+# bytes y expulsión LRU por mtime, así que repetir una descarga es leer disco.
+_TRABAJOS_DIR = os.path.join(DOWNLOAD_FOLDER, 'trabajos')
+_VIDEOS_DIR = os.path.join(DOWNLOAD_FOLDER, 'videos')
+_VIDEOS_LOCK_FILE = os.path.join(_VIDEOS_DIR, '.lock')
+_ID_TRABAJO = re.compile(r'^[0-9a-f]{32}$')
+_executor_tiktok = ThreadPoolExecutor(max_workers=TIKTOK_WORKERS, thread_name_prefix='tiktok')
+_tiktok_lock = threading.Lock()
+_videos_lock = threading.Lock()
+_tiktok_pendientes = 0
+_urls_resueltas = OrderedDict()  # URL normalizada -> (clave, nombre); evita repetir la consulta a tikwm
+_URLS_RESUELTAS_MAX = 1024
+
+def tiktok_pendientes():
+    """Trabajos de TikTok en cola o en curso en este proceso"""
+    with _tiktok_lock:
+        return _tiktok_pendientes
+
+def _ruta_trabajo(job_id):
+    return os.path.join(_TRABAJOS_DIR, f"{job_id}.json")
+
+def _ruta_video(clave):
+    return os.path.join(_VIDEOS_DIR, f"{clave}.mp4")
+
+def _clave_video(video_id):
+    """Clave de caché a partir del id resuelto por tikwm"""
+    return hashlib.sha256(str(video_id).encode('utf-8')).hexdigest()[:32]
+
+def _normalizar_url_tiktok(video_url):
+    """Quita parámetros de seguimiento para que la misma URL comparta entrada"""
+    partes = urlsplit(video_url.strip())
+    return f"{partes.netloc.lower()}{partes.path.rstrip('/')}"
+
+def _recordar_url(video_url, clave, nombre):
+    url = _normalizar_url_tiktok(video_url)
+    with _tiktok_lock:
+        _urls_resueltas[url] = (clave, nombre)
+        _urls_resueltas.move_to_end(url)
+        while len(_urls_resueltas) > _URLS_RESUELTAS_MAX:
+            _urls_resueltas.popitem(last=False)
+
+def _video_cacheado(video_url):
+    """(clave, nombre) si la URL ya se resolvió y el video sigue en caché"""
+    with _tiktok_lock:
+        resuelto = _urls_resueltas.get(_normalizar_url_tiktok(video_url))
+    if resuelto and os.path.exists(_ruta_video(resuelto[0])):
+        return resuelto
+    return None
+
+def _tocar_video(clave):
+    """Marca un video como usado recientemente (LRU por mtime, común a todos los workers)"""
+    try:
+        os.utime(_ruta_video(clave))
+    except OSError:
+        pass
+
+def _ajustar_cache_videos(conservar=None):
+    """Expulsa los videos menos usados hasta respetar TIKTOK_CACHE_MAX_BYTES"""
+    with _bloqueo_archivo(_VIDEOS_LOCK_FILE, _videos_lock):
+        videos = []
+        for nombre in os.listdir(_VIDEOS_DIR):
+            if not nombre.endswith('.mp4'):
+                continue
+            try:
+                st = os.stat(os.path.join(_VIDEOS_DIR, nombre))
+            except OSError:
+                continue
+            videos.append((st.st_mtime, st.st_size, nombre[:-4]))
+        total = sum(tamano for _, tamano, _ in videos)
+        for _, tamano, clave in sorted(videos):
+            if total <= TIKTOK_CACHE_MAX_BYTES:
+                break
+            if clave == conservar:
+                continue
+            try:
+                os.unlink(_ruta_video(clave))
+                total -= tamano
+            except OSError:
+                pass
+
+def _guardar_trabajo(job_id, **datos):
+    """Actualiza el estado de un trabajo (visible para todos los workers)"""
+    trabajo = leer_trabajo(job_id) or {'id': job_id}
+    trabajo.update(datos)
+    _escribir_atomico(_ruta_trabajo(job_id), trabajo)
+    return trabajo
+
+def leer_trabajo(job_id):
+    """Estado de un trabajo o None si no existe"""
+    if not _ID_TRABAJO.match(job_id):
+        return None
+    try:
+        with open(_ruta_trabajo(job_id), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _purgar_trabajos():
+    """Borra los trabajos más antiguos que TIKTOK_JOB_TTL (los videos quedan en caché)"""
+    limite = time.time() - TIKTOK_JOB_TTL
+    try:
+        nombres = os.listdir(_TRABAJOS_DIR)
+    except OSError:
+        return
+    for nombre in nombres:
+        ruta = os.path.join(_TRABAJOS_DIR, nombre)
+        try:
+            if os.path.getmtime(ruta) < limite:
+                os.unlink(ruta)
+        except OSError:
+            pass
+
+def limpiar_descargas():
+    """Conserje: trabajos caducados, temporales huérfanos, archivos ajenos y presupuesto"""
+    _purgar_trabajos()
+    limite = time.time() - TIKTOK_JOB_TTL
+    for nombre in os.listdir(_VIDEOS_DIR):
+        ruta = os.path.join(_VIDEOS_DIR, nombre)
+        try:
+            if nombre.endswith('.part'):
+                # Descarga interrumpida (p. ej. worker reiniciado a mitad)
+                if os.path.getmtime(ruta) < limite:
+                    os.unlink(ruta)
+            elif not re.match(r'^[0-9a-f]{32}\.mp4$', nombre) and nombre != '.lock':
+                os.unlink(ruta)
+        except OSError:
+            pass
+    # Restos de versiones anteriores que guardaban videos sueltos en DOWNLOAD_FOLDER
+    for nombre in os.listdir(DOWNLOAD_FOLDER):
+        if nombre.endswith('.mp4'):
+            try:
+                os.unlink(os.path.join(DOWNLOAD_FOLDER, nombre))
+            except OSError:
+                pass
+    _ajustar_cache_videos()
+
+def _bucle_conserje():
+    while True:
+        time.sleep(TIKTOK_JANITOR_INTERVALO)
+        try:
+            limpiar_descargas()
+        except Exception as e:
+            print(f"⚠️ Error limpiando descargas: {e}")
+
+def _descargar_tiktok(video_url):
+    """Resuelve el video con tikwm y lo deja en la caché de videos.
+
+    Devuelve (clave, nombre de archivo para el usuario). Los errores
+    esperables se lanzan como ValueError con un mensaje listo para mostrar.
+    """
+    with medir('codeverse_tiktok_segundos', llamada='api'):
+        response = sesion_http.get(TIKWM_API_URL, params={"url": video_url}, timeout=TIKTOK_TIMEOUT)
+        data = response.json()
+    if data["code"] != 0:
+        raise ValueError(data['msg'])
+
+    video_download_url = data["data"]["play"]
+    video_id = data['data'].get('id') or video_download_url
+    clave = _clave_video(video_id)
+    # El id viene de tikwm: solo se deja lo que es seguro en Content-Disposition
+    nombre = secure_filename(f"tiktok_{data['data'].get('id') or clave}.mp4")
+    destino = _ruta_video(clave)
+    if os.path.exists(destino):
+        _tocar_video(clave)
+        _recordar_url(video_url, clave, nombre)
+        return clave, nombre
+
+    with medir('codeverse_tiktok_segundos', llamada='descarga'), \
+            sesion_http.get(video_download_url, stream=True, timeout=TIKTOK_TIMEOUT) as upstream:
+        if upstream.status_code != 200:
+            raise ValueError("No se pudo descargar el video de TikTok.")
+        if int(upstream.headers.get('Content-Length') or 0) > TIKTOK_MAX_BYTES:
+            raise ValueError("El video es demasiado grande para descargarlo.")
+
+        temporal = f"{destino}.{uuid.uuid4().hex[:8]}.part"
+        escritos = 0
+        try:
+            with open(temporal, 'wb') as f:
+                for bloque in upstream.iter_content(TIKTOK_CHUNK):
+                    escritos += len(bloque)
+                    if escritos > TIKTOK_MAX_BYTES:
+                        raise ValueError("El video es demasiado grande para descargarlo.")
+                    f.write(bloque)
+            os.replace(temporal, destino)
+        except Exception:
+            try:
+                os.unlink(temporal)
+            except OSError:
+                pass
+            raise
+
+    _recordar_url(video_url, clave, nombre)
+    _ajustar_cache_videos(conservar=clave)
+    return clave, nombre
+
+def _ejecutar_trabajo(job_id, video_url):
+    """Cuerpo de cada trabajo del pool"""
+    global _tiktok_pendientes
+    try:
+        _guardar_trabajo(job_id, estado='descargando')
+        clave, nombre = _descargar_tiktok(video_url)
+        _guardar_trabajo(job_id, estado='listo', clave=clave, nombre=nombre)
+    except ValueError as e:
+        _guardar_trabajo(job_id, estado='error', mensaje=str(e))
+    except Exception as e:
+        _guardar_trabajo(job_id, estado='error', mensaje=f"Ocurrió un error inesperado: {str(e)}")
+    finally:
+        with _tiktok_lock:
+            _tiktok_pendientes -= 1
+
+def encolar_descarga_tiktok(video_url):
+    """Crea un trabajo de descarga. Devuelve su id o None si la cola está llena"""
+    global _tiktok_pendientes
+    job_id = uuid.uuid4().hex
+    cacheado = _video_cacheado(video_url)
+    contar('codeverse_tiktok_cache_total', 1, resultado='hit' if cacheado else 'miss')
+    if cacheado:
+        # Ya descargado: el trabajo nace terminado y no ocupa el pool
+        clave, nombre = cacheado
+        _tocar_video(clave)
+        _guardar_trabajo(job_id, estado='listo', clave=clave, nombre=nombre,
+                         creado=datetime.now().isoformat())
+        return job_id
+
+    with _tiktok_lock:
+        if _tiktok_pendientes >= TIKTOK_COLA_MAX:
+            return None
+        _tiktok_pendientes += 1
+    try:
+        _guardar_trabajo(job_id, estado='en_cola', creado=datetime.now().isoformat())
+        _executor_tiktok.submit(_ejecutar_trabajo, job_id, video_url)
+    except Exception:
+        with _tiktok_lock:
+            _tiktok_pendientes -= 1
+        raise
+    return job_id
+
+os.makedirs(_TRABAJOS_DIR, exist_ok=True)
+os.makedirs(_VIDEOS_DIR, exist_ok=True)
+threading.Thread(target=_bucle_conserje, name='tiktok-conserje', daemon=True).start()
+
+@app.route('/tiktok')
+def tiktok_page():
+    job_id = request.args.get('job')
+    if not job_id:
+        if '_flashes' in session:
+            # Vuelta de un error del formulario: el aviso solo es para este usuario
+            return render_template("tiktok.html"), 200, {'Cache-Control': 'no-store'}
+        return pagina_estatica("tiktok.html")
+    # Vuelta del formulario sin JavaScript: el estado se pinta aquí y la
+    # página se recarga sola (<meta refresh>) hasta que el video está listo
+    trabajo = leer_trabajo(job_id)
+    html_pagina = render_template(
+        "tiktok.html", trabajo=trabajo,
+        descarga_url=url_for('descargar_trabajo_tiktok', job_id=job_id)
+    )
+    return html_pagina, 200 if trabajo is not None else 404, {'Cache-Control': 'no-store'}
+
+@app.route('/tiktok-download', methods=['POST'])
+def tiktok_download():
+    """Envío clásico del formulario: encola y vuelve a la página a esperar"""
+    video_url = request.form.get('url')
+    if not video_url:
+        flash("Error: No se proporcionó una URL de TikTok.", "error")
+        return redirect(url_for('tiktok_page'))
+
+    try:
+        job_id = encolar_descarga_tiktok(video_url)
+        if job_id is None:
+            flash("Hay demasiadas descargas en curso. Inténtalo en unos segundos.", "error")
+            return render_template("tiktok.html"), 429, {'Retry-After': '5'}
+        return redirect(url_for('tiktok_page', job=job_id))
+    except Exception as e:
+        flash(f"Ocurrió un error inesperado: {str(e)}", "error")
+        return redirect(url_for('tiktok_page'))
+
+@app.route('/api/tiktok/jobs', methods=['POST'])
+def crear_trabajo_tiktok():
+    """Encolar una descarga de TikTok"""
+    data = request.get_json(silent=True) or request.form
+    video_url = data.get('url')
+    if not video_url:
+        return jsonify({"error": "No se proporcionó una URL de TikTok"}), 400
+
+    try:
+        job_id = encolar_descarga_tiktok(video_url)
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+    if job_id is None:
+        respuesta = jsonify({"error": "Hay demasiadas descargas en curso"})
+        respuesta.headers['Retry-After'] = '5'
+        return respuesta, 429
+
+    return jsonify({
+        "success": True,
+        "job_id": job_id,
+        "estado": "en_cola",
+        "status_url": url_for('estado_trabajo_tiktok', job_id=job_id)
+    }), 202
+
+@app.route('/api/tiktok/jobs/<job_id>', methods=['GET'])
+def estado_trabajo_tiktok(job_id):
+    """Consultar el estado de una descarga"""
+    trabajo = leer_trabajo(job_id)
+    if trabajo is None:
+        return jsonify({"error": "Trabajo no encontrado"}), 404
+    if trabajo.get('estado') == 'listo':
+        trabajo['descarga_url'] = url_for('descargar_trabajo_tiktok', job_id=job_id)
+    return jsonify({"success": True, "data": trabajo}), 200
+
+@app.route('/api/tiktok/jobs/<job_id>/descarga', methods=['GET'])
+def descargar_trabajo_tiktok(job_id):
+    """Entregar el video de un trabajo terminado"""
+    trabajo = leer_trabajo(job_id)
+    if trabajo is None:
+        return jsonify({"error": "Trabajo no encontrado"}), 404
+    if trabajo.get('estado') != 'listo':
+        return jsonify({"error": "La descarga todavía no está lista", "estado": trabajo.get('estado')}), 409
+    ruta = _ruta_video(trabajo.get('clave', ''))
+    if not os.path.exists(ruta):
+        return jsonify({"error": "El video ya no está disponible"}), 410
+    _tocar_video(trabajo['clave'])
+    # send_file usa wsgi.file_wrapper (sendfile en gunicorn) y atiende Range/If-Range
+    return send_file(os.path.abspath(ruta), mimetype='video/mp4', as_attachment=True,
+                     download_name=secure_filename(trabajo.get('nombre') or '') or f"tiktok_{job_id}.mp4",
+                     conditional=True, etag=trabajo['clave'])
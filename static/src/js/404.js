@@ -0,0 +1,23 @@
+// Add glitch effect on 404 number on hover
+const errorNumber = document.querySelector('.gradient-text');
+if (errorNumber) {
+    errorNumber.addEventListener('mouseenter', () => {
+        errorNumber.classList.add('animate-glitch');
+        setTimeout(() => {
+            errorNumber.classList.remove('animate-glitch');
+        }, 300);
+    });
+}
+
+// Easter egg: konami code
+let konamiCode = [];
+const correctCode = ['ArrowUp', 'ArrowUp', 'ArrowDown', 'ArrowDown', 'ArrowLeft', 'ArrowRight', 'ArrowLeft', 'ArrowRight', 'b', 'a'];
+
+document.addEventListener('keydown', (e) => {
+    konamiCode.push(e.key);
+    konamiCode = konamiCode.slice(-10);
+
+    if (konamiCode.join(',') === correctCode.join(',')) {
+        alert('🎉 ¡Código Konami activado! Eres un verdadero desarrollador.');
+    }
+});
@@ -0,0 +1,65 @@
+// Toggle Mobile Menu
+const mobileMenuBtn = document.getElementById('mobileMenuBtn');
+const mobileMenu = document.getElementById('mobileMenu');
+const menuIcon = document.getElementById('menuIcon');
+
+mobileMenuBtn?.addEventListener('click', () => {
+  const isHidden = mobileMenu.classList.contains('hidden');
+
+  if (isHidden) {
+    mobileMenu.classList.remove('hidden');
+    menuIcon.classList.remove('fa-bars');
+    menuIcon.classList.add('fa-times');
+    // Pequeño delay para la animación
+    setTimeout(() => {
+      mobileMenu.classList.add('mobile-menu-enter');
+    }, 10);
+  } else {
+    mobileMenu.classList.remove('mobile-menu-enter');
+    menuIcon.classList.remove('fa-times');
+    menuIcon.classList.add('fa-bars');
+    setTimeout(() => {
+      mobileMenu.classList.add('hidden');
+    }, 300);
+  }
+});
+
+// Cerrar menú al hacer clic en un enlace
+document.querySelectorAll('#mobileMenu a').forEach(link => {
+  link.addEventListener('click', () => {
+    mobileMenu.classList.remove('mobile-menu-enter');
+    menuIcon.classList.remove('fa-times');
+    menuIcon.classList.add('fa-bars');
+    setTimeout(() => {
+      mobileMenu.classList.add('hidden');
+    }, 300);
+  });
+});
+
+// Cerrar menú al hacer scroll (solo en móvil)
+let lastScroll = 0;
+window.addEventListener('scroll', () => {
+  if (window.innerWidth < 1024) { // Solo en pantallas menores a lg
+    const currentScroll = window.pageYOffset;
+    if (currentScroll > lastScroll && currentScroll > 100) {
+      if (!mobileMenu.classList.contains('hidden')) {
+        mobileMenu.classList.remove('mobile-menu-enter');
+        menuIcon.classList.remove('fa-times');
+        menuIcon.classList.add('fa-bars');
+        setTimeout(() => {
+          mobileMenu.classList.add('hidden');
+        }, 300);
+      }
+    }
+    lastScroll = currentScroll;
+  }
+});
+
+// Cerrar menú al cambiar tamaño de ventana
+window.addEventListener('resize', () => {
+  if (window.innerWidth >= 1024) {
+    mobileMenu.classList.add('hidden');
+    menuIcon.classList.remove('fa-times');
+    menuIcon.classList.add('fa-bars');
+  }
+});
@@ -0,0 +1,115 @@
+const display = document.getElementById('display');
+const buttons = document.querySelectorAll('button');
+
+let expression = '';
+let lastAnswer = '';
+
+function toRadians(deg) { return deg * (Math.PI/180); }
+
+function isValidExpression(expr) {
+    if(/[+\-*/^]{2,}/.test(expr)) return false;
+    if(expr.trim()==='') return false;
+    let stack = 0;
+    for(let c of expr){
+        if(c==='(') stack++;
+        else if(c===')') stack--;
+        if(stack<0) return false;
+    }
+    return stack===0;
+}
+
+function evaluateExpression(expr){
+    try{
+        if(!isValidExpression(expr)) return 'Error de Sintaxis';
+let sanitized = expr
+    .replace(/sin\(([^)]+)\)/g, 'Math.sin(toRadians($1))')
+    .replace(/cos\(([^)]+)\)/g, 'Math.cos(toRadians($1))')
+    .replace(/tan\(([^)]+)\)/g, 'Math.tan(toRadians($1))')
+    .replace(/log\(([^)]+)\)/g, 'Math.log10($1)')
+    .replace(/\^/g, '**')
+    .replace(/Ans/g, lastAnswer || '0');
+
+        let result = eval(sanitized);
+        if(typeof result==='number' && isFinite(result)){
+            result = Math.round((result + Number.EPSILON)*1e10)/1e10;
+        } else if(!isFinite(result)) return 'Indefinido';
+        return result.toString();
+    } catch(e){ return 'Error'; }
+}
+
+buttons.forEach(button=>{
+    button.addEventListener('click', ()=>{
+        const action = button.getAttribute('data-action');
+        const value = button.textContent.trim();
+
+        if(display.value==='Error' || display.value==='Error de Sintaxis' || display.value==='Indefinido'){
+            expression=''; display.value='';
+        }
+
+        switch(action){
+            case 'clear': expression=''; display.value=''; break;
+            case 'backspace': expression=expression.slice(0,-1); display.value=expression; break;
+            case 'equal':
+                let result = evaluateExpression(expression);
+                display.value=result;
+                if(result!=='Error' && result!=='Error de Sintaxis' && result!=='Indefinido'){
+                    lastAnswer=result;
+                    expression=result;
+                } else expression='';
+                break;
+            case 'sin':
+            case 'cos':
+            case 'tan':
+            case 'log':
+                expression+=`${action}(`;
+                display.value=expression;
+                break;
+            case 'ans':
+                if(lastAnswer){ expression+='Ans'; display.value=expression; }
+                break;
+            case '^':
+            case '+':
+            case '-':
+            case '*':
+            case '/':
+            case '(':
+            case ')':
+                expression+=action;
+                display.value=expression;
+                break;
+            default:
+                expression+=value;
+                display.value=expression;
+                break;
+        }
+    });
+});
+
+document.addEventListener('keydown', (event)=>{
+    const allowedKeys='0123456789+-*/().^';
+    const key = event.key;
+
+    if(display.value==='Error' || display.value==='Error de Sintaxis' || display.value==='Indefinido'){
+        expression=''; display.value='';
+    }
+
+    if(allowedKeys.includes(key)){
+        expression+=key;
+        display.value=expression;
+    } else if(key==='Enter' || key==='='){
+        let result=evaluateExpression(expression);
+        display.value=result;
+        if(result!=='Error' && result!=='Error de Sintaxis' && result!=='Indefinido'){
+            lastAnswer=result;
+            expression=result;
+        } else expression='';
+        event.preventDefault();
+    } else if(key==='Backspace'){
+        expression=expression.slice(0,-1);
+        display.value=expression;
+        event.preventDefault();
+    } else if(key==='Escape'){
+        expression=''; display.value='';
+        event.preventDefault();
+    }
+});
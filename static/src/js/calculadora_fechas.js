@@ -0,0 +1,38 @@
+const fechaInicio = document.getElementById("fechaInicio");
+const fechaFin = document.getElementById("fechaFin");
+const calcularBtn = document.getElementById("calcularBtn");
+const resultado = document.getElementById("resultado");
+
+calcularBtn.addEventListener("click", () => {
+  const inicio = new Date(fechaInicio.value);
+  const fin = new Date(fechaFin.value);
+
+  if (!fechaInicio.value || !fechaFin.value) {
+    resultado.textContent = "⚠️ Por favor selecciona ambas fechas.";
+    resultado.classList.remove("hidden");
+    return;
+  }
+
+  if (fin < inicio) {
+    resultado.textContent = "❌ La fecha final no puede ser anterior a la inicial.";
+    resultado.classList.remove("hidden");
+    return;
+  }
+
+  // Calcular diferencia
+  const diffTiempo = fin - inicio;
+  const diffDias = Math.floor(diffTiempo / (1000 * 60 * 60 * 24));
+  const diffAños = Math.floor(diffDias / 365);
+  const diffMeses = Math.floor((diffDias % 365) / 30);
+  const diasRestantes = diffDias - diffAños * 365 - diffMeses * 30;
+
+  resultado.innerHTML = `
+    <p>🗓️ <span class="text-cyan-400">${diffDias}</span> días en total</p>
+    <p>📆 Aproximadamente 
+      <span class="text-cyan-400">${diffAños}</span> años, 
+      <span class="text-cyan-400">${diffMeses}</span> meses y 
+      <span class="text-cyan-400">${diasRestantes}</span> días
+    </p>
+  `;
+  resultado.classList.remove("hidden");
+});
@@ -0,0 +1,88 @@
+document.getElementById('contactForm').addEventListener('submit', function(e) {
+    e.preventDefault();
+
+    // Obtener valores del formulario
+    const nombre = document.getElementById('nombre').value;
+    const email = document.getElementById('email').value;
+    const asunto = document.getElementById('asunto').value;
+    const mensaje = document.getElementById('mensaje').value;
+
+    // Validar que todos los campos estén llenos
+    if (!nombre || !email || !asunto || !mensaje) {
+        Toastify({
+            text: "⚠️ Por favor completa todos los campos",
+            duration: 3000,
+            gravity: "top",
+            position: "right",
+            className: "error",
+            stopOnFocus: true
+        }).showToast();
+        return;
+    }
+
+    // Validar email
+    const emailRegex = /^[^\s@]+@[^\s@]+\.[^\s@]+$/;
+    if (!emailRegex.test(email)) {
+        Toastify({
+            text: "⚠️ Por favor ingresa un email válido",
+            duration: 3000,
+            gravity: "top",
+            position: "right",
+            className: "error",
+            stopOnFocus: true
+        }).showToast();
+        return;
+    }
+
+    // Mostrar notificación de éxito
+    Toastify({
+        text: "✅ ¡Redirigiendo a WhatsApp!",
+        duration: 2000,
+        gravity: "top",
+        position: "right",
+        className: "success",
+        stopOnFocus: true
+    }).showToast();
+
+    // Crear mensaje para WhatsApp
+    const mensajeWhatsApp = `*Nuevo mensaje de CodeVerse*%0A%0A` +
+                           `*Nombre:* ${encodeURIComponent(nombre)}%0A` +
+                           `*Email:* ${encodeURIComponent(email)}%0A` +
+                           `*Asunto:* ${encodeURIComponent(asunto)}%0A%0A` +
+                           `*Mensaje:*%0A${encodeURIComponent(mensaje)}`;
+
+    // Número de WhatsApp
+    const numeroWhatsApp = '524661002589';
+
+    // Crear URL de WhatsApp
+    const urlWhatsApp = `https://wa.me/${numeroWhatsApp}?text=${mensajeWhatsApp}`;
+
+    // Esperar un momento antes de abrir WhatsApp
+    setTimeout(() => {
+        // Abrir WhatsApp en una nueva pestaña
+        window.open(urlWhatsApp, '_blank');
+
+        // Limpiar formulario
+        this.reset();
+    }, 500);
+});
+
+// Animación para campos vacíos
+document.querySelectorAll('input, textarea, select').forEach(field => {
+    field.addEventListener('invalid', function(e) {
+        e.preventDefault();
+        this.classList.add('shake-on-error');
+        setTimeout(() => {
+            this.classList.remove('shake-on-error');
+        }, 300);
+
+        Toastify({
+            text: `⚠️ El campo "${this.previousElementSibling.textContent.trim()}" es requerido`,
+            duration: 3000,
+            gravity: "top",
+            position: "right",
+            className: "error",
+            stopOnFocus: true
+        }).showToast();
+    });
+});
@@ -0,0 +1,99 @@
+// Factores de conversión
+const conversiones = {
+    longitud: {
+        m: 1,
+        km: 0.001,
+        cm: 100,
+        mm: 1000,
+        mi: 0.000621371,
+        yd: 1.09361,
+        ft: 3.28084,
+        in: 39.3701
+    },
+    peso: {
+        kg: 1,
+        g: 1000,
+        mg: 1000000,
+        lb: 2.20462,
+        oz: 35.274,
+        ton: 0.001
+    },
+    temperatura: {
+        c: (v, to) => {
+            if (to === 'f') return (v * 9/5) + 32;
+            if (to === 'k') return v + 273.15;
+            return v;
+        },
+        f: (v, to) => {
+            if (to === 'c') return (v - 32) * 5/9;
+            if (to === 'k') return (v - 32) * 5/9 + 273.15;
+            return v;
+        },
+        k: (v, to) => {
+            if (to === 'c') return v - 273.15;
+            if (to === 'f') return (v - 273.15) * 9/5 + 32;
+            return v;
+        }
+    },
+    volumen: {
+        l: 1,
+        ml: 1000,
+        m3: 0.001,
+        cm3: 1000,
+        gal: 0.264172,
+        pt: 2.11338
+    }
+};
+
+// Tabs functionality
+document.querySelectorAll('.tab-button').forEach(button => {
+    button.addEventListener('click', () => {
+        const tabName = button.getAttribute('data-tab');
+
+        document.querySelectorAll('.tab-button').forEach(btn => {
+            btn.classList.remove('active');
+        });
+        document.querySelectorAll('.tab-content').forEach(content => {
+            content.classList.remove('active');
+        });
+
+        button.classList.add('active');
+        document.getElementById(tabName).classList.add('active');
+    });
+});
+
+// Conversión function
+function convertir(tipo) {
+    const valor = parseFloat(document.getElementById(`${tipo}-valor`).value);
+    const de = document.getElementById(`${tipo}-de`).value;
+    const a = document.getElementById(`${tipo}-a`).value;
+
+    if (isNaN(valor) || valor === '') {
+        document.getElementById(`${tipo}-resultado`).value = '';
+        return;
+    }
+
+    let resultado;
+    if (tipo === 'temperatura') {
+        resultado = conversiones[tipo][de](valor, a);
+    } else {
+        const valorEnBase = valor / conversiones[tipo][de];
+        resultado = valorEnBase * conversiones[tipo][a];
+    }
+
+    document.getElementById(`${tipo}-resultado`).value = resultado.toFixed(6).replace(/\.?0+$/, '');
+}
+
+// Event listeners para conversiones
+['longitud', 'peso', 'temperatura', 'volumen'].forEach(tipo => {
+    document.getElementById(`${tipo}-valor`).addEventListener('input', () => convertir(tipo));
+    document.getElementById(`${tipo}-de`).addEventListener('change', () => convertir(tipo));
+    document.getElementById(`${tipo}-a`).addEventListener('change', () => convertir(tipo));
+});
+
+// Quick conversions
+document.querySelectorAll('.quick-convert').forEach(button => {
+    button.addEventListener('click', () => {
+        alert('Conversión rápida: ' + button.getAttribute('data-from') + ' a ' + button.getAttribute('data-to'));
+    });
+});
@@ -0,0 +1,33 @@
+// Código JavaScript de la calculadora IMC
+function calcularIMC() {
+    const peso = parseFloat(document.getElementById('peso').value);
+    const altura = parseFloat(document.getElementById('altura').value) / 100;
+
+    if (!peso || !altura || peso <= 0 || altura <= 0) {
+        alert('Por favor ingresa valores válidos');
+        return;
+    }
+
+    const imc = (peso / (altura * altura)).toFixed(1);
+    let categoria = '';
+    let color = '';
+
+    if (imc < 18.5) {
+        categoria = 'Bajo peso';
+        color = 'text-blue-400';
+    } else if (imc < 25) {
+        categoria = 'Peso normal';
+        color = 'text-green-400';
+    } else if (imc < 30) {
+        categoria = 'Sobrepeso';
+        color = 'text-yellow-400';
+    } else {
+        categoria = 'Obesidad';
+        color = 'text-red-400';
+    }
+
+    document.getElementById('imcValor').textContent = imc;
+    document.getElementById('imcValor').className = `text-3xl font-bold mt-2 ${color}`;
+    document.getElementById('imcCategoria').textContent = categoria;
+    document.getElementById('resultIMC').classList.remove('hidden');
+}
@@ -0,0 +1,446 @@
+const colors = [
+  "note-yellow",
+  "note-pink",
+  "note-blue",
+  "note-green",
+  "note-purple",
+  "note-orange",
+  "note-red",
+  "note-cyan",
+];
+const colorData = {
+  "note-yellow": "#fef3c7",
+  "note-pink": "#fbcfe8",
+  "note-blue": "#bfdbfe",
+  "note-green": "#bbf7d0",
+  "note-purple": "#e9d5ff",
+  "note-orange": "#fed7aa",
+  "note-red": "#fecaca",
+  "note-cyan": "#a5f3fc",
+};
+let notes = JSON.parse(localStorage.getItem("stickyNotes")) || [];
+let reminders = JSON.parse(localStorage.getItem("stickyReminders")) || [];
+let currentReminderNoteIndex = null;
+const notesContainer = document.getElementById("notesContainer");
+const emptyState = document.getElementById("emptyState");
+const noteCount = document.getElementById("noteCount");
+const reminderCount = document.getElementById("reminderCount");
+let notificationPermission = false;
+
+async function requestNotificationPermission() {
+  if ("Notification" in window && Notification.permission === "default") {
+    const permission = await Notification.requestPermission();
+    notificationPermission = permission === "granted";
+    if (notificationPermission)
+      showCustomAlert("✅ Notificaciones activadas correctamente");
+  } else if (
+    "Notification" in window &&
+    Notification.permission === "granted"
+  ) {
+    notificationPermission = true;
+  }
+}
+
+function showNotification(title, body) {
+  if (notificationPermission && "Notification" in window) {
+    const notification = new Notification(title, {
+      body: body,
+      icon: 'data:image/svg+xml,<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 100 100"><text y="80" font-size="80">📝</text></svg>',
+      badge:
+        'data:image/svg+xml,<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 100 100"><text y="80" font-size="80">⏰</text></svg>',
+      vibrate: [200, 100, 200],
+      requireInteraction: true,
+      tag: "sticky-note-reminder",
+    });
+    notification.onclick = () => {
+      window.focus();
+      notification.close();
+    };
+  } else {
+    alert(`⏰ ${title}\n${body}`);
+  }
+}
+
+function showCustomAlert(message) {
+  const alertDiv = document.createElement("div");
+  alertDiv.style.cssText = `position: fixed;top: 120px;right: 20px;background: linear-gradient(135deg, #fbbf24 0%, #f59e0b 100%);color: black;padding: 16px 24px;border-radius: 12px;box-shadow: 0 8px 24px rgba(0, 0, 0, 0.3);z-index: 3000;font-weight: bold;animation: slideInRight 0.3s ease;`;
+  alertDiv.textContent = message;
+  document.body.appendChild(alertDiv);
+  setTimeout(() => {
+    alertDiv.style.animation = "slideOut 0.3s ease";
+    setTimeout(() => alertDiv.remove(), 300);
+  }, 3000);
+}
+
+requestNotificationPermission();
+
+function saveNotes() {
+  localStorage.setItem("stickyNotes", JSON.stringify(notes));
+  updateNoteCount();
+  updateEmptyState();
+}
+
+function saveReminders() {
+  localStorage.setItem("stickyReminders", JSON.stringify(reminders));
+  updateReminderCount();
+}
+
+function updateNoteCount() {
+  noteCount.textContent = notes.length;
+}
+function updateReminderCount() {
+  reminderCount.textContent = reminders.length;
+}
+function updateEmptyState() {
+  emptyState.style.display = notes.length === 0 ? "block" : "none";
+}
+
+function createNoteElement(noteObj, index) {
+  const noteDiv = document.createElement("div");
+  const color =
+    noteObj.color || colors[Math.floor(Math.random() * colors.length)];
+  const x = noteObj.x || Math.random() * (window.innerWidth - 300);
+  const y = noteObj.y || 120 + Math.random() * (window.innerHeight - 300);
+  const rotation = noteObj.rotation || Math.random() * 6 - 3;
+
+  noteDiv.classList.add("note", color);
+  noteDiv.style.left = x + "px";
+  noteDiv.style.top = y + "px";
+  noteDiv.style.setProperty("--rotation", rotation + "deg");
+
+  const hasReminder = reminders.some((r) => r.noteIndex === index);
+  if (hasReminder) noteDiv.classList.add("with-reminder");
+
+  const header = document.createElement("div");
+  header.classList.add("note-header");
+
+  if (hasReminder) {
+    const badge = document.createElement("div");
+    badge.classList.add("reminder-badge");
+    badge.innerHTML = '<i class="fas fa-bell"></i> Recordatorio';
+    header.appendChild(badge);
+  }
+
+  const deleteBtn = document.createElement("button");
+  deleteBtn.innerHTML = '<i class="fas fa-trash"></i>';
+  deleteBtn.classList.add("delete-btn");
+  deleteBtn.onclick = (e) => {
+    e.stopPropagation();
+    noteDiv.classList.add("removing");
+    setTimeout(() => {
+      notes.splice(index, 1);
+      reminders = reminders.filter((r) => r.noteIndex !== index);
+      saveNotes();
+      saveReminders();
+      renderNotes();
+    }, 300);
+  };
+  header.appendChild(deleteBtn);
+  noteDiv.appendChild(header);
+
+  const textarea = document.createElement("textarea");
+  textarea.value = noteObj.content;
+  textarea.placeholder = "Escribe tu nota...";
+  textarea.oninput = () => {
+    notes[index].content = textarea.value;
+    saveNotes();
+  };
+  noteDiv.appendChild(textarea);
+
+  const toolbar = document.createElement("div");
+  toolbar.classList.add("note-toolbar");
+
+  const rotationDisplay = document.createElement("div");
+  rotationDisplay.classList.add("rotation-display");
+  rotationDisplay.textContent = "↻ " + rotation.toFixed(1) + "°";
+  toolbar.appendChild(rotationDisplay);
+
+  const colorPalette = document.createElement("div");
+  colorPalette.classList.add("color-palette");
+  colors.forEach((colorClass) => {
+    const colorBtn = document.createElement("button");
+    colorBtn.classList.add("note-color-btn");
+    colorBtn.style.background = colorData[colorClass];
+    colorBtn.style.borderColor =
+      colorClass === color ? "rgba(0, 0, 0, 0.3)" : "transparent";
+    colorBtn.onclick = (e) => {
+      e.stopPropagation();
+      notes[index].color = colorClass;
+      saveNotes();
+      renderNotes();
+    };
+    colorPalette.appendChild(colorBtn);
+  });
+  toolbar.appendChild(colorPalette);
+
+  const reminderBtn = document.createElement("button");
+  reminderBtn.classList.add("note-btn");
+  reminderBtn.innerHTML = '<i class="fas fa-bell"></i>';
+  reminderBtn.title = "Establecer recordatorio";
+  reminderBtn.onclick = (e) => {
+    e.stopPropagation();
+    currentReminderNoteIndex = index;
+    document.getElementById("reminderModal").classList.add("active");
+  };
+  toolbar.appendChild(reminderBtn);
+  noteDiv.appendChild(toolbar);
+
+  let isDragging = false,
+    offsetX = 0,
+    offsetY = 0,
+    initialRotation = rotation,
+    touchStartAngle = 0,
+    isMultiTouch = false;
+
+  noteDiv.addEventListener("mousedown", (e) => {
+    if (
+      e.target.closest(".note-btn") ||
+      e.target.closest(".delete-btn") ||
+      e.target.closest(".note-color-btn")
+    )
+      return;
+    isDragging = true;
+    noteDiv.classList.add("dragging");
+    offsetX = e.clientX - noteDiv.offsetLeft;
+    offsetY = e.clientY - noteDiv.offsetTop;
+  });
+
+  document.addEventListener("mousemove", (e) => {
+    if (isDragging) {
+      noteDiv.style.left = e.clientX - offsetX + "px";
+      noteDiv.style.top = e.clientY - offsetY + "px";
+      notes[index].x = e.clientX - offsetX;
+      notes[index].y = e.clientY - offsetY;
+      saveNotes();
+    }
+  });
+
+  document.addEventListener("mouseup", () => {
+    if (isDragging) {
+      isDragging = false;
+      noteDiv.classList.remove("dragging");
+    }
+  });
+
+  noteDiv.addEventListener("touchstart", (e) => {
+    if (
+      e.target.closest(".note-btn") ||
+      e.target.closest(".delete-btn") ||
+      e.target.closest(".note-color-btn")
+    )
+      return;
+    if (e.touches.length === 1) {
+      isDragging = true;
+      noteDiv.classList.add("dragging");
+      const touch = e.touches[0];
+      offsetX = touch.clientX - noteDiv.offsetLeft;
+      offsetY = touch.clientY - noteDiv.offsetTop;
+      isMultiTouch = false;
+    } else if (e.touches.length === 2) {
+      e.preventDefault();
+      isDragging = false;
+      isMultiTouch = true;
+      const touch1 = e.touches[0],
+        touch2 = e.touches[1];
+      const dx = touch2.clientX - touch1.clientX,
+        dy = touch2.clientY - touch1.clientY;
+      touchStartAngle = Math.atan2(dy, dx) * (180 / Math.PI);
+      initialRotation =
+        parseFloat(noteDiv.style.getPropertyValue("--rotation")) ||
+        rotation;
+      noteDiv.classList.add("dragging");
+    }
+  });
+
+  noteDiv.addEventListener("touchmove", (e) => {
+    if (e.touches.length === 1 && isDragging && !isMultiTouch) {
+      e.preventDefault();
+      const touch = e.touches[0];
+      const newLeft = touch.clientX - offsetX,
+        newTop = touch.clientY - offsetY;
+      noteDiv.style.left = newLeft + "px";
+      noteDiv.style.top = newTop + "px";
+      notes[index].x = newLeft;
+      notes[index].y = newTop;
+    } else if (e.touches.length === 2 && isMultiTouch) {
+      e.preventDefault();
+      const touch1 = e.touches[0],
+        touch2 = e.touches[1];
+      const dx = touch2.clientX - touch1.clientX,
+        dy = touch2.clientY - touch1.clientY;
+      const currentAngle = Math.atan2(dy, dx) * (180 / Math.PI);
+      let angleDiff = currentAngle - touchStartAngle;
+      let newRotation = initialRotation + angleDiff;
+      newRotation = ((newRotation % 360) + 360) % 360;
+      noteDiv.style.setProperty("--rotation", newRotation + "deg");
+      rotationDisplay.textContent = "↻ " + newRotation.toFixed(1) + "°";
+      notes[index].rotation = newRotation;
+      saveNotes();
+    }
+  });
+
+  noteDiv.addEventListener("touchend", (e) => {
+    if (isDragging || isMultiTouch) {
+      isDragging = false;
+      isMultiTouch = false;
+      noteDiv.classList.remove("dragging");
+      saveNotes();
+    }
+  });
+
+  noteDiv.addEventListener("touchcancel", () => {
+    isDragging = false;
+    isMultiTouch = false;
+    noteDiv.classList.remove("dragging");
+  });
+
+  noteDiv.addEventListener("wheel", (e) => {
+    if (e.ctrlKey || e.metaKey) {
+      e.preventDefault();
+      let currentRotation =
+        parseFloat(noteDiv.style.getPropertyValue("--rotation")) ||
+        rotation;
+      let newRotation = currentRotation + (e.deltaY > 0 ? -2 : 2);
+      newRotation = ((newRotation % 360) + 360) % 360;
+      noteDiv.style.setProperty("--rotation", newRotation + "deg");
+      rotationDisplay.textContent = "↻ " + newRotation.toFixed(1) + "°";
+      notes[index].rotation = newRotation;
+      saveNotes();
+    }
+  });
+
+  noteDiv.addEventListener("keydown", (e) => {
+    if (e.key === "ArrowLeft" && (e.ctrlKey || e.metaKey)) {
+      e.preventDefault();
+      let currentRotation =
+        parseFloat(noteDiv.style.getPropertyValue("--rotation")) ||
+        rotation;
+      let newRotation = currentRotation - 5;
+      noteDiv.style.setProperty("--rotation", newRotation + "deg");
+      rotationDisplay.textContent = "↻ " + newRotation.toFixed(1) + "°";
+      notes[index].rotation = newRotation;
+      saveNotes();
+    } else if (e.key === "ArrowRight" && (e.ctrlKey || e.metaKey)) {
+      e.preventDefault();
+      let currentRotation =
+        parseFloat(noteDiv.style.getPropertyValue("--rotation")) ||
+        rotation;
+      let newRotation = currentRotation + 5;
+      noteDiv.style.setProperty("--rotation", newRotation + "deg");
+      rotationDisplay.textContent = "↻ " + newRotation.toFixed(1) + "°";
+      notes[index].rotation = newRotation;
+      saveNotes();
+    }
+  });
+
+  return noteDiv;
+}
+
+function renderNotes() {
+  notesContainer.innerHTML = "";
+  notes.forEach((note, idx) => {
+    const noteEl = createNoteElement(note, idx);
+    notesContainer.appendChild(noteEl);
+  });
+  updateNoteCount();
+  updateEmptyState();
+  updateReminderCount();
+}
+
+function saveReminder() {
+  const titleInput = document.getElementById("reminderTitle");
+  const valueInput = document.getElementById("reminderValue");
+  const unitSelect = document.getElementById("reminderUnit");
+
+  if (!titleInput || !valueInput || !unitSelect) {
+    console.error("Elementos del modal no encontrados");
+    return;
+  }
+
+  const title = titleInput.value || "Recordatorio";
+  const value = parseInt(valueInput.value) || 5;
+  const unit = unitSelect.value;
+
+  let milliseconds = 0;
+  switch (unit) {
+    case "seconds":
+      milliseconds = value * 1000;
+      break;
+    case "minutes":
+      milliseconds = value * 60 * 1000;
+      break;
+    case "hours":
+      milliseconds = value * 60 * 60 * 1000;
+      break;
+    case "days":
+      milliseconds = value * 24 * 60 * 60 * 1000;
+      break;
+  }
+
+  const time = Date.now() + milliseconds;
+  reminders.push({
+    noteIndex: currentReminderNoteIndex,
+    title: title,
+    time: time,
+  });
+  saveReminders();
+  closeReminderModal();
+  renderNotes();
+}
+
+function closeReminderModal() {
+  document.getElementById("reminderModal").classList.remove("active");
+  const titleInput = document.getElementById("reminderTitle");
+  const valueInput = document.getElementById("reminderValue");
+  const unitSelect = document.getElementById("reminderUnit");
+
+  if (titleInput) titleInput.value = "";
+  if (valueInput) valueInput.value = "5";
+  if (unitSelect) unitSelect.value = "minutes";
+
+  currentReminderNoteIndex = null;
+}
+
+function checkReminders() {
+  const now = Date.now();
+  reminders = reminders.filter((reminder) => {
+    if (now >= reminder.time) {
+      const noteContent =
+        notes[reminder.noteIndex]?.content || "Sin contenido";
+      showNotification(
+        `⏰ ${reminder.title}`,
+        noteContent.substring(0, 100) +
+          (noteContent.length > 100 ? "..." : "")
+      );
+      return false;
+    }
+    return true;
+  });
+  saveReminders();
+  renderNotes();
+}
+
+document.getElementById("addNoteBtn").addEventListener("click", () => {
+  const randomColor = colors[Math.floor(Math.random() * colors.length)];
+  const randomX = Math.random() * (window.innerWidth - 300);
+  const randomY = 120 + Math.random() * (window.innerHeight - 300);
+  const randomRotation = Math.random() * 6 - 3;
+  notes.push({
+    content: "",
+    color: randomColor,
+    x: randomX,
+    y: randomY,
+    rotation: randomRotation,
+  });
+  saveNotes();
+  renderNotes();
+});
+
+document
+  .getElementById("reminderModal")
+  .addEventListener("click", (e) => {
+    if (e.target.id === "reminderModal") closeReminderModal();
+  });
+
+setInterval(checkReminders, 10000);
+renderNotes();
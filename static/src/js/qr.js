@@ -0,0 +1,575 @@
+    class QRGenerator {
+        constructor() {
+            this.qr = null;
+            this.logoImage = null;
+            this.currentType = 'url';
+            this.init();
+        }
+
+        init() {
+            this.setupEventListeners();
+            this.setupColorPickers();
+            this.setupFileUpload();
+        }
+
+        setupEventListeners() {
+            // Content type buttons
+            document.querySelectorAll('.content-type-btn').forEach(btn => {
+                btn.addEventListener('click', (e) => {
+                    this.switchContentType(e.target.dataset.type);
+                });
+            });
+
+            // Generate button
+            document.getElementById('generateBtn').addEventListener('click', () => {
+                this.generateQR();
+            });
+
+            // Download button
+            document.getElementById('downloadBtn').addEventListener('click', () => {
+                this.downloadQR();
+            });
+
+            // Size slider
+            document.getElementById('qrSize').addEventListener('input', (e) => {
+                document.getElementById('sizeValue').textContent = e.target.value + 'px';
+            });
+
+            // Real-time updates for inputs
+            const inputIds = [
+                'urlField', 'textField', 'wifiSSID', 'wifiPassword', 'wifiSecurity',
+                'contactName', 'contactPhone', 'contactEmail',
+                'emailTo', 'emailSubject', 'emailBody',
+                'phoneNumber', 'smsNumber', 'smsMessage',
+                'whatsappNumber', 'whatsappMessage',
+                'locationLat', 'locationLng',
+                'eventTitle', 'eventStart', 'eventEnd', 'eventLocation',
+                'socialPlatform', 'socialUsername',
+                'bitcoinAddress', 'bitcoinAmount', 'bitcoinLabel'
+            ];
+
+            inputIds.forEach(id => {
+                const element = document.getElementById(id);
+                if (element) {
+                    element.addEventListener('input', () => {
+                        // Auto-generate if there's already a QR
+                        if (this.qr && this.getQRContent().trim()) {
+                            this.generateQR();
+                        }
+                    });
+                }
+            });
+        }
+
+        setupColorPickers() {
+            const foregroundPicker = document.getElementById('foregroundColor');
+            const backgroundPicker = document.getElementById('backgroundColor');
+
+            foregroundPicker.addEventListener('change', (e) => {
+                document.getElementById('foregroundHex').textContent = e.target.value;
+                if (this.qr) this.generateQR();
+            });
+
+            backgroundPicker.addEventListener('change', (e) => {
+                document.getElementById('backgroundHex').textContent = e.target.value;
+                if (this.qr) this.generateQR();
+            });
+        }
+
+        setupFileUpload() {
+            const dropArea = document.getElementById('logoDropArea');
+            const fileInput = document.getElementById('logoInput');
+            const removeBtn = document.getElementById('removeLogo');
+
+            dropArea.addEventListener('click', () => fileInput.click());
+            dropArea.addEventListener('dragover', (e) => {
+                e.preventDefault();
+                dropArea.classList.add('dragover');
+            });
+            dropArea.addEventListener('dragleave', () => {
+                dropArea.classList.remove('dragover');
+            });
+            dropArea.addEventListener('drop', (e) => {
+                e.preventDefault();
+                dropArea.classList.remove('dragover');
+                const files = e.dataTransfer.files;
+                if (files.length > 0) this.handleFile(files[0]);
+            });
+
+            fileInput.addEventListener('change', (e) => {
+                if (e.target.files.length > 0) this.handleFile(e.target.files[0]);
+            });
+
+            removeBtn.addEventListener('click', () => {
+                this.removeLogo();
+            });
+        }
+
+        handleFile(file) {
+            if (file.size > 5 * 1024 * 1024) {
+                this.showMessage('El archivo es demasiado grande. Máximo 5MB.', 'error');
+                return;
+            }
+
+            if (!file.type.startsWith('image/')) {
+                this.showMessage('Por favor selecciona un archivo de imagen válido.', 'error');
+                return;
+            }
+
+            const reader = new FileReader();
+            reader.onload = (e) => {
+                const img = new Image();
+                img.onload = () => {
+                    this.logoImage = img;
+                    document.getElementById('logoPreviewImg').src = e.target.result;
+                    document.getElementById('logoUploadContent').classList.add('hidden');
+                    document.getElementById('logoPreview').classList.remove('hidden');
+                    if (this.qr) this.generateQR();
+                };
+                img.src = e.target.result;
+            };
+            reader.readAsDataURL(file);
+        }
+
+        removeLogo() {
+            this.logoImage = null;
+            document.getElementById('logoUploadContent').classList.remove('hidden');
+            document.getElementById('logoPreview').classList.add('hidden');
+            document.getElementById('logoInput').value = '';
+            if (this.qr) this.generateQR();
+        }
+
+        switchContentType(type) {
+            // Update buttons
+            document.querySelectorAll('.content-type-btn').forEach(btn => {
+                btn.classList.remove('active', 'bg-blue-600');
+                btn.classList.add('bg-gray-700');
+            });
+            document.querySelector(`[data-type="${type}"]`).classList.add('active', 'bg-blue-600');
+            document.querySelector(`[data-type="${type}"]`).classList.remove('bg-gray-700');
+
+            // Hide all inputs
+            document.querySelectorAll('.content-input').forEach(input => {
+                input.classList.add('hidden');
+            });
+
+            // Show selected input
+            document.getElementById(`${type}Input`).classList.remove('hidden');
+            this.currentType = type;
+        }
+
+        getQRContent() {
+            switch (this.currentType) {
+                case 'url':
+                    return document.getElementById('urlField').value || '';
+                case 'text':
+                    return document.getElementById('textField').value || '';
+                case 'wifi':
+                    const ssid = document.getElementById('wifiSSID').value || '';
+                    const password = document.getElementById('wifiPassword').value || '';
+                    const security = document.getElementById('wifiSecurity').value;
+                    return ssid ? `WIFI:T:${security};S:${ssid};P:${password};;` : '';
+                case 'contact':
+                    const name = document.getElementById('contactName').value || '';
+                    const phone = document.getElementById('contactPhone').value || '';
+                    const email = document.getElementById('contactEmail').value || '';
+                    return name ? `BEGIN:VCARD\nVERSION:3.0\nFN:${name}\nTEL:${phone}\nEMAIL:${email}\nEND:VCARD` : '';
+                case 'email':
+                    const emailTo = document.getElementById('emailTo').value || '';
+                    const subject = document.getElementById('emailSubject').value || '';
+                    const body = document.getElementById('emailBody').value || '';
+                    return emailTo ? `mailto:${emailTo}?subject=${encodeURIComponent(subject)}&body=${encodeURIComponent(body)}` : '';
+                case 'phone':
+                    const phoneNum = document.getElementById('phoneNumber').value || '';
+                    return phoneNum ? `tel:${phoneNum}` : '';
+                case 'sms':
+                    const smsNumber = document.getElementById('smsNumber').value || '';
+                    const smsMessage = document.getElementById('smsMessage').value || '';
+                    return smsNumber ? `sms:${smsNumber}?body=${encodeURIComponent(smsMessage)}` : '';
+                case 'whatsapp':
+                    const whatsappNumber = document.getElementById('whatsappNumber').value || '';
+                    const whatsappMessage = document.getElementById('whatsappMessage').value || '';
+                    return whatsappNumber ? `https://wa.me/${whatsappNumber}?text=${encodeURIComponent(whatsappMessage)}` : '';
+                case 'location':
+                    const lat = document.getElementById('locationLat').value || '';
+                    const lng = document.getElementById('locationLng').value || '';
+                    return (lat && lng) ? `geo:${lat},${lng}` : '';
+                case 'event':
+                    const title = document.getElementById('eventTitle').value || '';
+                    const start = document.getElementById('eventStart').value || '';
+                    const end = document.getElementById('eventEnd').value || '';
+                    const location = document.getElementById('eventLocation').value || '';
+
+                    const formatDate = (dateStr) => {
+                        if (!dateStr) return '';
+                        return new Date(dateStr).toISOString().replace(/[-:]/g, '').split('.')[0] + 'Z';
+                    };
+
+                    return title ? `BEGIN:VEVENT\nSUMMARY:${title}\nDTSTART:${formatDate(start)}\nDTEND:${formatDate(end)}\nLOCATION:${location}\nEND:VEVENT` : '';
+                case 'social':
+                    const platform = document.getElementById('socialPlatform').value;
+                    const username = document.getElementById('socialUsername').value.replace('@', '') || '';
+
+                    if (!username) return '';
+
+                    const socialUrls = {
+                        instagram: `https://instagram.com/${username}`,
+                        twitter: `https://twitter.com/${username}`,
+                        facebook: `https://facebook.com/${username}`,
+                        linkedin: `https://linkedin.com/in/${username}`,
+                        tiktok: `https://tiktok.com/@${username}`,
+                        youtube: `https://youtube.com/@${username}`
+                    };
+
+                    return socialUrls[platform];
+                case 'bitcoin':
+                    const address = document.getElementById('bitcoinAddress').value || '';
+                    const amount = document.getElementById('bitcoinAmount').value || '';
+                    const label = document.getElementById('bitcoinLabel').value || '';
+
+                    if (!address) return '';
+
+                    let content = `bitcoin:${address}`;
+                    if (amount) content += `?amount=${amount}`;
+                    if (label) content += `${amount ? '&' : '?'}label=${encodeURIComponent(label)}`;
+                    return content;
+                default:
+                    return '';
+            }
+        }
+
+        async generateQR() {
+            const content = this.getQRContent();
+            if (!content.trim()) {
+                this.showMessage('Por favor completa los campos requeridos para generar el código QR.', 'warning');
+                return;
+            }
+
+            this.showProgress();
+
+            try {
+                const size = parseInt(document.getElementById('qrSize').value);
+                const foregroundColor = document.getElementById('foregroundColor').value;
+                const backgroundColor = document.getElementById('backgroundColor').value;
+
+                // Create QR code
+                this.qr = new QRious({
+                    element: document.getElementById('qrCanvas'),
+                    value: content,
+                    size: size,
+                    foreground: foregroundColor,
+                    background: backgroundColor,
+                    level: 'H', // High error correction for logo integration
+                    padding: 20
+                });
+
+                // Add integrated logo if exists
+                if (this.logoImage) {
+                    await this.addIntegratedLogoToQR();
+                }
+
+                // Hide placeholder and show QR
+                document.getElementById('qrPlaceholder').classList.add('hidden');
+                document.getElementById('qrContainer').classList.remove('hidden');
+                document.getElementById('downloadBtn').classList.remove('hidden');
+
+                // Update info
+                this.updateQRInfo(content, size);
+
+                this.hideProgress();
+            } catch (error) {
+                console.error('Error generating QR:', error);
+                this.showMessage('Error al generar el código QR. Por favor verifica el contenido.', 'error');
+                this.hideProgress();
+            }
+        }
+
+       async addIntegratedLogoToQR() {
+    const canvas = document.getElementById('qrCanvas');
+    const ctx = canvas.getContext('2d');
+    const size = canvas.width;
+
+    // Crear un canvas temporal para trabajar con la imagen
+    const tempCanvas = document.createElement('canvas');
+    const tempCtx = tempCanvas.getContext('2d');
+    tempCanvas.width = size;
+    tempCanvas.height = size;
+
+    // Copiar el QR original al canvas temporal
+    tempCtx.drawImage(canvas, 0, 0);
+
+    // Configurar el área donde se integrará la imagen (más grande que antes)
+    const logoSize = size * 0.35; // 35% del tamaño del QR
+    const logoX = (size - logoSize) / 2;
+    const logoY = (size - logoSize) / 2;
+
+    // Crear máscara circular para la imagen
+    ctx.save();
+
+    // Limpiar el área central
+    ctx.globalCompositeOperation = 'destination-out';
+    ctx.beginPath();
+    ctx.arc(size / 2, size / 2, logoSize / 2, 0, 2 * Math.PI);
+    ctx.fill();
+
+    // Restaurar modo de composición
+    ctx.globalCompositeOperation = 'source-over';
+
+    // Crear borde decorativo
+    ctx.strokeStyle = document.getElementById('foregroundColor').value;
+    ctx.lineWidth = 8;
+    ctx.beginPath();
+    ctx.arc(size / 2, size / 2, logoSize / 2 + 5, 0, 2 * Math.PI);
+    ctx.stroke();
+
+    // Crear un segundo borde interno
+    ctx.strokeStyle = document.getElementById('backgroundColor').value;
+    ctx.lineWidth = 4;
+    ctx.beginPath();
+    ctx.arc(size / 2, size / 2, logoSize / 2 + 1, 0, 2 * Math.PI);
+    ctx.stroke();
+
+    // Dibujar la imagen dentro del círculo
+    ctx.save();
+    ctx.beginPath();
+    ctx.arc(size / 2, size / 2, logoSize / 2 - 2, 0, 2 * Math.PI);
+    ctx.clip();
+
+    // Calcular dimensiones para mantener proporción de la imagen
+    const imgRatio = this.logoImage.width / this.logoImage.height;
+    let drawWidth, drawHeight, drawX, drawY;
+
+    if (imgRatio > 1) {
+        // Imagen más ancha que alta
+        drawHeight = logoSize - 4;
+        drawWidth = drawHeight * imgRatio;
+        drawX = logoX + (logoSize - drawWidth) / 2;
+        drawY = logoY + 2;
+    } else {
+        // Imagen más alta que ancha
+        drawWidth = logoSize - 4;
+        drawHeight = drawWidth / imgRatio;
+        drawX = logoX + 2;
+        drawY = logoY + (logoSize - drawHeight) / 2;
+    }
+
+    ctx.drawImage(this.logoImage, drawX, drawY, drawWidth, drawHeight);
+    ctx.restore();
+
+    // Añadir efecto de integración con el patrón QR
+    this.addPatternIntegration(ctx, size, logoSize);
+
+    ctx.restore();
+}
+
+addPatternIntegration(ctx, size, logoSize) {
+    const centerX = size / 2;
+    const centerY = size / 2;
+    const radius = logoSize / 2;
+
+    // Crear pequeños cuadrados decorativos alrededor del logo
+    ctx.fillStyle = document.getElementById('foregroundColor').value;
+
+    const squareSize = 6;
+    const numSquares = 16;
+
+    for (let i = 0; i < numSquares; i++) {
+        const angle = (i / numSquares) * 2 * Math.PI;
+        const x = centerX + Math.cos(angle) * (radius + 15) - squareSize / 2;
+        const y = centerY + Math.sin(angle) * (radius + 15) - squareSize / 2;
+
+        // Añadir variación en el tamaño para efecto más orgánico
+        const variation = 1 + Math.sin(i * 0.8) * 0.3;
+        const currentSize = squareSize * variation;
+
+        ctx.fillRect(x, y, currentSize, currentSize);
+    }
+
+    // Añadir algunos puntos más pequeños para transición suave
+    ctx.fillStyle = document.getElementById('foregroundColor').value + '80'; // Semi-transparente
+
+    for (let i = 0; i < 24; i++) {
+        const angle = (i / 24) * 2 * Math.PI;
+        const distance = radius + 25 + Math.random() * 10;
+        const x = centerX + Math.cos(angle) * distance;
+        const y = centerY + Math.sin(angle) * distance;
+
+        ctx.beginPath();
+        ctx.arc(x, y, 2 + Math.random() * 2, 0, 2 * Math.PI);
+        ctx.fill();
+    }
+}
+
+        showProgress() {
+            document.getElementById('progressContainer').classList.remove('hidden');
+            let progress = 0;
+            const progressBar = document.getElementById('progressBar');
+            const progressText = document.getElementById('progressText');
+
+            const interval = setInterval(() => {
+                progress += Math.random() * 25 + 5;
+                if (progress >= 100) {
+                    progress = 100;
+                    clearInterval(interval);
+                    progressText.textContent = '¡Completado!';
+                }
+                progressBar.style.width = progress + '%';
+            }, 100);
+        }
+
+        hideProgress() {
+            setTimeout(() => {
+                document.getElementById('progressContainer').classList.add('hidden');
+                document.getElementById('progressBar').style.width = '0%';
+                document.getElementById('progressText').textContent = 'Generando...';
+            }, 500);
+        }
+
+        updateQRInfo(content, size) {
+            const typeLabels = {
+                url: 'URL/Enlace',
+                text: 'Texto',
+                wifi: 'WiFi',
+                contact: 'Contacto (vCard)',
+                email: 'Email',
+                phone: 'Teléfono',
+                sms: 'SMS',
+                whatsapp: 'WhatsApp',
+                location: 'Ubicación',
+                event: 'Evento (iCal)',
+                social: 'Red Social',
+                bitcoin: 'Bitcoin'
+            };
+
+            document.getElementById('infoType').textContent = typeLabels[this.currentType] || 'Desconocido';
+            document.getElementById('infoSize').textContent = `${size}x${size}px`;
+            document.getElementById('infoContent').textContent = content.length > 50 ? 
+                content.substring(0, 50) + '...' : content;
+            document.getElementById('qrInfo').classList.remove('hidden');
+        }
+
+        downloadQR() {
+            if (!this.qr) {
+                this.showMessage('Primero genera un código QR.', 'warning');
+                return;
+            }
+
+            const canvas = document.getElementById('qrCanvas');
+            const fileName = document.getElementById('fileName').value || 'codigo-qr';
+
+            // Create download link
+            const link = document.createElement('a');
+            link.download = `${fileName}.png`;
+            link.href = canvas.toDataURL('image/png', 1.0);
+
+            // Trigger download
+            document.body.appendChild(link);
+            link.click();
+            document.body.removeChild(link);
+
+            // Show success message
+            this.showMessage('¡QR descargado exitosamente!', 'success');
+        }
+
+        showMessage(message, type = 'info') {
+            const colors = {
+                success: 'from-green-500 to-green-600',
+                error: 'from-red-500 to-red-600',
+                warning: 'from-yellow-500 to-yellow-600',
+                info: 'from-blue-500 to-blue-600'
+            };
+
+            const icons = {
+                success: 'fa-check-circle',
+                error: 'fa-exclamation-circle',
+                warning: 'fa-exclamation-triangle',
+                info: 'fa-info-circle'
+            };
+
+            const messageDiv = document.createElement('div');
+            messageDiv.className = `fixed top-4 right-4 bg-gradient-to-r ${colors[type]} text-white px-6 py-3 rounded-xl shadow-lg z-50 slide-in`;
+            messageDiv.innerHTML = `
+                <div class="flex items-center">
+                    <i class="fas ${icons[type]} mr-3"></i>
+                    <span>${message}</span>
+                </div>
+            `;
+
+            document.body.appendChild(messageDiv);
+
+            setTimeout(() => {
+                messageDiv.remove();
+            }, 4000);
+        }
+    }
+
+    // Initialize QR Generator when page loads
+    document.addEventListener('DOMContentLoaded', () => {
+        new QRGenerator();
+    });
+
+    // Add keyboard shortcuts
+    document.addEventListener('keydown', (e) => {
+        // Ctrl/Cmd + Enter to generate QR
+        if ((e.ctrlKey || e.metaKey) && e.key === 'Enter') {
+            e.preventDefault();
+            document.getElementById('generateBtn').click();
+        }
+
+        // Ctrl/Cmd + S to download (if QR exists)
+        if ((e.ctrlKey || e.metaKey) && e.key === 's') {
+            e.preventDefault();
+            if (!document.getElementById('downloadBtn').classList.contains('hidden')) {
+                document.getElementById('downloadBtn').click();
+            }
+        }
+    });
+
+    // Enhanced hover effects
+    document.addEventListener('DOMContentLoaded', () => {
+        // Button hover effects
+        document.querySelectorAll('button').forEach(btn => {
+            btn.addEventListener('mouseenter', function() {
+                this.style.transform = 'translateY(-2px)';
+            });
+            btn.addEventListener('mouseleave', function() {
+                this.style.transform = 'translateY(0)';
+            });
+        });
+
+        // Input focus effects
+        document.querySelectorAll('input, textarea, select').forEach(input => {
+            input.addEventListener('focus', function() {
+                this.style.transform = 'scale(1.02)';
+                this.style.boxShadow = '0 0 20px rgba(59, 130, 246, 0.3)';
+            });
+            input.addEventListener('blur', function() {
+                this.style.transform = 'scale(1)';
+                this.style.boxShadow = 'none';
+            });
+        });
+    });
+
+    // Mobile responsive animations
+    if (window.innerWidth <= 768) {
+        const observerOptions = {
+            threshold: 0.1,
+            rootMargin: '0px 0px -50px 0px'
+        };
+
+        const observer = new IntersectionObserver((entries) => {
+            entries.forEach(entry => {
+                if (entry.isIntersecting) {
+                    entry.target.style.opacity = '1';
+                    entry.target.style.transform = 'translateY(0)';
+                }
+            });
+        }, observerOptions);
+
+        document.querySelectorAll('.glass-effect').forEach(element => {
+            element.style.opacity = '0';
+            element.style.transform = 'translateY(30px)';
+            element.style.transition = 'opacity 0.6s ease, transform 0.6s ease';
+            observer.observe(element);
+        });
+    }
@@ -0,0 +1,23 @@
+function copiarCodigo(btn) {
+    const codeBlock = btn.closest('.group');
+    const texto = codeBlock.querySelector('code').innerText;
+    const copyText = btn.querySelector('.copy-text');
+    const icon = btn.querySelector('i');
+
+    navigator.clipboard.writeText(texto).then(() => {
+        copyText.textContent = '¡Copiado!';
+        icon.className = 'fas fa-check';
+
+        btn.classList.remove('from-blue-600', 'to-cyan-600');
+        btn.classList.add('from-emerald-600', 'to-green-600');
+
+        setTimeout(() => {
+            copyText.textContent = 'Copiar';
+            icon.className = 'fas fa-copy';
+            btn.classList.remove('from-emerald-600', 'to-green-600');
+            btn.classList.add('from-blue-600', 'to-cyan-600');
+        }, 2000);
+    }).catch(err => {
+        alert('Error al copiar: ' + err);
+    });
+}
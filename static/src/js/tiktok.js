@@ -0,0 +1,80 @@
+document.addEventListener('DOMContentLoaded', function() {
+    const form = document.getElementById('download-form');
+    const input = form.querySelector('input[name="url"]');
+    const button = form.querySelector('.download-btn');
+    const buttonOriginalText = `
+        <i class="fa-solid fa-download mr-3 group-hover:animate-bounce"></i> 
+        <span>Descargar Video</span>
+        <div class="absolute inset-0 shimmer rounded-2xl opacity-0 group-hover:opacity-100"></div>
+    `;
+
+    // Cambiar color del input
+    input.addEventListener('input', function() {
+        if (this.value.includes('tiktok.com')) {
+            this.classList.add('border-cyan-400', 'ring-cyan-500/30', 'focus:border-cyan-400');
+            this.classList.remove('border-slate-700');
+        } else {
+            this.classList.remove('border-cyan-400', 'ring-cyan-500/30', 'focus:border-cyan-400');
+            this.classList.add('border-slate-700');
+        }
+    });
+
+    function restaurarBoton() {
+        button.innerHTML = buttonOriginalText;
+        button.disabled = false;
+    }
+
+    // Consultar el trabajo hasta que el video esté listo
+    function esperarTrabajo(statusUrl) {
+        button.innerHTML = '<i class="fas fa-spinner fa-spin mr-3"></i>Procesando...';
+        button.disabled = true;
+
+        fetch(statusUrl)
+            .then(response => response.json())
+            .then(result => {
+                const trabajo = result.data || {};
+                if (trabajo.estado === 'listo') {
+                    window.location.href = trabajo.descarga_url;
+                    restaurarBoton();
+                } else if (trabajo.estado === 'error' || !result.success) {
+                    alert(trabajo.mensaje || result.error || 'No se pudo descargar el video');
+                    restaurarBoton();
+                } else {
+                    setTimeout(() => esperarTrabajo(statusUrl), 1000);
+                }
+            })
+            .catch(() => restaurarBoton());
+    }
+
+    // Manejar envío del formulario
+    form.addEventListener('submit', function(e) {
+        e.preventDefault();
+        button.innerHTML = '<i class="fas fa-spinner fa-spin mr-3"></i>Procesando...';
+        button.disabled = true;
+
+        fetch('/api/tiktok/jobs', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ url: input.value })
+        })
+            .then(response => response.json().then(result => ({ status: response.status, result })))
+            .then(({ status, result }) => {
+                if (status === 202) {
+                    esperarTrabajo(result.status_url);
+                } else {
+                    alert(result.error || 'No se pudo iniciar la descarga');
+                    restaurarBoton();
+                }
+            })
+            .catch(() => restaurarBoton());
+    });
+
+    // Vuelta de un envío clásico (?job=<id>): con JavaScript el seguimiento
+    // pasa al botón y sobra el estado que pintó el servidor
+    const jobId = new URLSearchParams(window.location.search).get('job');
+    const estado = document.getElementById('estado-trabajo');
+    if (jobId && estado && !estado.querySelector('.text-red-400')) {
+        estado.remove();
+        esperarTrabajo(`/api/tiktok/jobs/${jobId}`);
+    }
+});
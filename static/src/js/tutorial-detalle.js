@@ -0,0 +1,213 @@
+// ==================== FUNCIONES DEL SISTEMA DE TABS ====================
+
+// Función para cambiar entre tabs (SOLO UNA DEFINICIÓN)
+function switchTab(button, tabType) {
+    const example = button.closest('.code-example');
+    const tabs = example.querySelectorAll('.tab-button');
+    const contents = example.querySelectorAll('.tab-content');
+
+    // Remover clase active
+    tabs.forEach(tab => tab.classList.remove('active'));
+    contents.forEach(content => content.classList.remove('active'));
+
+    // Agregar clase active
+    button.classList.add('active');
+    example.querySelector(`.${tabType}-tab`).classList.add('active');
+}
+
+// Función para copiar código (SOLO UNA DEFINICIÓN)
+function copyCode(button) {
+    const example = button.closest('.code-example');
+    const codeBlock = example.querySelector('.code-tab code');
+
+    if (!codeBlock) return;
+
+    const code = codeBlock.textContent;
+
+    navigator.clipboard.writeText(code).then(() => {
+        const originalHTML = button.innerHTML;
+        button.innerHTML = '<i class="fas fa-check"></i> ¡Copiado!';
+        button.classList.add('copied');
+
+        setTimeout(() => {
+            button.innerHTML = originalHTML;
+            button.classList.remove('copied');
+        }, 2000);
+    }).catch(err => {
+        console.error('Error al copiar:', err);
+        button.innerHTML = '<i class="fas fa-times"></i> Error';
+        setTimeout(() => {
+            button.innerHTML = '<i class="fas fa-copy"></i>';
+        }, 2000);
+    });
+}
+
+// ==================== CARGA DIFERIDA DE SECCIONES ====================
+
+const TUTORIAL_ID = TUTORIAL.id;
+const seccionesPedidas = new Map();
+
+// Pide una sección a la API (una sola vez) y la coloca en su sitio
+function cargarSeccion(elemento) {
+    const numero = elemento.dataset.seccion;
+    if (!elemento.classList.contains('seccion-diferida')) {
+        return Promise.resolve();
+    }
+    if (!seccionesPedidas.has(numero)) {
+        const peticion = fetch(`/api/tutorial/${TUTORIAL_ID}/seccion/${numero}`)
+            .then(respuesta => {
+                if (!respuesta.ok) throw new Error(`HTTP ${respuesta.status}`);
+                return respuesta.json();
+            })
+            .then(({ data }) => {
+                elemento.innerHTML = data.html;
+                elemento.classList.remove('seccion-diferida');
+                // innerHTML no ejecuta scripts: se recrean para que corran
+                elemento.querySelectorAll('script').forEach(viejo => {
+                    const nuevo = document.createElement('script');
+                    nuevo.textContent = viejo.textContent;
+                    viejo.replaceWith(nuevo);
+                });
+                if (window.Prism) Prism.highlightAllUnder(elemento);
+            })
+            .catch(err => {
+                console.error('Error al cargar la sección:', err);
+                seccionesPedidas.delete(numero);
+                const estado = elemento.querySelector('.seccion-estado');
+                if (estado) estado.textContent = 'No se pudo cargar esta sección. Se reintentará al volver a ella.';
+            });
+        seccionesPedidas.set(numero, peticion);
+    }
+    return seccionesPedidas.get(numero);
+}
+
+// Carga las secciones poco antes de que entren en pantalla
+function setupSeccionesDiferidas() {
+    const pendientes = document.querySelectorAll('.seccion-diferida');
+    if (!pendientes.length) return;
+
+    if (!('IntersectionObserver' in window)) {
+        pendientes.forEach(cargarSeccion);
+        return;
+    }
+
+    const observador = new IntersectionObserver(entradas => {
+        entradas.forEach(entrada => {
+            if (entrada.isIntersecting) {
+                cargarSeccion(entrada.target).then(() => {
+                    if (!entrada.target.classList.contains('seccion-diferida')) {
+                        observador.unobserve(entrada.target);
+                    }
+                });
+            }
+        });
+    }, { rootMargin: '800px 0px' });
+
+    pendientes.forEach(seccion => observador.observe(seccion));
+}
+
+// Antes de saltar a una sección se cargan las anteriores para que no se mueva el destino
+function cargarHasta(destino) {
+    const secciones = Array.from(document.querySelectorAll('.tutorial-content-area section'));
+    const hasta = secciones.indexOf(destino);
+    if (hasta < 0) return Promise.resolve();
+    return Promise.all(secciones.slice(0, hasta + 1).map(cargarSeccion));
+}
+
+// ==================== CONFIGURACIÓN DE LA PÁGINA ====================
+
+// Configurar badge de nivel
+function setupLevelBadge() {
+    const levelBadge = document.getElementById('levelBadge');
+    const levelStars = document.getElementById('levelStars');
+    const levelText = document.getElementById('levelText');
+
+    const levelConfig = {
+        'principiante': {
+            stars: '⭐',
+            classes: 'from-emerald-500/20 to-emerald-600/20 border-emerald-400/30 text-emerald-300'
+        },
+        'intermedio': {
+            stars: '⭐⭐',
+            classes: 'from-blue-500/20 to-blue-600/20 border-blue-400/30 text-blue-300'
+        },
+        'avanzado': {
+            stars: '⭐⭐⭐',
+            classes: 'from-orange-500/20 to-orange-600/20 border-orange-400/30 text-orange-300'
+        }
+    };
+
+    const config = levelConfig[TUTORIAL.level] || levelConfig['principiante'];
+    levelStars.textContent = config.stars;
+    levelBadge.className = `inline-flex items-center gap-2 bg-gradient-to-r ${config.classes} rounded-lg px-4 py-2 text-sm font-bold`;
+}
+
+// Configurar prerequisitos
+function setupPrerequisites() {
+    const prerequisitesList = document.getElementById('prerequisites');
+    const level = TUTORIAL.level;
+    const language = TUTORIAL.language;
+    let prerequisites = [];
+
+    if (level === 'principiante') {
+        prerequisites = [
+            'Conocimientos básicos de programación',
+            'Un editor de código instalado (VS Code, Sublime Text, etc.)'
+        ];
+    } else if (level === 'intermedio') {
+        prerequisites = [
+            `Experiencia previa con ${language}`,
+            'Entendimiento de conceptos básicos de programación',
+            'Disposición para aprender conceptos más avanzados'
+        ];
+    } else {
+        prerequisites = [
+            `Dominio sólido de ${language}`,
+            'Experiencia con proyectos complejos',
+            'Capacidad para resolver problemas de forma independiente'
+        ];
+    }
+
+    prerequisitesList.innerHTML = prerequisites.map(prereq => `
+        <li class="flex items-start gap-3 text-slate-300">
+            <i class="fas fa-arrow-right text-cyan-400 mt-1"></i>
+            <span>${prereq}</span>
+        </li>
+    `).join('');
+}
+
+// ==================== INICIALIZACIÓN ====================
+
+document.addEventListener('DOMContentLoaded', () => {
+    // Configurar página
+    setupLevelBadge();
+    setupPrerequisites();
+
+    // Resaltar sintaxis con Prism (si el servidor no lo hizo ya)
+    if (window.Prism) Prism.highlightAll();
+
+    // Secciones que llegan bajo demanda
+    setupSeccionesDiferidas();
+
+    // Scroll suave
+    document.querySelectorAll('a[href^="#"]').forEach(anchor => {
+        anchor.addEventListener('click', function (e) {
+            e.preventDefault();
+            const target = document.querySelector(this.getAttribute('href'));
+            if (target) {
+                cargarHasta(target).then(() => {
+                    target.scrollIntoView({
+                        behavior: 'smooth',
+                        block: 'start'
+                    });
+                });
+            }
+        });
+    });
+
+    // Enlace directo a una sección (#seccion-n)
+    if (location.hash.startsWith('#seccion-')) {
+        const destino = document.querySelector(location.hash);
+        if (destino) cargarHasta(destino).then(() => destino.scrollIntoView({ block: 'start' }));
+    }
+});
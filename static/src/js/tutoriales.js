@@ -0,0 +1,281 @@
+let currentFilter = paginacion.language;
+let currentLevel = paginacion.level;
+let searchQuery = '';
+let searchResults = null;
+
+// Language configurations
+const languageConfig = {
+    html: { color: 'text-orange-400', borderColor: 'border-orange-400/60', icon: 'fa-html5' },
+    css: { color: 'text-blue-400', borderColor: 'border-blue-400/60', icon: 'fa-css3-alt' },
+    javascript: { color: 'text-yellow-400', borderColor: 'border-yellow-400/60', icon: 'fa-js-square' },
+    python: { color: 'text-green-400', borderColor: 'border-green-400/60', icon: 'fa-python' },
+    java: { color: 'text-red-400', borderColor: 'border-red-400/60', icon: 'fa-java' }
+};
+
+// Level configurations
+const levelConfig = {
+    principiante: {
+        stars: '⭐',
+        bg: 'bg-gradient-to-r from-emerald-500/25 to-emerald-600/25',
+        border: 'border-emerald-500/60',
+        text: 'text-emerald-300'
+    },
+    intermedio: {
+        stars: '⭐⭐',
+        bg: 'bg-gradient-to-r from-blue-500/25 to-blue-600/25',
+        border: 'border-blue-500/60',
+        text: 'text-blue-300'
+    },
+    avanzado: {
+        stars: '⭐⭐⭐',
+        bg: 'bg-gradient-to-r from-orange-500/25 to-orange-600/25',
+        border: 'border-orange-500/60',
+        text: 'text-orange-300'
+    }
+};
+
+function createTutorialCard(tutorial, index) {
+    const lang = languageConfig[tutorial.language] || languageConfig.html;
+    const level = levelConfig[tutorial.level] || levelConfig.principiante;
+    const capitalizedLevel = tutorial.level.charAt(0).toUpperCase() + tutorial.level.slice(1);
+
+    return `
+        <a href="/tutorial/${tutorial._id}" class="tutorial-card-wrapper" style="animation-delay: ${index * 0.08}s">
+            <div class="tutorial-card">
+                <div class="card-header">
+                    <div class="flex items-center justify-between mb-4">
+                        <div class="language-badge ${lang.borderColor}">
+                            <i class="fab ${lang.icon} ${lang.color} text-lg"></i>
+                            <span class="${lang.color}">${tutorial.language.toUpperCase()}</span>
+                        </div>
+                        <div class="level-badge ${level.bg} ${level.border} ${level.text}">
+                            <span>${level.stars}</span>
+                            <span>${capitalizedLevel}</span>
+                        </div>
+                    </div>
+                    <h3 class="card-title">${tutorial.title}</h3>
+                </div>
+
+                <div class="card-body">
+                    <p class="card-description">${tutorial.description}</p>
+                </div>
+
+                <div class="card-footer">
+                    <div class="card-meta">
+                        <i class="fas fa-clock text-blue-400"></i>
+                        <span>${tutorial.duration}</span>
+                    </div>
+                    <div class="card-cta">
+                        <span>Ver tutorial</span>
+                        <i class="fas fa-arrow-right"></i>
+                    </div>
+                </div>
+            </div>
+        </a>
+    `;
+}
+
+// Los filtros de lenguaje y nivel se aplican en el servidor
+function navigateWithFilters(language, level) {
+    const params = new URLSearchParams();
+    if (language !== 'all') params.set('language', language);
+    if (level !== 'all') params.set('level', level);
+    if (paginacion.sort !== 'title') params.set('sort', paginacion.sort);
+    const query = params.toString();
+    window.location.href = '/tutoriales' + (query ? `?${query}` : '');
+}
+
+// La búsqueda de texto usa el índice del servidor (título, descripción y contenido)
+function searchTutorials(query) {
+    if (!query) {
+        searchResults = null;
+        renderTutorials();
+        return;
+    }
+    // Lenguaje y nivel se filtran en el servidor, antes de ordenar por relevancia
+    const params = new URLSearchParams({ q: query, limit: 50 });
+    if (currentFilter !== 'all') params.set('language', currentFilter);
+    if (currentLevel !== 'all') params.set('level', currentLevel);
+    fetch(`/api/tutoriales/buscar?${params}`)
+        .then(response => response.json())
+        .then(result => {
+            if (query !== searchQuery) return;
+            searchResults = result.data || [];
+            renderTutorials();
+        })
+        .catch(() => {
+            searchResults = [];
+            renderTutorials();
+        });
+}
+
+function filterTutorials() {
+    return searchResults !== null ? searchResults : tutorialesData;
+}
+
+function renderTutorials() {
+    const grid = document.getElementById('tutorialsGrid');
+    const filtered = filterTutorials();
+
+    document.getElementById('resultsCount').textContent = searchResults !== null ? filtered.length : paginacion.total;
+    document.getElementById('totalTutorials').textContent = paginacion.total;
+    document.getElementById('pagination').style.display = searchResults !== null ? 'none' : '';
+
+    if (filtered.length === 0) {
+        grid.innerHTML = `
+            <div class="col-span-full empty-state">
+                <div class="empty-icon">
+                    <i class="fas fa-search"></i>
+                </div>
+                <h3 class="empty-title">No se encontraron tutoriales</h3>
+                <p class="empty-description">Intenta ajustar los filtros o términos de búsqueda</p>
+                <button onclick="resetFilters()" class="bg-gradient-to-r from-blue-500 to-blue-600 hover:from-blue-600 hover:to-blue-700 text-white px-8 py-4 rounded-xl font-bold transition-all transform hover:-translate-y-1 hover:shadow-2xl hover:shadow-blue-500/50">
+                    <i class="fas fa-redo mr-2"></i>
+                    Resetear filtros
+                </button>
+            </div>
+        `;
+        return;
+    }
+
+    grid.innerHTML = filtered.map((tutorial, index) => createTutorialCard(tutorial, index)).join('');
+}
+
+function resetFilters() {
+    if (currentFilter !== 'all' || currentLevel !== 'all') {
+        navigateWithFilters('all', 'all');
+        return;
+    }
+    searchQuery = '';
+    searchResults = null;
+    document.getElementById('searchInput').value = '';
+    renderTutorials();
+}
+
+// Event Listeners
+document.querySelectorAll('.filter-chip').forEach(btn => {
+    btn.classList.toggle('active', btn.dataset.filter === currentFilter);
+    btn.addEventListener('click', function() {
+        navigateWithFilters(this.dataset.filter, currentLevel);
+    });
+});
+
+const levelFilter = document.getElementById('levelFilter');
+levelFilter.value = currentLevel;
+levelFilter.addEventListener('change', function() {
+    navigateWithFilters(currentFilter, this.value);
+});
+
+const searchInput = document.getElementById('searchInput');
+searchInput.addEventListener('keypress', function(e) {
+    if (e.key === 'Enter') {
+        searchQuery = this.value.trim();
+        searchTutorials(searchQuery);
+    }
+});
+
+searchInput.addEventListener('input', function() {
+    clearTimeout(window.searchTimeout);
+    window.searchTimeout = setTimeout(() => {
+        searchQuery = this.value.trim();
+        searchTutorials(searchQuery);
+    }, 400);
+});
+
+// Scroll to Top
+const scrollBtn = document.getElementById('scrollToTop');
+
+window.addEventListener('scroll', () => {
+    if (window.pageYOffset > 500) {
+        scrollBtn.classList.add('visible');
+    } else {
+        scrollBtn.classList.remove('visible');
+    }
+});
+
+scrollBtn.addEventListener('click', () => {
+    window.scrollTo({ 
+        top: 0, 
+        behavior: 'smooth' 
+    });
+});
+
+// Smooth scroll for internal links
+document.querySelectorAll('a[href^="#"]').forEach(anchor => {
+    anchor.addEventListener('click', function(e) {
+        e.preventDefault();
+        const target = document.querySelector(this.getAttribute('href'));
+        if (target) {
+            target.scrollIntoView({
+                behavior: 'smooth',
+                block: 'start'
+            });
+        }
+    });
+});
+
+// Initialize
+window.addEventListener('DOMContentLoaded', () => {
+    renderTutorials();
+
+    // Add entrance animation to stats
+    const stats = document.querySelectorAll('.stat-card');
+    stats.forEach((stat, index) => {
+        stat.style.animationDelay = `${0.4 + (index * 0.1)}s`;
+    });
+});
+
+// Easter egg: Konami code
+let konamiCode = [];
+const correctCode = ['ArrowUp', 'ArrowUp', 'ArrowDown', 'ArrowDown', 'ArrowLeft', 'ArrowRight', 'ArrowLeft', 'ArrowRight', 'b', 'a'];
+
+document.addEventListener('keydown', (e) => {
+    konamiCode.push(e.key);
+    konamiCode = konamiCode.slice(-10);
+
+    if (konamiCode.join(',') === correctCode.join(',')) {
+        // Clear the text search
+        searchQuery = '';
+        searchResults = null;
+        document.getElementById('searchInput').value = '';
+        renderTutorials();
+
+        // Show celebration
+        const celebration = document.createElement('div');
+        celebration.innerHTML = `
+            <div style="position: fixed; top: 50%; left: 50%; transform: translate(-50%, -50%); 
+                        background: linear-gradient(135deg, rgba(59, 130, 246, 0.95), rgba(6, 182, 212, 0.95)); 
+                        padding: 2rem 3rem; border-radius: 1.5rem; z-index: 9999; 
+                        box-shadow: 0 25px 50px rgba(0, 0, 0, 0.5); text-align: center;
+                        animation: fadeInUp 0.5s ease-out;">
+                <div style="font-size: 3rem; margin-bottom: 1rem;">🎉</div>
+                <div style="font-size: 1.5rem; font-weight: bold; color: white; margin-bottom: 0.5rem;">
+                    ¡Código Konami Activado!
+                </div>
+                <div style="color: rgba(255, 255, 255, 0.9);">
+                    Eres un verdadero desarrollador 🚀
+                </div>
+            </div>
+        `;
+        document.body.appendChild(celebration);
+        setTimeout(() => {
+            celebration.remove();
+        }, 3000);
+    }
+});
+
+// Add keyboard shortcuts info
+document.addEventListener('keydown', (e) => {
+    // Press 'S' to focus search
+    if (e.key === 's' && !e.ctrlKey && !e.metaKey && document.activeElement.tagName !== 'INPUT') {
+        e.preventDefault();
+        document.getElementById('searchInput').focus();
+    }
+
+    // Press 'Escape' to clear search
+    if (e.key === 'Escape') {
+        if (document.getElementById('searchInput').value) {
+            resetFilters();
+        }
+    }
+});
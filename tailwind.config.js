@@ -0,0 +1,33 @@
+// Configuración de Tailwind para `flask construir-estaticos`.
+// Genera las clases que aparecen en plantillas, scripts y tutoriales del
+// repositorio, más el safelist: el build corre sin sincronizar con Mongo y
+// los tutoriales se editan después, así que las clases que usan sus cajas
+// de aviso (degradado, borde y texto de color, espaciados) se generan
+// siempre para toda la paleta aunque hoy no las use ningún archivo.
+const COLORES = [
+  'slate', 'gray', 'red', 'orange', 'amber', 'yellow', 'lime', 'green', 'emerald',
+  'teal', 'cyan', 'sky', 'blue', 'indigo', 'violet', 'purple', 'fuchsia', 'pink', 'rose',
+];
+
+module.exports = {
+  content: [
+    './templates/**/*.html',
+    './static/src/js/**/*.js',
+    './contenido_tutoriales.json',
+    './contenido_tutoriales/*.json',
+  ],
+  safelist: [
+    // Con modificador de opacidad (/10) los patrones no valen: van uno a uno
+    ...COLORES.flatMap((color) => [
+      `text-${color}-300`, `text-${color}-400`, `border-${color}-400`,
+      `from-${color}-500/10`, `to-${color}-500/10`,
+    ]),
+    'bg-gradient-to-r', 'border-l-4', 'rounded-lg', 'block', 'inline', 'flex',
+    'items-start', 'items-center', 'text-lg', 'text-xl', 'font-semibold', 'font-bold',
+    { pattern: /^(m|mt|mb|ml|mr|p|px|py|gap|space-y)-(1|2|3|4|6|8)$/ },
+  ],
+  theme: {
+    extend: {},
+  },
+  plugins: [],
+};
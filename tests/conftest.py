@@ -0,0 +1,83 @@
+"""Entorno de las pruebas: almacén en un directorio temporal y Mongo simulado.
+
+codeverse lee la configuración del entorno al importarse, así que las
+variables se fijan en pytest_configure, antes de importarlo. El almacén se
+comparte entre pruebas: cada una trabaja con sus propios ids.
+"""
+
+import os
+import tempfile
+
+import pytest
+from bson.objectid import ObjectId
+
+
+def pytest_configure(config):
+    tmp = tempfile.mkdtemp(prefix='codeverse-pruebas-')
+    os.chdir(tmp)  # downloads/, instantaneas/ y la semilla son rutas relativas
+    os.environ.update({
+        'CONTENIDO_DIR': os.path.join(tmp, 'contenido_tutoriales'),
+        # Nunca Atlas: un puerto cerrado, y el hilo de reconexión no vuelve a
+        # intentarlo durante las pruebas (las que usan Mongo lo simulan)
+        'MONGO_URI': 'mongodb://127.0.0.1:9/?directConnection=true',
+        'MONGO_TIMEOUT_MS': '200',
+        'MONGO_BACKOFF_INICIAL': '3600',
+        'SYNC_AL_ARRANCAR': '0',
+        'SYNC_INTERVALO': '0',
+        'PRECALENTAR': '',
+        'LIMITES': '0',
+        # Los guardados diferidos solo se vacían cuando la prueba lo pide
+        'ESCRITURA_VENTANA': '3600',
+        'ESCRITURA_REINTENTO': '3600',
+    })
+    import codeverse  # noqa: F401
+
+
+@pytest.fixture
+def cliente():
+    from codeverse import app
+    return app.test_client()
+
+
+@pytest.fixture
+def crear_tutorial():
+    """Guarda un tutorial nuevo en el almacén y devuelve (id, datos)"""
+    from codeverse import almacen
+
+    def crear(tutorial_id=None, **campos):
+        tutorial_id = tutorial_id or str(ObjectId())
+        datos = {
+            'title': 'Tutorial de prueba',
+            'description': 'Descripción',
+            'language': 'python',
+            'level': 'principiante',
+            'duration': '10 min',
+            'content': '<h2>Introducción</h2>\n<p>Hola</p>\n',
+            'lastUpdated': '2024-01-01T00:00:00',
+            **campos
+        }
+        almacen.guardar_tutorial_json(tutorial_id, datos)
+        return tutorial_id, datos
+    return crear
+
+
+@pytest.fixture
+def mongo_simulado():
+    """Colección de mongomock en lugar de Atlas, con el breaker cerrado"""
+    mongomock = pytest.importorskip('mongomock')
+    from codeverse import config, mongo
+    cliente_mongo = mongomock.MongoClient(tz_aware=False)
+    coleccion = cliente_mongo[config.DB_NAME][config.COLLECTION_NAME]
+    with mongo._mongo_lock:
+        anterior = dict(mongo._mongo)
+        mongo._mongo.update(client=cliente_mongo, coleccion=coleccion, breaker='cerrado', indices=True)
+    yield coleccion
+    with mongo._mongo_lock:
+        mongo._mongo.update(anterior)
+
+
+@pytest.fixture(autouse=True)
+def _sin_guardados_pendientes():
+    from codeverse import escrituras
+    yield
+    escrituras.descartar_escrituras(escrituras.escrituras_pendientes())
@@ -0,0 +1,24 @@
+"""Almacén: lo que devuelve la caché se puede modificar sin estropearla"""
+
+from codeverse import almacen
+
+
+def test_cargar_contenidos_devuelve_copias(crear_tutorial):
+    tutorial_id, _ = crear_tutorial()
+    datos = almacen.obtener_contenido(tutorial_id)
+
+    contenidos = almacen.cargar_contenidos()
+    contenidos[tutorial_id]['content'] = '<p>Cambiado fuera del almacén</p>'
+    contenidos[tutorial_id]['extra'] = True
+
+    assert almacen.obtener_contenido(tutorial_id) == datos
+    assert almacen.cargar_contenidos()[tutorial_id] == datos
+
+
+def test_obtener_contenido_devuelve_una_copia(crear_tutorial):
+    tutorial_id, _ = crear_tutorial()
+    datos = almacen.obtener_contenido(tutorial_id)
+
+    almacen.obtener_contenido(tutorial_id)['title'] = 'otro'
+
+    assert almacen.obtener_contenido(tutorial_id) == datos
@@ -0,0 +1,51 @@
+"""Búsqueda BM25: orden por relevancia, filtros en el servidor e índice al día"""
+
+from codeverse import almacen, busqueda
+
+
+def test_tokenizar_pliega_y_quita_palabras_vacias():
+    assert busqueda._tokenizar('Introducción a las FUNCIONES de Python') == ['introduccion', 'funciones', 'python']
+
+
+def test_ordena_por_relevancia(crear_tutorial):
+    en_titulo, _ = crear_tutorial(title='Guía de zorblax', content='<p>Nada que ver.</p>')
+    en_cuerpo, _ = crear_tutorial(title='Otra cosa', content='<p>Aparece zorblax una vez entre mucho texto.</p>')
+    repetido, _ = crear_tutorial(title='Más zorblax', content='<p>zorblax zorblax zorblax</p>')
+
+    resultados = busqueda.buscar_tutoriales('zorblax')
+
+    assert [r['_id'] for r in resultados] == [repetido, en_titulo, en_cuerpo]
+    assert resultados[0]['score'] > resultados[1]['score'] > resultados[2]['score']
+    assert 'zorblax' in resultados[2]['snippet']
+
+
+def test_filtra_antes_de_aplicar_el_limite(crear_tutorial):
+    for i in range(5):
+        crear_tutorial(title=f'quimbaya python {i}', language='python', level='avanzado')
+    buscado, _ = crear_tutorial(title='quimbaya en java', content='<p>poco</p>', language='Java', level='intermedio')
+
+    resultados = busqueda.buscar_tutoriales('quimbaya', limite=1, lenguaje='java')
+
+    assert [r['_id'] for r in resultados] == [buscado]
+    assert busqueda.buscar_tutoriales('quimbaya', lenguaje='java', nivel='avanzado') == []
+    assert len(busqueda.buscar_tutoriales('quimbaya', nivel='avanzado')) == 5
+
+
+def test_el_indice_sigue_los_guardados_y_borrados(crear_tutorial):
+    tutorial_id, datos = crear_tutorial(title='xiloquetzal')
+    assert [r['_id'] for r in busqueda.buscar_tutoriales('xiloquetzal')] == [tutorial_id]
+
+    almacen.guardar_tutorial_json(tutorial_id, {**datos, 'title': 'renombrado'})
+    assert busqueda.buscar_tutoriales('xiloquetzal') == []
+    assert [r['_id'] for r in busqueda.buscar_tutoriales('renombrado')] == [tutorial_id]
+
+    almacen.eliminar_tutorial_json(tutorial_id)
+    assert busqueda.buscar_tutoriales('renombrado') == []
+
+
+def test_api_de_busqueda(cliente, crear_tutorial):
+    tutorial_id, _ = crear_tutorial(title='wombatito', language='css', level='principiante')
+
+    datos = cliente.get('/api/tutoriales/buscar?q=wombatito&language=CSS').get_json()['data']
+    assert [r['_id'] for r in datos] == [tutorial_id]
+    assert cliente.get('/api/tutoriales/buscar?q=wombatito&level=avanzado').get_json()['data'] == []
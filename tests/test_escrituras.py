@@ -0,0 +1,138 @@
+"""Escritura diferida: cola en memoria, vaciado por lotes y recuperación de diarios huérfanos"""
+
+import json
+import os
+import uuid
+
+import pytest
+from bson.objectid import ObjectId
+
+from codeverse import almacen, escrituras
+
+
+def _diario_huerfano(nombre, entradas, cola=''):
+    """Diario de un proceso que murió sin vaciarlo (nadie tiene el flock de su .lock)"""
+    os.makedirs(escrituras._DIFERIDAS_DIR, exist_ok=True)
+    with open(escrituras._ruta_diario(nombre, 'jsonl'), 'w', encoding='utf-8') as f:
+        for entrada in entradas:
+            f.write(json.dumps(entrada) + '\n')
+        f.write(cola)
+    open(escrituras._ruta_diario(nombre, 'lock'), 'a').close()
+
+
+def test_guardado_en_cola_hasta_vaciar(cliente, crear_tutorial):
+    tutorial_id, datos = crear_tutorial()
+    nuevo = {**datos, 'content': '<p>editado</p>'}
+
+    escrituras.encolar_guardado(tutorial_id, nuevo, {'content': nuevo['content']})
+
+    # Confirmado sin tocar el almacén, pero este worker ya lo sirve
+    assert almacen.obtener_contenido(tutorial_id)['content'] == datos['content']
+    respuesta = cliente.get(f'/api/tutorial/{tutorial_id}/contenido')
+    assert respuesta.get_json()['data']['content'] == '<p>editado</p>'
+    assert respuesta.headers['Cache-Control'] == 'no-store'
+
+    escrituras.vaciar_escrituras()  # Sin Mongo: el almacén se escribe igual
+
+    assert almacen.obtener_contenido(tutorial_id)['content'] == '<p>editado</p>'
+    assert escrituras.escritura_pendiente(tutorial_id) is None
+    assert tutorial_id in escrituras.escrituras_pendientes()  # Falta Mongo
+
+
+def test_un_vaciado_escribe_el_lote_entero(crear_tutorial, monkeypatch):
+    guardados = [crear_tutorial() for _ in range(3)]
+    for tutorial_id, datos in guardados:
+        escrituras.encolar_guardado(tutorial_id, {**datos, 'content': f'<p>{tutorial_id}</p>'})
+    llamadas = []
+    aplicar = escrituras._aplicar_cambios
+    monkeypatch.setattr(escrituras, '_aplicar_cambios', lambda cambios: llamadas.append(set(cambios)) or aplicar(cambios))
+
+    escrituras.vaciar_escrituras()
+
+    assert llamadas == [{tutorial_id for tutorial_id, _ in guardados}]
+    for tutorial_id, _ in guardados:
+        assert almacen.obtener_contenido(tutorial_id)['content'] == f'<p>{tutorial_id}</p>'
+
+
+def test_guardados_seguidos_se_coalescen():
+    tutorial_id = str(ObjectId())
+    escrituras.encolar_guardado(tutorial_id, None, {'title': 'uno', 'content': 'a'})
+    escrituras.encolar_guardado(tutorial_id, None, {'content': 'b'})
+
+    assert escrituras._diferidas['mongo'][tutorial_id] == {'title': 'uno', 'content': 'b'}
+
+
+def test_recupera_diario_huerfano():
+    tutorial_id = str(ObjectId())
+    nombre = uuid.uuid4().hex
+    _diario_huerfano(nombre, [
+        {'tutorial_id': tutorial_id, 'mongo': {'title': 'uno', 'content': 'a'}},
+        {'tutorial_id': tutorial_id, 'mongo': {'content': 'b'}},
+    ], cola='{"tutorial_id": "a medi')  # Murió escribiendo la última línea
+
+    escrituras.recuperar_diarios()
+
+    assert escrituras._diferidas['mongo'][tutorial_id] == {'title': 'uno', 'content': 'b'}
+    assert not os.path.exists(escrituras._ruta_diario(nombre, 'jsonl'))
+    assert not os.path.exists(escrituras._ruta_diario(nombre, 'lock'))
+
+
+def test_recupera_guardados_del_almacen():
+    contenido = {'title': 'Local', 'content': '<p>sin Mongo</p>', 'lastUpdated': '2024-01-01T00:00:00'}
+    _diario_huerfano(uuid.uuid4().hex, [{'tutorial_id': 'solo-local', 'contenido': contenido, 'mongo': None}])
+
+    escrituras.recuperar_diarios()
+    assert escrituras.escritura_pendiente('solo-local') == contenido
+    escrituras.vaciar_escrituras()
+
+    assert almacen.obtener_contenido('solo-local') == contenido
+    assert 'solo-local' not in escrituras.escrituras_pendientes()
+
+
+@pytest.mark.skipif(escrituras.fcntl is None, reason="sin flock no se distingue un diario vivo")
+def test_no_toca_el_diario_de_un_proceso_vivo():
+    tutorial_id = str(ObjectId())
+    nombre = uuid.uuid4().hex
+    _diario_huerfano(nombre, [{'tutorial_id': tutorial_id, 'mongo': {'content': 'a'}}])
+    with open(escrituras._ruta_diario(nombre, 'lock'), 'a') as marca:
+        escrituras.fcntl.flock(marca, escrituras.fcntl.LOCK_EX)  # Su dueño sigue vivo
+
+        escrituras.recuperar_diarios()
+
+        assert tutorial_id not in escrituras.escrituras_pendientes()
+        assert os.path.exists(escrituras._ruta_diario(nombre, 'jsonl'))
+    escrituras.recuperar_diarios()
+    assert tutorial_id in escrituras.escrituras_pendientes()
+
+
+def test_no_recupera_su_propio_diario():
+    escrituras.encolar_guardado(str(ObjectId()), None, {'content': 'a'})
+    coalescidos = escrituras.estadisticas_escrituras()['coalescidos']
+
+    escrituras.recuperar_diarios()
+
+    assert escrituras.estadisticas_escrituras()['coalescidos'] == coalescidos
+    assert os.path.exists(escrituras._ruta_diario(escrituras._diferidas['nombre'], 'jsonl'))
+
+
+def test_sin_mongo_lo_pendiente_se_conserva():
+    tutorial_id = str(ObjectId())
+    escrituras.encolar_guardado(tutorial_id, None, {'content': 'a'})
+
+    escrituras.vaciar_escrituras()
+
+    assert tutorial_id in escrituras.escrituras_pendientes()
+
+
+def test_lo_recuperado_llega_a_mongo(mongo_simulado):
+    tutorial_id = str(ObjectId())
+    mongo_simulado.insert_one({'_id': ObjectId(tutorial_id), 'title': 'viejo', 'content': 'viejo'})
+    _diario_huerfano(uuid.uuid4().hex, [{'tutorial_id': tutorial_id, 'mongo': {'content': 'nuevo'}}])
+
+    escrituras.recuperar_diarios()
+    escrituras.vaciar_escrituras()
+
+    documento = mongo_simulado.find_one({'_id': ObjectId(tutorial_id)})
+    assert documento['content'] == 'nuevo'
+    assert 'updatedAt' in documento
+    assert tutorial_id not in escrituras.escrituras_pendientes()
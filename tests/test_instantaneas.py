@@ -0,0 +1,48 @@
+"""Instantáneas: se sirven solo si son de la versión de las plantillas y estáticos actuales"""
+
+import os
+
+import pytest
+
+from codeverse import instantaneas
+
+
+def _marcar(tutorial_id):
+    """Sustituye la página exportada por algo que Flask nunca renderizaría"""
+    ruta = os.path.join(instantaneas._INSTANTANEA_ACTUAL, f'tutorial/{tutorial_id}.html')
+    for sufijo in ('', '.gz', '.br'):
+        if os.path.exists(ruta + sufijo):
+            os.unlink(ruta + sufijo)
+    with open(ruta, 'w', encoding='utf-8') as f:
+        f.write('<p>desde la instantánea</p>')
+
+
+@pytest.fixture
+def servir(monkeypatch):
+    monkeypatch.setattr(instantaneas, 'SERVIR_INSTANTANEAS', True)
+    monkeypatch.setitem(instantaneas._instantaneas, 'version', None)
+
+
+def test_sirve_la_instantanea_de_esta_version(cliente, crear_tutorial, servir):
+    tutorial_id, _ = crear_tutorial()
+    resumen = instantaneas.exportar_instantaneas()
+    _marcar(tutorial_id)
+
+    respuesta = cliente.get(f'/tutorial/{tutorial_id}')
+
+    assert resumen['version'] == instantaneas._version_instantaneas()
+    assert respuesta.status_code == 200
+    assert respuesta.get_data(as_text=True) == '<p>desde la instantánea</p>'
+
+
+def test_instantanea_de_otro_despliegue_no_se_sirve(cliente, crear_tutorial, servir, monkeypatch):
+    tutorial_id, _ = crear_tutorial()
+    instantaneas.exportar_instantaneas()
+    _marcar(tutorial_id)
+    # Código nuevo con otras plantillas: la versión exportada ya no es la suya
+    monkeypatch.setitem(instantaneas._instantaneas, 'version', 'otra')
+
+    respuesta = cliente.get(f'/tutorial/{tutorial_id}')
+
+    assert respuesta.status_code == 200
+    assert 'desde la instantánea' not in respuesta.get_data(as_text=True)
@@ -0,0 +1,80 @@
+"""Límites de peticiones: cubos de fichas por cliente y globales, y el 429 de las rutas"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from codeverse import limites
+
+
+class Reloj:
+    """time.monotonic() controlado por la prueba"""
+
+    def __init__(self):
+        self.ahora = 1000.0
+
+    def __call__(self):
+        return self.ahora
+
+
+@pytest.fixture
+def reloj(monkeypatch):
+    reloj = Reloj()
+    monkeypatch.setattr(limites, 'time', SimpleNamespace(monotonic=reloj))
+    return reloj
+
+
+def test_rafaga_y_despues_espera(reloj):
+    regla = {'cliente': (2, 3)}
+
+    assert [limites._tomar_ficha('GET /rafaga', 'ana', regla) for _ in range(3)] == [(None, None)] * 3
+    espera, motivo = limites._tomar_ficha('GET /rafaga', 'ana', regla)
+
+    assert motivo == 'cliente'
+    assert espera == pytest.approx(0.5)
+
+
+def test_las_fichas_se_rellenan_con_el_tiempo(reloj):
+    regla = {'cliente': (2, 3)}
+    for _ in range(3):
+        limites._tomar_ficha('GET /relleno', 'ana', regla)
+
+    reloj.ahora += 0.5
+    assert limites._tomar_ficha('GET /relleno', 'ana', regla) == (None, None)
+    assert limites._tomar_ficha('GET /relleno', 'ana', regla)[1] == 'cliente'
+
+    reloj.ahora += 60  # Nunca por encima de la ráfaga
+    assert [limites._tomar_ficha('GET /relleno', 'ana', regla)[0] for _ in range(4)] == [None] * 3 + [0.5]
+
+
+def test_cubo_por_cliente_y_global(reloj):
+    regla = {'cliente': (1, 2), 'global': (1, 3)}
+
+    assert limites._tomar_ficha('GET /global', 'ana', regla) == (None, None)
+    assert limites._tomar_ficha('GET /global', 'ana', regla) == (None, None)
+    assert limites._tomar_ficha('GET /global', 'ana', regla)[1] == 'cliente'
+    # El rechazo por cliente no gasta del global
+    assert limites._tomar_ficha('GET /global', 'bea', regla) == (None, None)
+    assert limites._tomar_ficha('GET /global', 'carla', regla)[1] == 'global'
+
+
+def test_ruta_limitada_responde_429(cliente, monkeypatch):
+    monkeypatch.setattr(limites, 'LIMITES_ACTIVOS', True)
+    monkeypatch.setitem(limites._limites, 'GET /api/tutoriales/buscar', {'cliente': (0.01, 1)})
+    url = '/api/tutoriales/buscar?q=algo'
+
+    assert cliente.get(url, environ_base={'REMOTE_ADDR': '10.0.0.1'}).status_code == 200
+    respuesta = cliente.get(url, environ_base={'REMOTE_ADDR': '10.0.0.1'})
+    otro = cliente.get(url, environ_base={'REMOTE_ADDR': '10.0.0.2'})
+
+    assert respuesta.status_code == 429
+    assert respuesta.headers['Retry-After'] == '100'
+    assert respuesta.get_json()['motivo'] == 'cliente'
+    assert otro.status_code == 200
+
+
+def test_cliente_detras_del_proxy(monkeypatch):
+    monkeypatch.setattr(limites, 'LIMITES_PROXIES', 1)
+    with limites.app.test_request_context(environ_base={'REMOTE_ADDR': '10.0.0.1'},
+                                          headers={'X-Forwarded-For': '203.0.113.7'}):
+        assert limites.cliente_peticion() == '203.0.113.7'
@@ -0,0 +1,53 @@
+"""Listados paginados: el cursor recorre el catálogo y uno manipulado da 400"""
+
+import base64
+import json
+
+import pytest
+
+from codeverse import listado
+
+
+def _cursor(valor, tutorial_id):
+    return base64.urlsafe_b64encode(json.dumps([valor, tutorial_id]).encode('utf-8')).decode('ascii')
+
+
+def test_el_cursor_recorre_todo_sin_repetir(cliente, crear_tutorial):
+    creados = {crear_tutorial(title=f'tapir {i}', language='cobol')[0] for i in range(5)}
+    vistos, cursor = [], None
+    while True:
+        url = '/api/tutoriales?language=cobol&limit=2' + (f'&cursor={cursor}' if cursor else '')
+        datos = cliente.get(url).get_json()
+        vistos += [t['_id'] for t in datos['data']]
+        cursor = datos['next_cursor']
+        if cursor is None:
+            break
+
+    assert sorted(vistos) == sorted(creados)
+
+
+@pytest.mark.parametrize('cursor', [
+    'no-es-base64!',
+    _cursor({'$ne': None}, 'x'),       # Operador de Mongo en el valor
+    _cursor('a', {'$gt': ''}),          # ... o en el id
+    _cursor(3, 'x'),
+    _cursor('a', 7),
+    _cursor(['a'], 'x'),
+])
+def test_cursor_manipulado_responde_400(cliente, cursor):
+    assert cliente.get(f'/api/tutoriales?cursor={cursor}').status_code == 400
+
+
+def test_cursor_de_recientes_necesita_una_fecha(cliente):
+    assert cliente.get(f"/api/tutoriales?sort=recientes&cursor={_cursor('ayer', 'x')}").status_code == 400
+    assert listado.parametros_listado({'sort': 'recientes', 'cursor': _cursor('2024-01-01T00:00:00', 'x')})['cursor'] \
+        == ('2024-01-01T00:00:00', 'x')
+
+
+def test_cursor_con_valor_nulo(cliente, crear_tutorial):
+    crear_tutorial(title='okapi', language='fortran')
+
+    respuesta = cliente.get(f"/api/tutoriales?language=fortran&cursor={_cursor(None, '')}")
+
+    assert respuesta.status_code == 200
+    assert [t['title'] for t in respuesta.get_json()['data']] == ['okapi']
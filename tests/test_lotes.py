@@ -0,0 +1,78 @@
+"""Lotes: el estado por operación y las lápidas salen de lo que Mongo aplicó de verdad"""
+
+from bson.objectid import ObjectId
+
+from codeverse import almacen, config, lotes, mongo
+
+
+def _en_mongo(coleccion, titulo):
+    tutorial_id = ObjectId()
+    coleccion.insert_one({'_id': tutorial_id, 'title': titulo, 'description': 'd', 'duration': '1',
+                          'content': '<p>x</p>', 'updatedAt': mongo.ahora_utc()})
+    almacen.guardar_tutorial_json(str(tutorial_id), {'title': titulo, 'content': '<p>x</p>'})
+    return str(tutorial_id)
+
+
+def _lapidas(coleccion):
+    return {l['tutorial_id'] for l in coleccion.database[config.TOMBSTONES_COLLECTION].find()}
+
+
+def test_lote_completo(mongo_simulado):
+    editado, borrado = _en_mongo(mongo_simulado, 'uno'), _en_mongo(mongo_simulado, 'dos')
+
+    resultados = lotes.aplicar_lote_tutoriales([
+        {'op': 'crear', 'datos': {'title': 'nuevo', 'description': 'd', 'duration': '1'}},
+        {'op': 'actualizar', 'id': editado, 'datos': {'title': 'uno bis'}},
+        {'op': 'eliminar', 'id': borrado},
+    ])
+
+    assert [r['mongodb'] for r in resultados] == [True, True, True]
+    assert mongo_simulado.find_one({'_id': ObjectId(editado)})['title'] == 'uno bis'
+    assert borrado in _lapidas(mongo_simulado)
+
+
+def test_tutorial_solo_local_no_cuenta_como_aplicado_en_mongo(mongo_simulado, crear_tutorial):
+    local, _ = crear_tutorial()  # Id de Mongo válido, pero Mongo no lo tiene
+    otro_local, _ = crear_tutorial()
+
+    resultados = lotes.aplicar_lote_tutoriales([
+        {'op': 'actualizar', 'id': local, 'datos': {'title': 'cambiado'}},
+        {'op': 'eliminar', 'id': otro_local},
+    ])
+
+    assert [(r['success'], r['mongodb']) for r in resultados] == [(True, False), (True, False)]
+    assert almacen.obtener_contenido(local)['title'] == 'cambiado'
+    assert almacen.obtener_contenido(otro_local) is None
+    assert otro_local not in _lapidas(mongo_simulado)
+
+
+def test_error_en_mongo_detiene_lo_que_sigue_sin_lapidas(mongo_simulado):
+    mongo_simulado.create_index('title', unique=True)
+    _en_mongo(mongo_simulado, 'ocupado')
+    editado, borrado = _en_mongo(mongo_simulado, 'libre'), _en_mongo(mongo_simulado, 'tres')
+
+    resultados = lotes.aplicar_lote_tutoriales([
+        {'op': 'actualizar', 'id': editado, 'datos': {'title': 'ocupado'}},  # Clave duplicada
+        {'op': 'eliminar', 'id': borrado},
+    ])
+
+    assert not resultados[0]['mongodb'] and 'aviso' in resultados[0]
+    assert resultados[1]['mongodb'] is False
+    assert resultados[1]['aviso'] == "No aplicada tras un error anterior"
+    assert mongo_simulado.find_one({'_id': ObjectId(borrado)}) is not None
+    assert borrado not in _lapidas(mongo_simulado)
+
+
+def test_edicion_de_un_documento_borrado_entretanto(mongo_simulado, monkeypatch):
+    editado = _en_mongo(mongo_simulado, 'se va')
+    bulk_write = mongo_simulado.bulk_write
+
+    def borrar_antes(peticiones, ordered):
+        mongo_simulado.delete_one({'_id': ObjectId(editado)})  # Otro cliente se adelanta
+        return bulk_write(peticiones, ordered=ordered)
+
+    monkeypatch.setattr(mongo_simulado, 'bulk_write', borrar_antes)
+    resultado, = lotes.aplicar_lote_tutoriales([{'op': 'actualizar', 'id': editado, 'datos': {'title': 'x'}}])
+
+    assert resultado['mongodb'] is False
+    assert resultado['aviso'] == "No encontrado en MongoDB"
@@ -0,0 +1,60 @@
+"""Respuestas condicionales: ETag por contenido, 304 y variantes comprimidas"""
+
+from codeverse import almacen, respuestas
+
+
+def test_etag_sale_del_contenido_y_no_de_la_fecha(crear_tutorial):
+    tutorial_id, datos = crear_tutorial()
+    antes = respuestas.version_tutorial(tutorial_id, 'api')
+
+    # Misma fecha (p. ej. dos guardados en el mismo segundo), otro contenido
+    almacen.guardar_tutorial_json(tutorial_id, {**datos, 'content': '<p>Otro</p>'})
+    despues = respuestas.version_tutorial(tutorial_id, 'api')
+
+    assert despues[0] != antes[0]
+    assert despues[1] == antes[1]
+
+
+def test_etag_distinto_por_representacion(crear_tutorial):
+    tutorial_id, _ = crear_tutorial()
+
+    assert respuestas.version_tutorial(tutorial_id, 'api')[0] != \
+        respuestas.version_tutorial(tutorial_id, 'pagina')[0]
+    assert respuestas.version_tutorial('no-existe', 'api') is None
+
+
+def test_304_con_if_none_match(cliente, crear_tutorial):
+    tutorial_id, datos = crear_tutorial()
+    url = f'/api/tutorial/{tutorial_id}/contenido'
+    primera = cliente.get(url)
+
+    condicional = cliente.get(url, headers={'If-None-Match': primera.headers['ETag']})
+
+    assert primera.status_code == 200
+    assert condicional.status_code == 304
+    assert condicional.data == b''
+    assert condicional.headers['ETag'] == primera.headers['ETag']
+
+    almacen.guardar_tutorial_json(tutorial_id, {**datos, 'content': '<p>Cambiado</p>'})
+    assert cliente.get(url, headers={'If-None-Match': primera.headers['ETag']}).status_code == 200
+
+
+def test_304_con_if_modified_since(cliente, crear_tutorial):
+    tutorial_id, _ = crear_tutorial()
+    url = f'/tutorial/{tutorial_id}'
+    ultima = cliente.get(url).headers['Last-Modified']
+
+    assert cliente.get(url, headers={'If-Modified-Since': ultima}).status_code == 304
+    assert cliente.get(url, headers={'If-Modified-Since': 'Mon, 01 Jan 2001 00:00:00 GMT'}).status_code == 200
+
+
+def test_etag_de_la_variante_comprimida_tambien_vale(cliente, crear_tutorial):
+    tutorial_id, _ = crear_tutorial(content='<p>Texto que comprimir.</p>\n' * 200)
+    url = f'/api/tutorial/{tutorial_id}/contenido'
+
+    comprimida = cliente.get(url, headers={'Accept-Encoding': 'gzip'})
+    assert comprimida.headers['Content-Encoding'] == 'gzip'
+    assert comprimida.headers['ETag'].endswith('-gzip"')
+
+    # Un cliente que deja de aceptar gzip sigue teniendo una copia válida
+    assert cliente.get(url, headers={'If-None-Match': comprimida.headers['ETag']}).status_code == 304
@@ -0,0 +1,90 @@
+"""Historial de revisiones: deltas que reconstruyen el tutorial y revisión base del original"""
+
+import json
+import os
+
+import pytest
+
+from codeverse import almacen, revisiones
+
+PARRAFOS = ''.join(f"<p>Párrafo {i} con algo de texto para que el delta salga a cuenta.</p>\n"
+                   for i in range(40))
+
+
+@pytest.mark.parametrize('antes, despues', [
+    ('<p>a</p>\n<p>b</p>\n', '<p>a</p>\n<p>nuevo</p>\n<p>b</p>\n'),
+    ('<h2>Uno</h2><p>x</p><h2>Dos</h2>', '<h2>Dos</h2>'),
+    ('', '<p>desde cero</p>'),
+    ('<p>todo fuera</p>', ''),
+    ('<p>ñandú ✨</p>\n', '<p>ñandú ✨ y más</p>\n'),
+])
+def test_delta_reconstruye_el_tutorial(antes, despues):
+    previo = {'title': 'Uno', 'level': 'avanzado', 'content': antes, 'lastUpdated': '1'}
+    nuevo = {'title': 'Dos', 'content': despues, 'lastUpdated': '2'}
+
+    delta = revisiones._delta(previo, nuevo)
+    # Como queda en disco: JSON comprimido
+    delta = json.loads(revisiones.zlib.decompress(revisiones._empaquetar(delta)))
+
+    assert revisiones._aplicar_delta(previo, delta) == nuevo
+
+
+def test_delta_copia_lo_que_no_cambia():
+    previo = {'content': PARRAFOS}
+    nuevo = {'content': PARRAFOS.replace('Párrafo 20 ', 'Párrafo veinte ')}
+
+    delta = revisiones._delta(previo, nuevo)
+
+    copiado = sum(op[1] - op[0] for op in delta['ops'] if isinstance(op, list))
+    texto_nuevo = sum(len(op) for op in delta['ops'] if isinstance(op, str))
+    assert copiado > len(PARRAFOS) - 100
+    assert texto_nuevo < 100
+
+
+def test_primer_guardado_conserva_el_original(crear_tutorial):
+    tutorial_id, original = crear_tutorial(content=PARRAFOS)
+    # Tutorial de antes del historial: existe en el almacén pero sin revisiones
+    os.unlink(revisiones._ruta_revisiones(tutorial_id))
+    editado = {**original, 'content': PARRAFOS + '<p>Final</p>\n', 'lastUpdated': '2024-02-01T00:00:00'}
+
+    almacen.guardar_tutorial_json(tutorial_id, editado)
+
+    assert [r['tipo'] for r in revisiones.listar_revisiones(tutorial_id)] == ['completa', 'delta']
+    assert revisiones.obtener_revision(tutorial_id, 1)[1] == original
+    assert revisiones.obtener_revision(tutorial_id, 2)[1] == editado
+
+
+def test_completa_cada_n_revisiones(crear_tutorial, monkeypatch):
+    monkeypatch.setattr(revisiones, 'REVISIONES_COMPLETA_CADA', 3)
+    tutorial_id, datos = crear_tutorial(content=PARRAFOS)
+    versiones = [datos]
+    for i in range(4):
+        datos = {**datos, 'content': datos['content'] + f"<p>Añadido {i}</p>\n"}
+        almacen.guardar_tutorial_json(tutorial_id, datos)
+        versiones.append(datos)
+
+    tipos = [r['tipo'] for r in revisiones.listar_revisiones(tutorial_id)]
+    assert tipos == ['completa', 'delta', 'delta', 'completa', 'delta']
+    for numero, esperado in enumerate(versiones, 1):
+        assert revisiones.obtener_revision(tutorial_id, numero)[1] == esperado
+
+
+def test_solo_lastupdated_no_es_una_revision(crear_tutorial):
+    tutorial_id, datos = crear_tutorial()
+
+    almacen.guardar_tutorial_json(tutorial_id, {**datos, 'lastUpdated': '2030-01-01T00:00:00'})
+
+    assert len(revisiones.listar_revisiones(tutorial_id)) == 1
+
+
+def test_registro_a_medias_se_descarta(crear_tutorial):
+    tutorial_id, datos = crear_tutorial(content=PARRAFOS)
+    with open(revisiones._ruta_revisiones(tutorial_id), 'ab') as f:
+        f.write(b'\x02\x00\x00\x00\x01cabecera cortada')  # El proceso murió escribiendo
+
+    assert len(revisiones.listar_revisiones(tutorial_id)) == 1
+    editado = {**datos, 'content': PARRAFOS + '<p>Después</p>\n'}
+    almacen.guardar_tutorial_json(tutorial_id, editado)
+
+    assert len(revisiones.listar_revisiones(tutorial_id)) == 2
+    assert revisiones.obtener_revision(tutorial_id, 2)[1] == editado
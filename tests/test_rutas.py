@@ -0,0 +1,20 @@
+"""Rutas de estado: /api/health y /api/metrics"""
+
+
+def test_health_sin_mongo(cliente):
+    datos = cliente.get('/api/health').get_json()
+
+    assert (datos['status'], datos['database'], datos['fallback']) == ('degraded', 'disconnected', 'using JSON')
+    assert 'cache' in datos and 'escrituras' in datos
+
+
+def test_health_con_mongo(cliente, mongo_simulado):
+    datos = cliente.get('/api/health').get_json()
+
+    assert (datos['status'], datos['database']) == ('healthy', 'connected')
+    assert 'fallback' not in datos
+    assert datos['mongodb']['breaker'] == 'cerrado'
+
+
+def test_metricas_mongo_conectado(cliente, mongo_simulado):
+    assert 'codeverse_mongo_conectado 1' in cliente.get('/api/metrics').get_data(as_text=True)
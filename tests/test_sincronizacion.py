@@ -0,0 +1,122 @@
+"""Sincronización MongoDB → almacén: completa, incremental, lápidas y guardados pendientes"""
+
+import threading
+import time
+
+import pytest
+from bson.objectid import ObjectId
+
+from codeverse import almacen, config, escrituras, mongo, sincronizacion
+
+
+def _documento(tutorial_id, **campos):
+    return {
+        '_id': ObjectId(tutorial_id),
+        'title': 'Desde Mongo',
+        'description': 'Descripción',
+        'language': 'python',
+        'level': 'principiante',
+        'duration': '5 min',
+        'content': '<p>Mongo</p>',
+        'updatedAt': mongo.ahora_utc(),
+        **campos
+    }
+
+
+def test_sin_mongo_no_sincroniza():
+    assert sincronizacion.sincronizar_al_arrancar() is None
+
+
+def test_completa_trae_mongo_y_quita_lo_que_sobra(mongo_simulado, crear_tutorial):
+    sobrante, _ = crear_tutorial()
+    tutorial_id = str(ObjectId())
+    mongo_simulado.insert_one(_documento(tutorial_id))
+
+    resumen, compartido = sincronizacion.sincronizar_una_vez(completo=True)
+
+    assert resumen['modo'] == 'completo' and not compartido
+    assert almacen.obtener_contenido(tutorial_id)['content'] == '<p>Mongo</p>'
+    assert almacen.obtener_contenido(sobrante) is None
+
+
+def test_incremental_aplica_cambios_y_lapidas(mongo_simulado):
+    editado, borrado = str(ObjectId()), str(ObjectId())
+    mongo_simulado.insert_many([_documento(editado), _documento(borrado)])
+    sincronizacion.sincronizar_una_vez(completo=True)
+
+    mongo_simulado.update_one({'_id': ObjectId(editado)},
+                              {'$set': {'content': '<p>Editado</p>', 'updatedAt': mongo.ahora_utc()}})
+    mongo_simulado.delete_one({'_id': ObjectId(borrado)})
+    mongo_simulado.database[config.TOMBSTONES_COLLECTION].insert_one(
+        {'tutorial_id': borrado, 'deletedAt': mongo.ahora_utc()})
+    resumen, _ = sincronizacion.sincronizar_una_vez()
+
+    assert resumen['modo'] == 'incremental'
+    assert resumen['eliminados'] == 1
+    assert almacen.obtener_contenido(editado)['content'] == '<p>Editado</p>'
+    assert almacen.obtener_contenido(borrado) is None
+
+
+def test_no_pisa_un_guardado_pendiente(mongo_simulado, crear_tutorial):
+    tutorial_id, datos = crear_tutorial()
+    mongo_simulado.insert_one(_documento(tutorial_id, content='<p>Viejo en Mongo</p>'))
+
+    escrituras.encolar_guardado(tutorial_id, {**datos, 'content': '<p>Local</p>'}, {'content': '<p>Local</p>'})
+    sincronizacion.sincronizar_una_vez(completo=True)
+
+    assert almacen.obtener_contenido(tutorial_id)['content'] == datos['content']
+    escrituras.vaciar_escrituras()
+    assert almacen.obtener_contenido(tutorial_id)['content'] == '<p>Local</p>'
+    assert mongo_simulado.find_one({'_id': ObjectId(tutorial_id)})['content'] == '<p>Local</p>'
+
+
+@pytest.mark.skipif(sincronizacion.fcntl is None, reason="sin flock no hay exclusión entre workers")
+def test_otra_en_curso_comparte_su_resultado(mongo_simulado, cliente):
+    resumen = {'modo': 'incremental', 'revisados': 7, 'actualizados': 2, 'eliminados': 0}
+    respuestas = []
+    with open(sincronizacion._SYNC_LOCK_FILE, 'a') as lock:
+        sincronizacion.fcntl.flock(lock, sincronizacion.fcntl.LOCK_EX)  # Otro worker sincronizando
+        hilo = threading.Thread(target=lambda: respuestas.append(cliente.post('/api/sincronizar-json')))
+        hilo.start()
+        time.sleep(0.3)
+        assert hilo.is_alive()  # Espera en vez de rechazar
+
+        sincronizacion._escribir_atomico(sincronizacion._SYNC_RESULTADO, {
+            'completo': False, 'terminada': time.time(), 'resumen': resumen
+        })
+    hilo.join(5)
+
+    assert respuestas[0].status_code == 200
+    assert respuestas[0].get_json()['compartido'] is True
+    assert respuestas[0].get_json()['resumen'] == resumen
+
+
+@pytest.mark.skipif(sincronizacion.fcntl is None, reason="sin flock no hay exclusión entre workers")
+def test_espera_agotada_responde_429(mongo_simulado, cliente, monkeypatch):
+    monkeypatch.setattr(sincronizacion, 'SYNC_ESPERA_MAX', 0.2)
+    with open(sincronizacion._SYNC_LOCK_FILE, 'a') as lock:
+        sincronizacion.fcntl.flock(lock, sincronizacion.fcntl.LOCK_EX)
+
+        respuesta = cliente.post('/api/sincronizar-json')
+
+    assert respuesta.status_code == 429
+    assert respuesta.headers['Retry-After'] == str(sincronizacion.SYNC_REINTENTO)
+
+
+def test_etag_cambia_tras_sincronizar(mongo_simulado, cliente):
+    tutorial_id = str(ObjectId())
+    mongo_simulado.insert_one(_documento(tutorial_id))
+    sincronizacion.sincronizar_una_vez()
+    url = f'/api/tutorial/{tutorial_id}/contenido'
+    etag = cliente.get(url).headers['ETag']
+
+    assert cliente.get(url, headers={'If-None-Match': etag}).status_code == 304
+
+    mongo_simulado.update_one({'_id': ObjectId(tutorial_id)},
+                              {'$set': {'content': '<p>Nuevo</p>', 'updatedAt': mongo.ahora_utc()}})
+    sincronizacion.sincronizar_una_vez()
+    respuesta = cliente.get(url, headers={'If-None-Match': etag})
+
+    assert respuesta.status_code == 200
+    assert respuesta.headers['ETag'] != etag
+    assert respuesta.get_json()['data']['content'] == '<p>Nuevo</p>'
@@ -0,0 +1,34 @@
+"""Formulario de TikTok: los avisos flash llegan a la página"""
+
+from codeverse import limites
+
+
+def test_error_del_formulario_se_muestra(cliente):
+    respuesta = cliente.post('/tiktok-download', data={}, follow_redirects=True)
+
+    assert respuesta.status_code == 200
+    assert 'No se proporcionó una URL de TikTok' in respuesta.get_data(as_text=True)
+    assert respuesta.headers['Cache-Control'] == 'no-store'
+    # Ya mostrado: la siguiente visita vuelve a la página compartida
+    assert 'No se proporcionó' not in cliente.get('/tiktok').get_data(as_text=True)
+
+
+def test_429_del_formulario_se_muestra(cliente, monkeypatch):
+    monkeypatch.setattr(limites, 'LIMITES_ACTIVOS', True)
+    monkeypatch.setitem(limites._limites, 'POST /tiktok-download',
+                        {**limites._limites['POST /tiktok-download'], 'cliente': (0.01, 0)})
+
+    respuesta = cliente.post('/tiktok-download', data={'url': 'https://www.tiktok.com/@a/video/1'})
+
+    assert respuesta.status_code == 429
+    assert 'Hay demasiadas peticiones' in respuesta.get_data(as_text=True)
+
+
+def test_paginas_compartidas_sin_mensajes_ni_sesion(cliente):
+    with cliente.session_transaction() as sesion:
+        sesion['_flashes'] = [('error', 'solo para mí')]
+
+    respuesta = cliente.get('/snippets')
+
+    assert 'solo para mí' not in respuesta.get_data(as_text=True)
+    assert 'Cookie' not in respuesta.headers.get('Vary', '')